@@ -4,18 +4,34 @@ import os
 import subprocess
 import glob
 import json
+import re
+import math
+from array import array
 import calendar
-from dataclasses import dataclass, field, field
+import contextlib
+import bisect
+import functools
+from operator import attrgetter, itemgetter
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple, NamedTuple
 
-from PySide6.QtCore import Qt, QTimer, QStandardPaths, QUrl, QCoreApplication
-from PySide6.QtGui import QDesktopServices
+try:
+    import orjson  # γρηγορότερο (C) encode/decode για τα JSON αρχεία
+except ImportError:
+    orjson = None
+
+from PySide6.QtCore import (
+    Qt, QTimer, QStandardPaths, QUrl, QCoreApplication,
+    QObject, Signal, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex, QSignalBlocker,
+)
+from PySide6.QtGui import QDesktopServices, QStandardItem
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QSpinBox, QDoubleSpinBox,
-    QPushButton, QTableWidget, QTableWidgetItem,
+    QPushButton, QTableWidget, QTableWidgetItem, QTableView,
     QMessageBox, QAbstractItemView, QHeaderView, QGroupBox,
     QDialog, QStackedWidget, QComboBox, QTabWidget,
     QFormLayout, QScrollArea, QFrame,
@@ -76,42 +92,182 @@ def open_data_folder_in_finder():
         QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
 
 
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def safe_read_json(path: str) -> Optional[Dict[str, Any]]:
+    # να μη διαβάσουμε αρχείο που έχει ακόμα write στην ουρά
+    flush_pending_writes()
     try:
         if not os.path.exists(path):
             return None
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
     except Exception:
         return None
 
 
-def safe_write_json(path: str, data: Dict[str, Any]) -> bool:
+# path -> (hash των bytes, mtime) του τελευταίου write, για να μη ξαναγράφουμε ίδιο περιεχόμενο.
+# mtime None = το write είναι ακόμα στην ουρά.
+_last_written: Dict[str, tuple] = {}
+
+# path -> αύξων αριθμός του νεότερου background write στην ουρά: παλαιότερα writes
+# του ίδιου αρχείου που δεν έχουν ξεκινήσει παραλείπονται (μένει μόνο το τελευταίο snapshot)
+_queued_gen: Dict[str, int] = {}
+
+
+class _WriteNotifier(QObject):
+    # path αρχείου που απέτυχε να γραφτεί (έρχεται queued στο GUI thread)
+    failed = Signal(str)
+
+
+_write_pool: Optional[QThreadPool] = None
+_write_notifier: Optional[_WriteNotifier] = None
+
+
+def write_notifier() -> _WriteNotifier:
+    global _write_notifier
+    if _write_notifier is None:
+        _write_notifier = _WriteNotifier()
+    return _write_notifier
+
+
+def _json_write_pool() -> QThreadPool:
+    # ένα μόνο worker thread -> τα writes γίνονται με τη σειρά που μπήκαν
+    global _write_pool
+    if _write_pool is None:
+        write_notifier()  # να φτιαχτεί στο GUI thread
+        _write_pool = QThreadPool()
+        _write_pool.setMaxThreadCount(1)
+    return _write_pool
+
+
+def flush_pending_writes():
+    if _write_pool is not None:
+        _write_pool.waitForDone()
+
+
+def _encode_json(data: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    # Encode ολόκληρο στη μνήμη και ένα μόνο write (όχι ένα write ανά κλειδί/στοιχείο)
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    return json.dumps(data, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+
+
+def _unchanged_since_last_write(path: str, h: int) -> bool:
+    prev = _last_written.get(path)
+    if prev is None or prev[0] != h:
+        return False
+    if prev[1] is None:
+        return True
+    try:
+        return os.stat(path).st_mtime_ns == prev[1]
+    except OSError:
+        return False
+
+
+def _is_latest_write(path: str, gen: Optional[int]) -> bool:
+    # gen None = σύγχρονο write (η ουρά έχει αδειάσει)· αλλιώς μόνο το νεότερο background write του path
+    return gen is None or _queued_gen.get(path) == gen
+
+
+def _write_bytes_atomic(path: str, buf: bytes, h: int, gen: Optional[int] = None) -> bool:
+    # gen: αριθμός του background write (None = σύγχρονο write, μετά από flush της ουράς).
+    # Το (hash, mtime) γράφεται μόνο αν αυτό είναι ακόμα το νεότερο write του path· αλλιώς μένει
+    # το pending marker του νεότερου, ώστε ένα save ίδιο με αυτό το (παλιό) snapshot να μη θεωρηθεί "ίδιο".
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
         tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(buf)
         os.replace(tmp, path)
+        # ξανά έλεγχος μετά το write: όσο έτρεχε μπορεί να μπήκε νεότερο στην ουρά
+        if _is_latest_write(path, gen):
+            _last_written[path] = (h, os.stat(path).st_mtime_ns)
         return True
+    except Exception:
+        if _is_latest_write(path, gen):
+            _last_written.pop(path, None)
+        return False
+
+
+class _WriteRunnable(QRunnable):
+    def __init__(self, path: str, buf: bytes, h: int, gen: int):
+        super().__init__()
+        self.path = path
+        self.buf = buf
+        self.h = h
+        self.gen = gen
+
+    def run(self):
+        if not _is_latest_write(self.path, self.gen):
+            return  # υπάρχει νεότερο write για το ίδιο αρχείο πίσω στην ουρά
+        # το gen περνάει και στο write: αν ξεπεραστεί ενώ τρέχει, δεν πειράζει το _last_written
+        if not _write_bytes_atomic(self.path, self.buf, self.h, self.gen):
+            write_notifier().failed.emit(self.path)
+
+
+def safe_write_json(path: str, data: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None,
+                    background: bool = False) -> bool:
+    # default: μετατροπή για αντικείμενα που δεν είναι JSON (π.χ. dataclasses) κατά το encode
+    # background: το encode γίνεται εδώ (συνεπές snapshot), μόνο το I/O πάει στο worker thread.
+    #             Επιστρέφει True όταν μπει στην ουρά, αποτυχίες έρχονται από write_notifier().failed
+    try:
+        buf = _encode_json(data, default)
     except Exception:
         return False
+    h = hash(buf)
+    if _unchanged_since_last_write(path, h):
+        return True  # τίποτα δεν άλλαξε από το τελευταίο save
+    if background:
+        _last_written[path] = (h, None)
+        gen = _queued_gen[path] = _queued_gen.get(path, 0) + 1
+        _json_write_pool().start(_WriteRunnable(path, buf, h, gen))
+        return True
+    flush_pending_writes()
+    return _write_bytes_atomic(path, buf, h)
 
 
 # -----------------------------
 # Core logic (Πρατήριο / Τόκοι)
 # -----------------------------
 
+# Οι ίδιες ημερομηνίες επαναλαμβάνονται πολύ (load / edits) -> cache αντί για strptime κάθε φορά
+_iso_to_date = functools.lru_cache(maxsize=8192)(date.fromisoformat)
+
+
+# dd/mm/yy, dd-mm-yyyy κλπ: διαλέγουμε το format με regex αντί για try/except σε κάθε strptime
+_DMY_RE = re.compile(r"\d{1,2}([/-])\d{1,2}\1(\d+)")
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date(s: str) -> date:
     s = s.strip()
-    formats = [
-        "%Y-%m-%d",
-        "%d/%m/%Y",
-        "%d/%m/%y",
-        "%d-%m-%Y",
-        "%d-%m-%y",
-    ]
-    for fmt in formats:
+    # fast path: μόνο YYYY-MM-DD (C υλοποίηση, ~20x γρηγορότερο από strptime)·
+    # το fromisoformat δέχεται και week dates (2024-W01-1), γι' αυτό: μήνας s[5:7] ψηφία και s[7] == "-"
+    if len(s) == 10 and s[4] == "-" and s[7] == "-" and s[5:7].isdigit():
+        try:
+            return _iso_to_date(s)
+        except ValueError:
+            pass
+    fmt = None
+    m = _DMY_RE.fullmatch(s)
+    if m:
+        sep, year = m.group(1), m.group(2)
+        if len(year) == 4:
+            fmt = f"%d{sep}%m{sep}%Y"
+        elif len(year) == 2:
+            fmt = f"%d{sep}%m{sep}%y"
+    elif "-" in s:
+        fmt = "%Y-%m-%d"
+    if fmt is not None:
         try:
             return datetime.strptime(s, fmt).date()
         except ValueError:
@@ -119,6 +275,7 @@ def parse_date(s: str) -> date:
     raise ValueError("Μη έγκυρη ημερομηνία. Δεκτές μορφές: 2025-02-12 ή 12/02/2025 ή 12/2/25")
 
 
+@functools.lru_cache(maxsize=4096)
 def add_months(d: date, months: int) -> date:
     y = d.year + (d.month - 1 + months) // 12
     m = (d.month - 1 + months) % 12 + 1
@@ -131,11 +288,33 @@ def pct_to_rate(pct: float) -> float:
     return pct / 100.0
 
 
+# Ένα regex για τις συνηθισμένες μορφές: 1.200,50 | 1,200.50 | 1200,5 | 1200
+_AMT_RE = re.compile(
+    r"([+-]?)(?:"
+    r"(\d{1,3}(?:\.\d{3})+),(\d*)"      # 1.234.567,89
+    r"|(\d{1,3}(?:,\d{3})+)\.(\d*)"     # 1,234,567.89
+    r"|(\d*)(?:[.,](\d*))?"             # 1234,5 / 1234.5 / 1234
+    r")"
+)
+
+
 def parse_amount_eur(s: str) -> float:
     s = s.strip()
     if not s:
         raise ValueError("Κενό ποσό")
 
+    m = _AMT_RE.fullmatch(s)
+    if m:
+        sign, eu_int, eu_dec, us_int, us_dec, plain_int, plain_dec = m.groups()
+        if eu_int is not None:
+            return float(f"{sign}{eu_int.replace('.', '')}.{eu_dec}")
+        if us_int is not None:
+            return float(f"{sign}{us_int.replace(',', '')}.{us_dec}")
+        if plain_dec is not None:
+            return float(f"{sign}{plain_int}.{plain_dec}")
+        return float(f"{sign}{plain_int}")
+
+    # υπόλοιπες μορφές (π.χ. 12.34,5 ή 1e3): όπως πριν
     if "," in s and "." in s:
         if s.rfind(",") > s.rfind("."):
             s = s.replace(".", "").replace(",", ".")
@@ -147,19 +326,31 @@ def parse_amount_eur(s: str) -> float:
     return float(s)
 
 
+# swap "," <-> "." σε ένα πέρασμα (1,234.56 -> 1.234,56)
+_EUR_TRANS = str.maketrans({",": ".", ".": ","})
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_eur_cached(x: float) -> str:
+    # ίδια ποσά (διόδια, προμήθειες, σύνολα) επαναλαμβάνονται σε πολλές γραμμές/refresh
+    return f"{x:,.2f}".translate(_EUR_TRANS) + " €"
+
+
 def fmt_eur(x: float) -> str:
-    s = f"{x:,.2f}"
-    s = s.replace(",", "X").replace(".", ",").replace("X", ".")
-    return s + " €"
+    # -0.0 == 0.0 (ίδιο key στο cache): πάντα "0,00 €", ανεξάρτητα από το ποιο μπήκε πρώτο
+    return _fmt_eur_cached(0.0 if x == 0 else x)
 
 
+@functools.lru_cache(maxsize=8192)
 def fmt_date(d: Optional[date]) -> str:
+    # οι ίδιες ημερομηνίες ξαναζωγραφίζονται σε κάθε refresh -> cache, f-string αντί για strftime
     if d is None:
         return ""
-    return d.strftime("%d/%m/%Y")
+    return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
 
 
-@dataclass
+# slots όπως στα Truck/Trip/... : χωρίς __dict__ ανά εγγραφή (μη προσθέτεις δυναμικά attributes)
+@dataclass(slots=True)
 class Customer:
     cid: int
     name: str
@@ -168,7 +359,7 @@ class Customer:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Invoice:
     invoice_no: str
     amount: float
@@ -177,10 +368,18 @@ class Invoice:
     paid_date: Optional[date] = None
     annual_rate: Optional[float] = None  # π.χ. 0.06
     customer_id: Optional[int] = None
+    # issue_date + credit_months, υπολογίζεται μία φορά στη δημιουργία (όχι σε κάθε refresh).
+    # Οι αλλαγές τιμολογίου φτιάχνουν νέο Invoice, οπότε μένει πάντα σωστό.
+    due_date: date = field(init=False, repr=False, compare=False)
+    # runtime id από το StationModel (δεν αποθηκεύεται)· μένει ίδιο όταν αλλάζει η θέση στη λίστα
+    iid: int = field(default=0, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.due_date = add_months(self.issue_date, self.credit_months)
 
 
 def calc_interest(inv: Invoice, default_rate: float, as_of: date):
-    due_date = add_months(inv.issue_date, inv.credit_months)
+    due_date = inv.due_date
     end_date = inv.paid_date or as_of
 
     delay_days = (end_date - due_date).days
@@ -192,6 +391,46 @@ def calc_interest(inv: Invoice, default_rate: float, as_of: date):
     return due_date, end_date, delay_days, rate, interest
 
 
+def _interest_kernel(amounts: List[float], due_ords: List[int], end_ords: List[int], rates: List[float]):
+    """Καθαρά αριθμητικό κομμάτι του τόκου πάνω σε flat λίστες (χωρίς date αντικείμενα)."""
+    days = [e - d if e > d else 0 for d, e in zip(due_ords, end_ords)]
+    return days, [a * r * (n / 365.0) for a, r, n in zip(amounts, rates, days)]
+
+
+def invoice_columns(invoices: List[Invoice]) -> Dict[str, Any]:
+    """Στήλες (SoA) με ό,τι χρειάζεται ο μαζικός υπολογισμός τόκων, σε συνεχόμενα arrays.
+    Δεν εξαρτάται από as_of / default επιτόκιο, οπότε κρατιέται cached μέχρι να αλλάξουν τα τιμολόγια."""
+    due_dates = [inv.due_date for inv in invoices]
+    nan = math.nan
+    return {
+        "due_date": due_dates,
+        "amount": array("d", [inv.amount for inv in invoices]),
+        "due_ord": array("l", [d.toordinal() for d in due_dates]),
+        # 0 = απλήρωτο (τέλος = as_of)
+        "paid_ord": array("l", [inv.paid_date.toordinal() if inv.paid_date else 0 for inv in invoices]),
+        # NaN = χωρίς δικό του επιτόκιο (default)
+        "rate": array("d", [inv.annual_rate if inv.annual_rate is not None else nan for inv in invoices]),
+    }
+
+
+def calc_interest_all(invoices: List[Invoice], default_rate: float, as_of: date,
+                      cols: Optional[Dict[str, Any]] = None):
+    """Ίδιο αποτέλεσμα με calc_interest για κάθε τιμολόγιο, σε ένα πέρασμα
+    (ordinals αντί για timedelta, locals αντί για global lookups)."""
+    if cols is None:
+        cols = invoice_columns(invoices)
+    as_of_ord = as_of.toordinal()
+    rates = [default_rate if r != r else r for r in cols["rate"]]
+    days, interest = _interest_kernel(
+        cols["amount"],
+        cols["due_ord"],
+        [p or as_of_ord for p in cols["paid_ord"]],
+        rates,
+    )
+    end_dates = [inv.paid_date or as_of for inv in invoices]
+    return list(zip(cols["due_date"], end_dates, days, rates, interest))
+
+
 # -----------------------------
 # Model (shared station data)
 # -----------------------------
@@ -209,12 +448,23 @@ class StationModel:
         self.invoices: List[Invoice] = []
         self.customers: List[Customer] = []
         self.next_customer_id: int = 1
+        # normalized invoice_no -> iid των τιμολογίων (O(1) έλεγχος διπλότυπου, χωρίς θέσεις που μετακινούνται)
+        self._invoice_no_index: Dict[str, List[int]] = {}
+        self._next_iid: int = 1
+        self._customer_by_cid: Dict[int, Customer] = {}
+        # customer_id -> πλήθος τιμολογίων (για τον έλεγχο διαγραφής πελάτη)
+        self._invoice_count_by_cid: Dict[int, int] = {}
+        # cached invoice_columns(self.invoices), None = ξαναχτίζεται στο επόμενο invoice_columns()
+        self._invoice_cols: Optional[Dict[str, Any]] = None
 
         self.default_rate_pct: float = 6.0
         self.default_credit_months: int = 5
         self.as_of: str = date.today().strftime("%Y-%m-%d")
 
         self._save_timer: Optional[QTimer] = None
+        # άλλαξε κάτι από το τελευταίο save; (αλλιώς το save_now δεν γράφει τίποτα)
+        self._dirty: bool = False
+        write_notifier().failed.connect(self._on_write_failed)
 
     def attach_autosave_timer(self, owner_widget: QWidget, save_now_cb: Callable[[], None]):
         t = QTimer(owner_widget)
@@ -222,23 +472,44 @@ class StationModel:
         t.timeout.connect(save_now_cb)
         self._save_timer = t
 
-    def schedule_save(self, ms: int = 300):
+    def mark_dirty(self):
+        self._dirty = True
+
+    def schedule_save(self, ms: int = 500):
+        self.mark_dirty()
         if self._save_timer is None:
             return
         self._save_timer.start(ms)
 
-    def save_now(self):
+    def save_now(self, background: bool = False):
+        if not self._dirty:
+            return  # τίποτα δεν άλλαξε από το τελευταίο save
         data = {
             "settings": {
                 "default_rate_pct": float(self.default_rate_pct),
                 "default_credit_months": int(self.default_credit_months),
                 "as_of": str(self.as_of).strip(),
             },
-            "customers": [self.customer_to_dict(c) for c in self.customers],
+            # τα dataclasses γίνονται dict ένα-ένα μέσα στον encoder (όχι ολόκληρα list-of-dicts αντίγραφα)
+            "customers": self.customers,
             "next_customer_id": int(self.next_customer_id),
-            "invoices": [self.invoice_to_dict(inv) for inv in self.invoices],
+            "invoices": self.invoices,
         }
-        safe_write_json(self.path, data)
+        if safe_write_json(self.path, data, default=self._json_default, background=background):
+            self._dirty = False
+
+    def _on_write_failed(self, path: str):
+        # background write απέτυχε -> ξαναγράφεται στο επόμενο save
+        if path == self.path:
+            self._dirty = True
+
+    @classmethod
+    def _json_default(cls, o: Any) -> Any:
+        if isinstance(o, Invoice):
+            return cls.invoice_to_dict(o)
+        if isinstance(o, Customer):
+            return cls.customer_to_dict(o)
+        raise TypeError(f"Not JSON serializable: {type(o).__name__}")
 
     def load(self):
         data = safe_read_json(self.path)
@@ -274,6 +545,7 @@ class StationModel:
             c = self.dict_to_customer(obj)
             if c is not None and c.name:
                 self.customers.append(c)
+        self._customer_by_cid = {c.cid: c for c in self.customers}
 
         if self.customers:
             try:
@@ -288,6 +560,7 @@ class StationModel:
             if inv is not None:
                 loaded.append(inv)
         self.invoices = loaded
+        self._rebuild_invoice_index()
 
     @staticmethod
     def invoice_to_dict(inv: Invoice) -> Dict[str, Any]:
@@ -306,11 +579,11 @@ class StationModel:
         try:
             invoice_no = str(obj.get("invoice_no", "")).strip()
             amount = float(obj["amount"])
-            issue_date = date.fromisoformat(obj["issue_date"])
+            issue_date = _iso_to_date(obj["issue_date"])
             credit_months = int(obj.get("credit_months", 0))
             paid_date = obj.get("paid_date")
             if paid_date:
-                paid_date = date.fromisoformat(paid_date)
+                paid_date = _iso_to_date(paid_date)
             else:
                 paid_date = None
             annual_rate = obj.get("annual_rate")
@@ -345,16 +618,99 @@ class StationModel:
         # normalize για "2026-001" == " 2026-001 "
         return (s or "").strip()
 
-    def invoice_no_exists(self, invoice_no: str, exclude_index: Optional[int] = None) -> bool:
+    def _rebuild_invoice_index(self):
+        idx: Dict[str, List[int]] = {}
+        counts: Dict[int, int] = {}
+        for inv in self.invoices:
+            inv.iid = self._new_iid()
+            n = self.normalize_invoice_no(inv.invoice_no)
+            if n:
+                idx.setdefault(n, []).append(inv.iid)
+            if inv.customer_id is not None:
+                counts[inv.customer_id] = counts.get(inv.customer_id, 0) + 1
+        self._invoice_no_index = idx
+        self._invoice_count_by_cid = counts
+        self._invoice_cols = None
+
+    def _new_iid(self) -> int:
+        iid = self._next_iid
+        self._next_iid += 1
+        return iid
+
+    def _unindex_invoice_no(self, n: str, iid: int):
+        iids = self._invoice_no_index.get(n)
+        if iids is None:
+            return
+        if iid in iids:
+            iids.remove(iid)
+        if not iids:
+            del self._invoice_no_index[n]
+
+    def invoice_columns(self) -> Dict[str, Any]:
+        if self._invoice_cols is None:
+            self._invoice_cols = invoice_columns(self.invoices)
+        return self._invoice_cols
+
+    def _count_customer_invoice(self, cid: Optional[int], delta: int):
+        if cid is None:
+            return
+        n = self._invoice_count_by_cid.get(cid, 0) + delta
+        if n > 0:
+            self._invoice_count_by_cid[cid] = n
+        else:
+            self._invoice_count_by_cid.pop(cid, None)
+
+    def invoice_no_exists(self, invoice_no: str, exclude_iid: Optional[int] = None) -> bool:
         n = self.normalize_invoice_no(invoice_no)
         if not n:
             return False
-        for i, inv in enumerate(self.invoices):
-            if exclude_index is not None and i == exclude_index:
-                continue
-            if self.normalize_invoice_no(inv.invoice_no) == n:
-                return True
-        return False
+        iids = self._invoice_no_index.get(n)
+        if not iids:
+            return False
+        return any(i != exclude_iid for i in iids)
+
+    # -----------------------------
+    # Invoices add / update / delete (κρατάνε το index συγχρονισμένο)
+    # -----------------------------
+
+    def add_invoice(self, inv: Invoice):
+        inv.iid = self._new_iid()
+        self.invoices.append(inv)
+        self._dirty = True
+        self._invoice_cols = None
+        self._count_customer_invoice(inv.customer_id, 1)
+        n = self.normalize_invoice_no(inv.invoice_no)
+        if n:
+            self._invoice_no_index.setdefault(n, []).append(inv.iid)
+
+    def update_invoice(self, row: int, inv: Invoice):
+        old = self.invoices[row]
+        old_n = self.normalize_invoice_no(old.invoice_no)
+        # το νέο αντικείμενο παίρνει τη θέση και το iid του παλιού
+        inv.iid = old.iid
+        self.invoices[row] = inv
+        self._dirty = True
+        self._invoice_cols = None
+        if old.customer_id != inv.customer_id:
+            self._count_customer_invoice(old.customer_id, -1)
+            self._count_customer_invoice(inv.customer_id, 1)
+        n = self.normalize_invoice_no(inv.invoice_no)
+        if n == old_n:
+            return
+        if old_n:
+            self._unindex_invoice_no(old_n, inv.iid)
+        if n:
+            self._invoice_no_index.setdefault(n, []).append(inv.iid)
+
+    def delete_invoice(self, row: int):
+        inv = self.invoices.pop(row)
+        self._dirty = True
+        self._invoice_cols = None
+        self._count_customer_invoice(inv.customer_id, -1)
+        n = self.normalize_invoice_no(inv.invoice_no)
+        if n:
+            # το index κρατά iid, όχι θέσεις -> τίποτα άλλο δεν μετακινείται
+            self._unindex_invoice_no(n, inv.iid)
 
     # -----------------------------
     # Customers helpers
@@ -380,10 +736,8 @@ class StationModel:
     def customer_name(self, cid: Optional[int]) -> str:
         if cid is None:
             return "-"
-        for c in self.customers:
-            if c.cid == cid:
-                return c.name
-        return "(άγνωστος)"
+        c = self._customer_by_cid.get(cid)
+        return c.name if c is not None else "(άγνωστος)"
 
     def add_customer(self, name: str, afm: str = "", phone: str = "", notes: str = "") -> Customer:
         c = Customer(
@@ -394,11 +748,18 @@ class StationModel:
             notes=notes.strip(),
         )
         self.customers.append(c)
+        self._customer_by_cid[c.cid] = c
+        self._dirty = True
         self.next_customer_id += 1
         return c
 
+    def delete_customer(self, row: int):
+        c = self.customers.pop(row)
+        self._customer_by_cid.pop(c.cid, None)
+        self._dirty = True
+
     def has_invoices_for_customer(self, cid: int) -> bool:
-        return any(inv.customer_id == cid for inv in self.invoices)
+        return self._invoice_count_by_cid.get(cid, 0) > 0
 
 
 # -----------------------------
@@ -427,6 +788,210 @@ def style_action_buttons(*buttons: QPushButton):
             set_button_role(btn, "secondary")
 
 
+def make_debouncer(owner: QObject, ms: int, cb: Callable[[], None]) -> QTimer:
+    """Single-shot timer: πολλά .start() μέσα σε ms -> ένα μόνο cb (π.χ. πληκτρολόγηση)."""
+    t = QTimer(owner)
+    t.setSingleShot(True)
+    t.setInterval(ms)
+    t.timeout.connect(cb)
+    return t
+
+
+ALIGN_CENTER = Qt.AlignCenter
+ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+
+
+class RowsTableModel(QAbstractTableModel):
+    """
+    Read-only model πάνω σε λίστα αντικειμένων (τιμολόγια, πελάτες, οδηγοί...).
+    columns: [(τίτλος, getter(obj, row) -> str, alignment ή None), ...]
+    Τα κείμενα υπολογίζονται μόνο για τις γραμμές που ζωγραφίζονται (και κρατιούνται μέχρι το set_rows).
+    """
+    def __init__(self, columns: List[tuple], parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._columns = columns
+        # alignment ανά στήλη, έτοιμο για το TextAlignmentRole (δεν αλλάζει ανά κελί)
+        self._align = tuple(c[2] for c in columns)
+        self._rows: List[Any] = []
+        self._text: Dict[int, List[str]] = {}
+
+    def set_rows(self, rows: List[Any]):
+        if not rows and not self._rows:
+            return  # άδειο -> άδειο: χωρίς reset (π.χ. ιστορικό χωρίς επιλεγμένο οδηγό)
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._text = {}
+        self.endResetModel()
+
+    def row_obj(self, row: int) -> Any:
+        return self._rows[row]
+
+    def find_row(self, obj: Any) -> int:
+        for i, o in enumerate(self._rows):
+            if o is obj:
+                return i
+        return -1
+
+    # στοχευμένες αλλαγές μίας γραμμής (χωρίς reset όλου του πίνακα)
+
+    def append_row(self, obj: Any):
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(obj)
+        self.endInsertRows()
+
+    def insert_row(self, row: int, obj: Any):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, obj)
+        # οι επόμενες γραμμές άλλαξαν θέση (και αριθμό "#")
+        self._text = {r: t for r, t in self._text.items() if r < row}
+        self.endInsertRows()
+
+    def insert_sorted(self, obj: Any, key: Callable[[Any], Any]) -> int:
+        # οι γραμμές πρέπει να είναι ήδη ταξινομημένες κατά key
+        row = bisect.bisect_right(self._rows, key(obj), key=key)
+        self.insert_row(row, obj)
+        return row
+
+    def update_row(self, row: int, obj: Any = None):
+        if obj is not None:
+            self._rows[row] = obj
+        self._text.pop(row, None)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._columns) - 1))
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        # οι επόμενες γραμμές άλλαξαν θέση (και αριθμό "#")
+        self._text = {r: t for r, t in self._text.items() if r < row}
+        self.endRemoveRows()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section][0]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            r = index.row()
+            texts = self._text.get(r)
+            if texts is None:
+                obj = self._rows[r]
+                texts = [getter(obj, r) for _, getter, _ in self._columns]
+                self._text[r] = texts
+            return texts[index.column()]
+        if role == Qt.TextAlignmentRole:
+            return self._align[index.column()]
+        return None
+
+
+def make_rows_table(columns: List[tuple]) -> tuple:
+    view = QTableView()
+    model = RowsTableModel(columns, view)
+    view.setModel(model)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setAlternatingRowColors(True)
+    return view, model
+
+
+# πόσες γραμμές μετράει το resizeColumnsToContents (default του Qt: 1000)
+RESIZE_SAMPLE_ROWS = 200
+
+
+def resize_columns_once(view: QTableView):
+    # resizeColumnsToContents περνάει από όλες τις στήλες/γραμμές -> μόνο την πρώτη φορά που έχει δεδομένα,
+    # και με δείγμα γραμμών (οι στήλες μένουν Interactive, ο χρήστης τις αλλάζει με το χέρι)
+    if view.property("cols_sized") or view.model().rowCount() == 0:
+        return
+    view.horizontalHeader().setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
+    view.verticalHeader().setResizeContentsPrecision(RESIZE_SAMPLE_ROWS)
+    view.resizeColumnsToContents()
+    view.setProperty("cols_sized", True)
+
+
+@contextlib.contextmanager
+def table_bulk_fill(table: QTableWidget, rows: int):
+    # μαζικό γέμισμα QTableWidget: χωρίς repaint/sort ανά item, με προκαθορισμένο rowCount (όχι insertRow ανά γραμμή).
+    # Οι υπάρχουσες γραμμές μένουν: τα items τους ξαναχρησιμοποιούνται μέσω set_cell_text.
+    # Τα itemChanged/cellChanged του widget μπλοκάρονται (ένα ανά setText)· το model ενημερώνει κανονικά το view.
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    try:
+        with QSignalBlocker(table):
+            table.setRowCount(rows)
+            yield table
+    finally:
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+
+def set_cell_text(table: QTableWidget, row: int, col: int, text: str):
+    # νέο QTableWidgetItem μόνο αν το κελί είναι άδειο· αλλιώς setText (και μόνο αν άλλαξε)
+    item = table.item(row, col)
+    if item is None:
+        table.setItem(row, col, QTableWidgetItem(text))
+    elif item.text() != text:
+        item.setText(text)
+
+
+class DriverComboBox(QComboBox):
+    """
+    Combo οδηγών που ξαναγεμίζει μόνο όταν αλλάξει η λίστα.
+    drivers_fn: π.χ. model.active_drivers — επιστρέφει την ίδια (cached) λίστα μέχρι το drivers_changed(),
+    οπότε η ταυτότητά της αρκεί ως "dirty" flag.
+    """
+    def __init__(self, none_label: str, drivers_fn: Callable[[], List[Any]], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._drivers_fn = drivers_fn
+        self._src: Optional[List[Any]] = None
+        # did -> index γραμμής (χτίζεται στο sync), αντί για findData σε κάθε επιλογή
+        self._idx_by_did: Dict[Any, int] = {}
+        self.addItem(none_label, None)  # μία φορά, δεν ξαναφτιάχνεται στο sync
+
+    def sync(self):
+        drivers = self._drivers_fn()
+        if drivers is self._src:
+            return
+        current = self.currentData()
+        with QSignalBlocker(self):
+            # η γραμμή 0 ("— κανένας —") μένει· οι οδηγοί μπαίνουν με ένα appendRows αντί για addItem ανά οδηγό
+            model = self.model()
+            model.removeRows(1, model.rowCount() - 1)
+            items = []
+            idx_by_did: Dict[Any, int] = {}
+            for d in drivers:
+                it = QStandardItem(d.name)
+                it.setData(d.did, Qt.UserRole)
+                idx_by_did.setdefault(d.did, len(items) + 1)  # όπως το findData: η πρώτη γραμμή
+                items.append(it)
+            if items:
+                model.invisibleRootItem().appendRows(items)
+            self._idx_by_did = idx_by_did
+            self.setCurrentIndex(idx_by_did.get(current, 0) if current is not None else 0)
+        self._src = drivers
+
+    def select_did(self, did: Optional[int]) -> bool:
+        self.sync()
+        idx = self._idx_by_did.get(did, -1) if did is not None else -1
+        if idx >= 0:
+            self.setCurrentIndex(idx)
+        return idx >= 0
+
+    def showPopup(self):
+        self.sync()
+        super().showPopup()
+
+
 # -----------------------------
 # Start dialog (section)
 # -----------------------------
@@ -581,6 +1146,8 @@ def make_station_nav(on_go_entry: Callable[[], None],
     layout.addWidget(btn_customers)
     layout.addStretch(1)
 
+    # για αλλαγή σελίδας χωρίς να ξαναφτιάχνεται η μπάρα (μόνο setEnabled)
+    bar.nav_buttons = {"entry": btn_entry, "interest": btn_interest, "customers": btn_customers}
     return bar
 
 
@@ -604,8 +1171,6 @@ class StationWindow(QMainWindow):
         main = QVBoxLayout(root)
         main.setContentsMargins(14, 14, 14, 14)
         main.setSpacing(12)
-        main.setContentsMargins(14, 14, 14, 14)
-        main.setSpacing(12)
 
         main.addWidget(make_section_bar(self.controller, current="station"))
 
@@ -623,6 +1188,7 @@ class StationWindow(QMainWindow):
         tools_layout.addStretch(1)
         main.addWidget(tools)
 
+        self._data_changed_debounce = make_debouncer(self, 0, self._refresh_after_change)
         self.stack = QStackedWidget()
         self.entry_page = StationEntryPage(self.model, on_data_changed=self._on_data_changed)
         self.interest_page = StationInterestPage(self.model)
@@ -634,37 +1200,36 @@ class StationWindow(QMainWindow):
 
         self.model.attach_autosave_timer(self, self._save_now)
 
-        self.nav_holder = QWidget()
-        self.nav_layout = QVBoxLayout(self.nav_holder)
-        self.nav_layout.setContentsMargins(0, 0, 0, 0)
-        self.nav_layout.setSpacing(8)
+        # η μπάρα φτιάχνεται μία φορά, οι αλλαγές σελίδας κάνουν μόνο setEnabled στα κουμπιά
+        self.nav = make_station_nav(
+            on_go_entry=lambda: self._set_station_page("entry"),
+            on_go_interest=lambda: self._set_station_page("interest"),
+            on_go_customers=lambda: self._set_station_page("customers"),
+            current="entry"
+        )
 
         self._set_station_page("entry")
 
-        main.addWidget(self.nav_holder)
+        main.addWidget(self.nav)
         main.addWidget(self.stack, 1)
 
     def _save_now(self):
-        self.model.save_now()
+        # autosave: το γράψιμο στον δίσκο γίνεται εκτός GUI thread
+        self.model.save_now(background=True)
 
     def _on_data_changed(self):
-        self.interest_page.refresh()
+        # ένα refresh ανά event loop tick, και μόνο αν φαίνεται η σελίδα τόκων
+        # (το _set_station_page κάνει ούτως ή άλλως refresh όταν ανοίξει)
+        self._data_changed_debounce.start()
         self.model.schedule_save()
 
-    def _set_station_page(self, which: str):
-        for i in reversed(range(self.nav_layout.count())):
-            item = self.nav_layout.itemAt(i)
-            w = item.widget()
-            if w:
-                w.setParent(None)
+    def _refresh_after_change(self):
+        if self.stack.currentWidget() is self.interest_page:
+            self.interest_page.refresh()
 
-        nav = make_station_nav(
-            on_go_entry=lambda: self._set_station_page("entry"),
-            on_go_interest=lambda: self._set_station_page("interest"),
-            on_go_customers=lambda: self._set_station_page("customers"),
-            current=which
-        )
-        self.nav_layout.addWidget(nav)
+    def _set_station_page(self, which: str):
+        for name, btn in self.nav.nav_buttons.items():
+            btn.setEnabled(name != which)
 
         if which == "entry":
             self.stack.setCurrentIndex(0)
@@ -690,22 +1255,6 @@ class StationWindow(QMainWindow):
 # -----------------------------
 
 class StationEntryPage(QWidget):
-    def refresh(self):
-        """Early-defined safe refresh to avoid AttributeError during init.
-        It can be overwritten later in the class; if not, this no-op keeps startup stable.
-        """
-        try:
-            # If a later refresh was defined, it will override this method.
-            pass
-        except Exception:
-            pass
-
-    def _early_refresh(self):
-        try:
-            self.refresh()
-        except Exception:
-            pass
-
     def __init__(self, model: StationModel, on_data_changed: Callable[[], None]):
         super().__init__()
         self.model = model
@@ -735,6 +1284,8 @@ class StationEntryPage(QWidget):
         self.invoice_no_edit.setPlaceholderText("π.χ. 2026-00123")
 
         self.customer_combo = QComboBox()
+        # cids με τη σειρά των items του combo (None = "Χωρίς πελάτη"), None = δεν έχει γεμίσει ακόμα
+        self._combo_cids: Optional[List[Optional[int]]] = None
         self.customer_combo.setMinimumWidth(260)
 
         self.amount_edit = QLineEdit()
@@ -802,14 +1353,19 @@ class StationEntryPage(QWidget):
 
         main.addWidget(entry_box)
 
-        self.table = QTableWidget(0, 9)
-        self.table.setHorizontalHeaderLabels([
-            "#", "Αρ. Τιμ.", "Πελάτης", "Ποσό", "Έκδοση", "Πίστωση", "Πληρωμή", "Επιτόκιο τιμ.", "Κατάσταση"
+        cust = self.model.customer_name
+        self.table, self.table_model = make_rows_table([
+            ("#", lambda inv, r: str(r + 1), ALIGN_CENTER),
+            ("Αρ. Τιμ.", lambda inv, r: inv.invoice_no or "", None),
+            ("Πελάτης", lambda inv, r: cust(inv.customer_id), None),
+            ("Ποσό", lambda inv, r: fmt_eur(inv.amount), ALIGN_RIGHT),
+            ("Έκδοση", lambda inv, r: fmt_date(inv.issue_date), None),
+            ("Πίστωση", lambda inv, r: str(inv.credit_months), ALIGN_CENTER),
+            ("Πληρωμή", lambda inv, r: fmt_date(inv.paid_date), None),
+            ("Επιτόκιο τιμ.", lambda inv, r: f"{inv.annual_rate*100:.2f}%" if inv.annual_rate is not None else "-", None),
+            ("Κατάσταση", lambda inv, r: "ΠΛΗΡΩΜΕΝΟ" if inv.paid_date else "ΑΠΛΗΡΩΤΟ", ALIGN_RIGHT),
         ])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.setAlternatingRowColors(True)
-        self.table.itemSelectionChanged.connect(self._on_select_row)
+        self.table.selectionModel().selectionChanged.connect(lambda *_: self._on_select_row())
 
         main.addWidget(self.table, 1)
 
@@ -829,18 +1385,38 @@ class StationEntryPage(QWidget):
         self.use_override_btn.setText(f"Επιτόκιο τιμολογίου: {'ON' if checked else 'OFF'}")
 
     def _refresh_customers_combo(self):
-        current_cid = self.customer_combo.currentData()
-        self.customer_combo.blockSignals(True)
-        self.customer_combo.clear()
-        self.customer_combo.addItem("— Χωρίς πελάτη —", None)
-        for c in self.model.customers:
-            label = c.name if not c.afm else f"{c.name} (ΑΦΜ {c.afm})"
-            self.customer_combo.addItem(label, c.cid)
-        if current_cid is not None:
-            idx = self.customer_combo.findData(current_cid)
-            if idx >= 0:
-                self.customer_combo.setCurrentIndex(idx)
-        self.customer_combo.blockSignals(False)
+        combo = self.customer_combo
+        items = [(c.name if not c.afm else f"{c.name} (ΑΦΜ {c.afm})", c.cid) for c in self.model.customers]
+        current_cid = combo.currentData()
+        combo.blockSignals(True)
+        if self._combo_cids is None:
+            # πρώτη φορά: πλήρες γέμισμα
+            combo.clear()
+            combo.addItem("— Χωρίς πελάτη —", None)
+            for label, cid in items:
+                combo.addItem(label, cid)
+            self._combo_cids = [None] + [cid for _, cid in items]
+        else:
+            # incremental: αφαίρεση όσων διαγράφηκαν, insert νέων, setItemText σε μετονομασίες
+            cids = self._combo_cids
+            wanted = {cid for _, cid in items}
+            for i in range(len(cids) - 1, 0, -1):
+                if cids[i] not in wanted:
+                    combo.removeItem(i)
+                    del cids[i]
+            for pos, (label, cid) in enumerate(items, 1):
+                if pos < len(cids) and cids[pos] == cid:
+                    if combo.itemText(pos) != label:
+                        combo.setItemText(pos, label)
+                else:
+                    combo.insertItem(pos, label, cid)
+                    cids.insert(pos, cid)
+            for i in range(len(cids) - 1, len(items), -1):
+                combo.removeItem(i)
+                del cids[i]
+        idx = combo.findData(current_cid) if current_cid is not None else -1
+        combo.setCurrentIndex(idx if idx >= 0 else 0)
+        combo.blockSignals(False)
 
     def _message(self, title: str, text: str, icon=QMessageBox.Warning):
         m = QMessageBox(self)
@@ -885,9 +1461,9 @@ class StationEntryPage(QWidget):
         inv = self.model.invoices[row]
         self.invoice_no_edit.setText(inv.invoice_no or "")
         self.amount_edit.setText(str(inv.amount).replace(".", ","))
-        self.issue_edit.setText(inv.issue_date.strftime("%d/%m/%Y"))
+        self.issue_edit.setText(fmt_date(inv.issue_date))
         self.credit_spin.setValue(inv.credit_months)
-        self.paid_edit.setText(inv.paid_date.strftime("%d/%m/%Y") if inv.paid_date else "")
+        self.paid_edit.setText(fmt_date(inv.paid_date))
 
         cid = inv.customer_id
         idx_c = self.customer_combo.findData(cid)
@@ -925,10 +1501,10 @@ class StationEntryPage(QWidget):
                           f"Βάλε διαφορετικό αριθμό ή άφησέ το κενό.")
             return
 
-        self.model.invoices.append(inv)
+        self.model.add_invoice(inv)
         self.model.schedule_save()
         self.on_data_changed()
-        self.refresh()
+        self.table_model.append_row(inv)
         self.clear_fields()
 
     def update_selected(self):
@@ -944,16 +1520,16 @@ class StationEntryPage(QWidget):
             return
 
         # ΔΙΠΛΟΤΥΠΟ: exclude την ίδια γραμμή
-        if self.model.invoice_no_exists(inv.invoice_no, exclude_index=row):
+        if self.model.invoice_no_exists(inv.invoice_no, exclude_iid=self.model.invoices[row].iid):
             self._message("Διπλό τιμολόγιο",
                           f"Υπάρχει ήδη άλλη καταχώρηση με Αρ. Τιμολογίου: {inv.invoice_no}\n"
                           f"Βάλε διαφορετικό αριθμό ή άφησέ το κενό.")
             return
 
-        self.model.invoices[row] = inv
+        self.model.update_invoice(row, inv)
         self.model.schedule_save()
         self.on_data_changed()
-        self.refresh()
+        self.table_model.update_row(row, inv)
 
     def delete_selected(self):
         row = self._selected_row()
@@ -961,98 +1537,16 @@ class StationEntryPage(QWidget):
             self._message("Επιλογή", "Διάλεξε γραμμή από τον πίνακα.")
             return
 
-        del self.model.invoices[row]
+        self.model.delete_invoice(row)
         self.model.schedule_save()
         self.on_data_changed()
-        self.refresh()
+        self.table_model.remove_row(row)
         self.clear_fields()
 
-    def set_period(self, year: int, month: int):
-        self.period_year = year
-        self.period_month = int(month or 0)
-        self.refresh()
-
-    def _in_period(self, d: date) -> bool:
-        if self.period_year is None:
-            return True
-        if d.year != self.period_year:
-            return False
-        if self.period_month in (0, None):
-            return True
-        return d.month == self.period_month
-
-    
-    def _on_wear_changed(self, _val: float):
-        try:
-            self.model.wear_rate_per_km = float(self.sp_wear_default.value())
-        except Exception:
-            self.model.wear_rate_per_km = 0.10
-        try:
-            self.model.schedule_save()
-        except Exception:
-            pass
-        try:
-            self.refresh()
-        except Exception:
-            pass
-
-    def refresh_driver_combo(self, prefer_truck_id: Optional[int] = None, prefer_driver_id: Optional[int] = None):
-        current = self.cb_driver.currentData() if hasattr(self, 'cb_driver') else None
-        self.cb_driver.blockSignals(True)
-        self.cb_driver.clear()
-        self.cb_driver.addItem('— Χωρίς οδηγό —', None)
-        for d in self.model.active_drivers():
-            self.cb_driver.addItem(d.name, d.did)
-        # Prefer main driver of selected truck
-        did = None
-        if prefer_driver_id is not None:
-            did = prefer_driver_id
-        elif prefer_truck_id is not None:
-            t = self.model.truck_by_id(prefer_truck_id)
-            did = getattr(t, 'main_driver_id', None) if t else None
-        if did is not None:
-            idx = self.cb_driver.findData(did)
-            if idx >= 0:
-                self.cb_driver.setCurrentIndex(idx)
-        self.cb_driver.blockSignals(False)
-def refresh(self):
+    def refresh(self):
         self._refresh_customers_combo()
-        self.table.setRowCount(0)
-
-        for idx, inv in enumerate(self.model.invoices, 1):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            status = "ΠΛΗΡΩΜΕΝΟ" if inv.paid_date else "ΑΠΛΗΡΩΤΟ"
-            rate_txt = f"{inv.annual_rate*100:.2f}%" if inv.annual_rate is not None else "-"
-
-            cust = self.model.customer_name(inv.customer_id)
-
-            values = [
-                str(idx),
-                inv.invoice_no or "",
-                cust,
-                fmt_eur(inv.amount),
-                fmt_date(inv.issue_date),
-                str(inv.credit_months),
-                fmt_date(inv.paid_date),
-                rate_txt,
-                status
-            ]
-
-            for col, v in enumerate(values):
-                item = QTableWidgetItem(v)
-                if col in (0, 5):
-                    item.setTextAlignment(Qt.AlignCenter)
-                if col in (3, 8):
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.table.setItem(row, col, item)
-
-        self.table.resizeColumnsToContents()
-        try:
-            self._hide_odometer_column_if_exists()
-        except Exception:
-            pass
+        self.table_model.set_rows(self.model.invoices)
+        resize_columns_once(self.table)
 
 
 # -----------------------------
@@ -1116,12 +1610,14 @@ class StationCustomersPage(QWidget):
 
         main.addWidget(form_box)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["#", "Όνομα", "ΑΦΜ", "Τηλέφωνο", "Σχόλια"])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.setAlternatingRowColors(True)
-        self.table.itemSelectionChanged.connect(self._on_select_row)
+        self.table, self.table_model = make_rows_table([
+            ("#", lambda c, r: str(r + 1), ALIGN_CENTER),
+            ("Όνομα", lambda c, r: c.name, None),
+            ("ΑΦΜ", lambda c, r: c.afm, None),
+            ("Τηλέφωνο", lambda c, r: c.phone, None),
+            ("Σχόλια", lambda c, r: c.notes, None),
+        ])
+        self.table.selectionModel().selectionChanged.connect(lambda *_: self._on_select_row())
 
         main.addWidget(self.table, 1)
 
@@ -1175,10 +1671,10 @@ class StationCustomersPage(QWidget):
             self._message("Λάθος πελάτη", str(e))
             return
 
-        self.model.add_customer(**d)
+        c = self.model.add_customer(**d)
         self.model.schedule_save()
         self.on_data_changed()
-        self.refresh()
+        self.table_model.append_row(c)
         self.clear_fields()
 
     def update_selected(self):
@@ -1200,7 +1696,7 @@ class StationCustomersPage(QWidget):
 
         self.model.schedule_save()
         self.on_data_changed()
-        self.refresh()
+        self.table_model.update_row(row)
 
     def delete_selected(self):
         row = self._selected_row()
@@ -1216,44 +1712,15 @@ class StationCustomersPage(QWidget):
             )
             return
 
-        del self.model.customers[row]
+        self.model.delete_customer(row)
         self.model.schedule_save()
         self.on_data_changed()
-        self.refresh()
+        self.table_model.remove_row(row)
         self.clear_fields()
 
     def refresh(self):
-        # fill drivers combo
-        current = self.cb_main_driver.currentData() if hasattr(self, 'cb_main_driver') else None
-        if hasattr(self, 'cb_main_driver'):
-            self.cb_main_driver.blockSignals(True)
-            self.cb_main_driver.clear()
-            self.cb_main_driver.addItem('— κανένας —', None)
-            for d in self.model.active_drivers():
-                self.cb_main_driver.addItem(d.name, d.did)
-            if current is not None:
-                idx = self.cb_main_driver.findData(current)
-                if idx >= 0:
-                    self.cb_main_driver.setCurrentIndex(idx)
-            self.cb_main_driver.blockSignals(False)
-        self.table.setRowCount(0)
-
-        for i, c in enumerate(self.model.customers, 1):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            values = [str(i), c.name, c.afm, c.phone, c.notes]
-            for col, v in enumerate(values):
-                item = QTableWidgetItem(v)
-                if col == 0:
-                    item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, col, item)
-
-        self.table.resizeColumnsToContents()
-        try:
-            self._hide_odometer_column_if_exists()
-        except Exception:
-            pass
+        self.table_model.set_rows(self.model.customers)
+        resize_columns_once(self.table)
 
 
 # -----------------------------
@@ -1294,13 +1761,21 @@ class StationInterestPage(QWidget):
 
         main.addWidget(settings_box)
 
-        self.table = QTableWidget(0, 11)
-        self.table.setHorizontalHeaderLabels([
-            "#", "Αρ. Τιμ.", "Πελάτης", "Ποσό", "Έκδοση", "Λήξη", "Μέχρι", "Ημέρες", "Επιτόκιο", "Τόκος", "Πληρώθηκε;"
+        # γραμμές: (inv, (due, end, days, rate, intr)) από calc_interest_all
+        cust = self.model.customer_name
+        self.table, self.table_model = make_rows_table([
+            ("#", lambda x, r: str(r + 1), ALIGN_CENTER),
+            ("Αρ. Τιμ.", lambda x, r: x[0].invoice_no or "", None),
+            ("Πελάτης", lambda x, r: cust(x[0].customer_id), None),
+            ("Ποσό", lambda x, r: fmt_eur(x[0].amount), ALIGN_RIGHT),
+            ("Έκδοση", lambda x, r: fmt_date(x[0].issue_date), None),
+            ("Λήξη", lambda x, r: fmt_date(x[1][0]), None),
+            ("Μέχρι", lambda x, r: fmt_date(x[1][1]), None),
+            ("Ημέρες", lambda x, r: str(x[1][2]), ALIGN_CENTER),
+            ("Επιτόκιο", lambda x, r: f"{x[1][3]*100:.2f}%", None),
+            ("Τόκος", lambda x, r: fmt_eur(x[1][4]), ALIGN_RIGHT),
+            ("Πληρώθηκε;", lambda x, r: "ΝΑΙ" if x[0].paid_date else "ΟΧΙ", None),
         ])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.setAlternatingRowColors(True)
 
         main.addWidget(self.table, 1)
 
@@ -1311,8 +1786,12 @@ class StationInterestPage(QWidget):
         bottom.addStretch(1)
         main.addLayout(bottom)
 
-        self.default_rate_pct.valueChanged.connect(self._settings_changed)
-        self.as_of_edit.textChanged.connect(self._settings_changed)
+        # πληκτρολόγηση "2026-02-06" -> ένας επανυπολογισμός + save, όχι δέκα
+        self._settings_debounce = make_debouncer(self, 250, self._on_settings_edited)
+        # (cols, as_of, default_rate, results, total) του τελευταίου υπολογισμού
+        self._last_calc: Optional[tuple] = None
+        self.default_rate_pct.valueChanged.connect(lambda *_: self._settings_debounce.start())
+        self.as_of_edit.textChanged.connect(lambda *_: self._settings_debounce.start())
 
     def _message(self, title: str, text: str, icon=QMessageBox.Warning):
         m = QMessageBox(self)
@@ -1322,15 +1801,28 @@ class StationInterestPage(QWidget):
         m.exec()
 
     def _settings_changed(self):
-        self.model.default_rate_pct = float(self.default_rate_pct.value())
-        self.model.as_of = self.as_of_edit.text().strip() or date.today().strftime("%Y-%m-%d")
+        rate_pct = float(self.default_rate_pct.value())
+        as_of = self.as_of_edit.text().strip() or date.today().strftime("%Y-%m-%d")
+        # το refresh περνάει από εδώ κάθε φορά -> save μόνο αν άλλαξε κάτι
+        if rate_pct == self.model.default_rate_pct and as_of == self.model.as_of:
+            return
+        self.model.default_rate_pct = rate_pct
+        self.model.as_of = as_of
         self.model.schedule_save()
 
+    def _on_settings_edited(self):
+        self._settings_changed()
+        try:
+            self._get_as_of()
+        except ValueError:
+            return  # μισογραμμένη ημερομηνία: μόνο save, χωρίς μήνυμα λάθους
+        self.refresh()
+
     def _get_as_of(self) -> date:
         s = self.as_of_edit.text().strip()
         if not s:
             return date.today()
-        return parse_date(s)
+        return parse_date(s)  # lru_cache: ίδιο κείμενο σε κάθε refresh -> cache hit
 
     def refresh(self):
         self._settings_changed()
@@ -1343,45 +1835,18 @@ class StationInterestPage(QWidget):
 
         default_rate = pct_to_rate(float(self.default_rate_pct.value()))
 
-        self.table.setRowCount(0)
-        total_interest = 0.0
-
-        for idx, inv in enumerate(self.model.invoices, 1):
-            due, end, days, rate, intr = calc_interest(inv, default_rate, as_of)
-            total_interest += intr
-
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            cust = self.model.customer_name(inv.customer_id)
-
-            values = [
-                str(idx),
-                inv.invoice_no or "",
-                cust,
-                fmt_eur(inv.amount),
-                fmt_date(inv.issue_date),
-                fmt_date(due),
-                fmt_date(end),
-                str(days),
-                f"{rate*100:.2f}%",
-                fmt_eur(intr),
-                "ΝΑΙ" if inv.paid_date else "ΟΧΙ",
-            ]
-
-            for col, v in enumerate(values):
-                item = QTableWidgetItem(v)
-                if col in (0, 7):
-                    item.setTextAlignment(Qt.AlignCenter)
-                if col in (3, 9):
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.table.setItem(row, col, item)
-
-        self.table.resizeColumnsToContents()
-        try:
-            self._hide_odometer_column_if_exists()
-        except Exception:
-            pass
+        invoices = self.model.invoices
+        cols = self.model.invoice_columns()
+        # ίδια τιμολόγια (ίδιο cols object), as_of και επιτόκιο -> ίδια αποτελέσματα, χωρίς ξαναυπολογισμό
+        last = self._last_calc
+        if last is not None and last[0] is cols and last[1] == as_of and last[2] == default_rate:
+            results, total_interest = last[3], last[4]
+        else:
+            results = calc_interest_all(invoices, default_rate, as_of, cols=cols)
+            total_interest = sum(map(itemgetter(4), results))  # C-level getter, όχι genexpr
+            self._last_calc = (cols, as_of, default_rate, results, total_interest)
+        self.table_model.set_rows(list(zip(invoices, results)))
+        resize_columns_once(self.table)
         self.total_label.setText(f"ΣΥΝΟΛΙΚΟΣ ΤΟΚΟΣ: {fmt_eur(total_interest)}")
 
 
@@ -1523,6 +1988,8 @@ class DriversPage(QWidget):
 
         self.period_year: Optional[int] = None
         self.period_month: int = 0
+        # γρήγορες διαδοχικές αλλαγές (update/μισθοδοσία/περίοδος) -> ένα refresh του ιστορικού
+        self._hist_debounce = make_debouncer(self, 30, self.refresh_history_and_metrics)
 
         root = QVBoxLayout(self)
         title = QLabel("Οδηγοί")
@@ -1540,13 +2007,21 @@ class DriversPage(QWidget):
         tab_details = QWidget()
         v = QVBoxLayout(tab_details)
 
-        self.table = QTableWidget(0, 9)
-        self.table.setHorizontalHeaderLabels(["ID", "Όνομα", "Τηλέφωνο", "Τρόπος", "€/Δρομ.", "Μισθός", "Ένσημο", "Ενεργός", "Σχόλια"])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table, self.table_model = make_rows_table([
+            ("ID", lambda d, r: str(d.did), None),
+            ("Όνομα", lambda d, r: d.name, None),
+            ("Τηλέφωνο", lambda d, r: d.phone, None),
+            ("Τρόπος", lambda d, r: "Ανά δρομ." if d.pay_mode == "per_trip" else "Μηνιαίος", None),
+            ("€/Δρομ.", lambda d, r: f"{d.pay_per_trip:.2f}", None),
+            ("Μισθός", lambda d, r: f"{d.salary:.2f}", None),
+            ("Ένσημο", lambda d, r: f"{d.stamp_cost:.2f}", None),
+            ("Ενεργός", lambda d, r: "Ναι" if d.active else "Όχι", None),
+            ("Σχόλια", lambda d, r: d.notes, None),
+        ])
+        self.table.setAlternatingRowColors(False)
         self.table.verticalHeader().setVisible(False)
         self.table.setColumnHidden(0, True)
-        self.table.cellClicked.connect(self.on_row_clicked)
+        self.table.clicked.connect(lambda idx: self.on_row_clicked(idx.row(), idx.column()))
         v.addWidget(self.table, 1)
 
         form = QGroupBox("Στοιχεία")
@@ -1617,10 +2092,17 @@ class DriversPage(QWidget):
         tab_hist = QWidget()
         hv = QVBoxLayout(tab_hist)
 
-        self.hist_table = QTableWidget(0, 7)
-        self.hist_table.setHorizontalHeaderLabels(["ID", "Ημ/νία", "Φορτηγό", "Από", "Προς", "Km", "Έσοδο"])
-        self.hist_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.hist_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # model πάνω στη λίστα trips: κείμενα μόνο για τις γραμμές που φαίνονται
+        self.hist_table, self.hist_model = make_rows_table([
+            ("ID", lambda tr, r: str(tr.trip_id), None),
+            ("Ημ/νία", lambda tr, r: fmt_date(tr.trip_date), None),
+            ("Φορτηγό", lambda tr, r: getattr(self.model.truck_by_id(tr.truck_id), "plate", ""), None),
+            ("Από", lambda tr, r: tr.origin, None),
+            ("Προς", lambda tr, r: tr.destination, None),
+            ("Km", lambda tr, r: str(tr.trip_km), None),
+            ("Έσοδο", lambda tr, r: f"{tr.revenue:.2f}", None),
+        ])
+        self.hist_table.setAlternatingRowColors(False)
         self.hist_table.verticalHeader().setVisible(False)
         self.hist_table.setColumnHidden(0, True)
         hv.addWidget(self.hist_table, 1)
@@ -1646,51 +2128,39 @@ class DriversPage(QWidget):
     def set_period(self, year: int, month: int):
         self.period_year = year
         self.period_month = int(month or 0)
-        self.refresh_history_and_metrics()
-
-    def _in_period(self, d: date) -> bool:
-        if self.period_year is None:
-            return True
-        if d.year != self.period_year:
-            return False
-        if self.period_month in (0, None):
-            return True
-        return d.month == self.period_month
+        self._hist_debounce.start()
 
     def refresh(self):
-        self.table.setRowCount(0)
-        for d in sorted(self.model.drivers, key=lambda x: x.did):
-            r = self.table.rowCount(); self.table.insertRow(r)
-            self.table.setItem(r, 0, QTableWidgetItem(str(d.did)))
-            self.table.setItem(r, 1, QTableWidgetItem(d.name))
-            self.table.setItem(r, 2, QTableWidgetItem(d.phone))
-            mode = str(getattr(d, "pay_mode", "monthly") or "monthly")
-            mode_label = "Ανά δρομ." if mode == "per_trip" else "Μηνιαίος"
-            self.table.setItem(r, 3, QTableWidgetItem(mode_label))
-            self.table.setItem(r, 4, QTableWidgetItem(f"{float(getattr(d,'pay_per_trip',0.0) or 0.0):.2f}"))
-            self.table.setItem(r, 5, QTableWidgetItem(f"{getattr(d,'salary',0.0):.2f}"))
-            self.table.setItem(r, 6, QTableWidgetItem(f"{getattr(d,'stamp_cost',0.0):.2f}"))
-            self.table.setItem(r, 7, QTableWidgetItem("Ναι" if d.active else "Όχι"))
-            self.table.setItem(r, 8, QTableWidgetItem(d.notes))
-        self.table.resizeColumnsToContents()
+        # το model κρατά τους οδηγούς ήδη ταξινομημένους κατά did
+        self.table_model.set_rows(self.model.drivers)
+        resize_columns_once(self.table)
+        self._hist_debounce.stop()
         self.refresh_history_and_metrics()
 
+    def _refresh_driver_row(self, d: 'Driver'):
+        row = self.table_model.find_row(d)
+        if row < 0:
+            self.refresh()
+            return
+        self.table_model.update_row(row)
+        self._hist_debounce.start()
+
     def on_row_clicked(self, row, col):
-        did = int(self.table.item(row, 0).text())
+        did = self.table_model.row_obj(row).did
         d = self.model.driver_by_id(did)
         if not d:
             return
         self.selected_did = did
         self.ed_name.setText(d.name)
         self.ed_phone.setText(d.phone)
-        mode = str(getattr(d, "pay_mode", "monthly") or "monthly")
-        self.cb_pay_mode.setCurrentIndex(1 if mode == "per_trip" else 0)
-        self.sp_per_trip.setValue(float(getattr(d, "pay_per_trip", 0.0) or 0.0))
-        self.sp_salary.setValue(float(getattr(d, "salary", 0.0) or 0.0))
-        self.sp_stamp.setValue(float(getattr(d, "stamp_cost", 0.0) or 0.0))
+        self.cb_pay_mode.setCurrentIndex(1 if d.pay_mode == "per_trip" else 0)
+        self.sp_per_trip.setValue(d.pay_per_trip)
+        self.sp_salary.setValue(d.salary)
+        self.sp_stamp.setValue(d.stamp_cost)
         self._update_pay_mode_ui()
         self.cb_active.setCurrentIndex(0 if d.active else 1)
         self.ed_notes.setText(d.notes)
+        self._hist_debounce.stop()
         self.refresh_history_and_metrics()
 
     def clear_form(self):
@@ -1705,7 +2175,7 @@ class DriversPage(QWidget):
         self.cb_active.setCurrentIndex(0)
         self.ed_notes.clear()
         self.lbl_salary_per_km.setText("Μισθός / km: —")
-        self.hist_table.setRowCount(0)
+        self.hist_model.set_rows([])
         self.lbl_hist_km.setText("Σύνολο km (περίοδος): 0")
         self.lbl_hist_salary_km.setText("Μισθός / km (περίοδος): —")
         self.table.clearSelection()
@@ -1734,9 +2204,10 @@ class DriversPage(QWidget):
             notes=self.ed_notes.text().strip(),
         )
         self.model.next_driver_id += 1
-        self.model.drivers.append(d)
+        self.model.add_driver(d)
         self.model.schedule_save()
-        self.refresh()
+        # στη θέση του κατά did (συνήθως το τέλος, αλλά το next_driver_id μπορεί να έχει πειραχτεί στο json)
+        self.table_model.insert_sorted(d, key=lambda x: x.did)
         self.clear_form()
 
     def update_driver(self):
@@ -1758,8 +2229,10 @@ class DriversPage(QWidget):
         d.stamp_cost = float(self.sp_stamp.value())
         d.active = (self.cb_active.currentIndex() == 0)
         d.notes = self.ed_notes.text().strip()
+        self.model.mark_entity_dirty(d)
+        self.model.drivers_changed()
         self.model.schedule_save()
-        self.refresh()
+        self._refresh_driver_row(d)
 
 
     def current_driver(self) -> Optional['Driver']:
@@ -1781,8 +2254,10 @@ class DriversPage(QWidget):
             return
         # refresh legacy fields display
         _sync_driver_legacy_from_history(d)
+        self.model.mark_entity_dirty(d)
+        self.model.drivers_changed()
         self.model.save()
-        self.refresh()
+        self._refresh_driver_row(d)
 
     def delete_driver(self):
         if self.selected_did is None:
@@ -1790,20 +2265,22 @@ class DriversPage(QWidget):
             return
         did = self.selected_did
         # Απαγόρευση διαγραφή αν υπάρχει συσχέτιση σε δρομολόγια
-        if any(getattr(tr, "driver_id", None) == did for tr in self.model.trips):
+        if self.model.driver_has_trips(did):
             QMessageBox.warning(self, "Απαγορεύεται", "Υπάρχουν δρομολόγια για αυτόν τον οδηγό.")
             return
-        self.model.drivers = [x for x in self.model.drivers if x.did != did]
+        d = self.model.driver_by_id(did)
+        self.model.remove_driver(did)
         self.model.schedule_save()
-        self.refresh()
+        row = self.table_model.find_row(d)
+        if row >= 0:
+            self.table_model.remove_row(row)
         self.clear_form()
 
     def refresh_history_and_metrics(self):
         # Υπολογισμός/Ιστορικό μόνο όταν έχει επιλεγεί οδηγός
         if self.selected_did is None:
-            if hasattr(self, 'lbl_salary_per_km'):
-                self.lbl_salary_per_km.setText("Μισθός / km: —")
-            self.hist_table.setRowCount(0)
+            self.lbl_salary_per_km.setText("Μισθός / km: —")
+            self.hist_model.set_rows([])
             self.lbl_hist_km.setText("Σύνολο km (περίοδος): 0")
             self.lbl_hist_salary_km.setText("Μισθός / km (περίοδος): —")
             return
@@ -1813,36 +2290,26 @@ class DriversPage(QWidget):
             return
 
         # trips οδηγού στην περίοδο
-        trips = [tr for tr in self.model.trips if getattr(tr, "driver_id", None) == self.selected_did and self._in_period(tr.trip_date)]
-        trips.sort(key=lambda tr: tr.trip_date, reverse=True)
+        p_lo, p_hi = period_ord_range(self.period_year, self.period_month)
+        trips = self.model.driver_trips_in_range(self.selected_did, p_lo, p_hi, newest_first=True)
 
         # γεμίζουμε ιστορικό
-        self.hist_table.setRowCount(0)
-        total_km = 0
-        for tr in trips:
-            total_km += int(getattr(tr, "trip_km", 0) or 0)
-            r = self.hist_table.rowCount(); self.hist_table.insertRow(r)
-            self.hist_table.setItem(r, 0, QTableWidgetItem(str(tr.trip_id)))
-            self.hist_table.setItem(r, 1, QTableWidgetItem(tr.trip_date.strftime("%d/%m/%Y")))
-            truck = self.model.truck_by_id(tr.truck_id)
-            self.hist_table.setItem(r, 2, QTableWidgetItem(truck.plate if truck else ""))
-            self.hist_table.setItem(r, 3, QTableWidgetItem(getattr(tr, "origin", "")))
-            self.hist_table.setItem(r, 4, QTableWidgetItem(getattr(tr, "destination", "")))
-            self.hist_table.setItem(r, 5, QTableWidgetItem(str(getattr(tr, "trip_km", 0) or 0)))
-            self.hist_table.setItem(r, 6, QTableWidgetItem(f"{float(getattr(tr, 'revenue', 0.0) or 0.0):.2f}"))
-        self.hist_table.resizeColumnsToContents()
+        total_km = sum(map(attrgetter("trip_km"), trips))
+        self.hist_model.set_rows(trips)
+        resize_columns_once(self.hist_table)
 
         self.lbl_hist_km.setText(f"Σύνολο km (περίοδος): {total_km}")
 
         # μισθός / km (μόνο μισθός, όχι ένσημο)
-        if total_km > 0 and float(getattr(d, "salary", 0.0) or 0.0) > 0:
-            val = float(getattr(d, "salary", 0.0) or 0.0) / float(total_km)
+        if total_km > 0 and d.salary > 0:
+            val = d.salary / total_km
             self.lbl_salary_per_km.setText(f"Μισθός / km: {val:.4f} €")
             self.lbl_hist_salary_km.setText(f"Μισθός / km (περίοδος): {val:.4f} €")
         else:
             self.lbl_salary_per_km.setText("Μισθός / km: —")
             self.lbl_hist_salary_km.setText("Μισθός / km (περίοδος): —")
-@dataclass
+# slots: χιλιάδες trips/fuels -> χωρίς __dict__ ανά εγγραφή (μη προσθέτεις δυναμικά attributes)
+@dataclass(slots=True)
 class Truck:
     tid: int
     plate: str
@@ -1852,7 +2319,7 @@ class Truck:
     fixed_monthly_expenses: float = 0.0  # €/μήνα
     wear_rate_per_km: float = 0.0  # €/χλμ (0=χρήση προεπιλογής)
     notes: str = ""
-@dataclass
+@dataclass(slots=True)
 class Trip:
     trip_id: int
     truck_id: int
@@ -1868,7 +2335,7 @@ class Trip:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelExpense:
     fuel_id: int
     truck_id: int
@@ -1881,7 +2348,7 @@ class FuelExpense:
     receipt: str = ""
     notes: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Driver:
     did: int
     name: str
@@ -1893,34 +2360,12 @@ class Driver:
     pay_history: list = field(default_factory=list)
     active: bool = True
     notes: str = ""
+    # (pay_history list, len, months, normalized records) — βλ. _normalized_pay_history (δεν αποθηκεύεται)
+    _pay_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
 
 
-def _ym_from_date(d: date) -> str:
-    return f"{d.year:04d}-{d.month:02d}"
-
-def _ym_today() -> str:
-    return _ym_from_date(date.today())
-
-def driver_pay_for_month(driver: 'Driver', ym: str):
-    hist = list(getattr(driver, "pay_history", []) or [])
-    if not hist:
-        return {
-            "pay_mode": getattr(driver, "pay_mode", "monthly"),
-            "salary": float(getattr(driver, "salary", 0.0) or 0.0),
-            "stamp_cost": float(getattr(driver, "stamp_cost", 0.0) or 0.0),
-            "pay_per_trip": float(getattr(driver, "pay_per_trip", 0.0) or 0.0),
-        }
-    hist = sorted([h for h in hist if "month" in h], key=lambda x: x["month"])
-    chosen = hist[0]
-    for h in hist:
-        if h["month"] <= ym:
-            chosen = h
-    return chosen
-
-
-
 def _ym_from_date(d: date) -> str:
     return f"{d.year:04d}-{d.month:02d}"
 
@@ -1930,17 +2375,22 @@ def _ym_from_year_month(year: int, month: int) -> str:
 def _ym_today() -> str:
     return _ym_from_date(date.today())
 
-def driver_pay_for_month(driver: 'Driver', ym: str) -> dict:
-    """Latest pay record with month <= ym (YYYY-MM). Falls back to legacy fields."""
-    hist = list(getattr(driver, "pay_history", []) or [])
-    if not hist:
-        return {
-            "month": "1900-01",
-            "pay_mode": str(getattr(driver, "pay_mode", "monthly") or "monthly"),
-            "salary": float(getattr(driver, "salary", 0.0) or 0.0),
-            "stamp_cost": float(getattr(driver, "stamp_cost", 0.0) or 0.0),
-            "pay_per_trip": float(getattr(driver, "pay_per_trip", 0.0) or 0.0),
-        }
+def _legacy_pay_snapshot(driver: 'Driver') -> dict:
+    return {
+        "month": "1900-01",
+        "pay_mode": str(getattr(driver, "pay_mode", "monthly") or "monthly"),
+        "salary": float(getattr(driver, "salary", 0.0) or 0.0),
+        "stamp_cost": float(getattr(driver, "stamp_cost", 0.0) or 0.0),
+        "pay_per_trip": float(getattr(driver, "pay_per_trip", 0.0) or 0.0),
+    }
+
+def _normalized_pay_history(driver: 'Driver', hist: list) -> tuple:
+    # Το cache ζει πάνω στον Driver. Ο έλεγχος "is"/len πιάνει μόνο αντικατάσταση της λίστας·
+    # όποιος αλλάζει το ιστορικό in-place πρέπει να μηδενίσει το driver._pay_cache
+    # (το κάνουν η set_driver_pay_for_month και η TrucksModel.drivers_changed).
+    hit = getattr(driver, "_pay_cache", None)
+    if hit is not None and hit[0] is hist and hit[1] == len(hist):
+        return hit[2], hit[3]
     norm = []
     for r in hist:
         if not isinstance(r, dict):
@@ -1955,22 +2405,54 @@ def driver_pay_for_month(driver: 'Driver', ym: str) -> dict:
             "stamp_cost": float(r.get("stamp_cost", 0.0) or 0.0),
             "pay_per_trip": float(r.get("pay_per_trip", 0.0) or 0.0),
         })
+    norm.sort(key=itemgetter("month"))
+    months = [r["month"] for r in norm]
+    driver._pay_cache = (hist, len(hist), months, norm)
+    return months, norm
+
+def driver_pay_for_month(driver: 'Driver', ym: str) -> dict:
+    """Latest pay record with month <= ym (YYYY-MM). Falls back to legacy fields.
+
+    Το dict που επιστρέφεται είναι κοινό (cache) -> μόνο για ανάγνωση.
+    """
+    hist = getattr(driver, "pay_history", None)
+    if not hist:
+        return _legacy_pay_snapshot(driver)
+    months, norm = _normalized_pay_history(driver, hist)
     if not norm:
-        return {
-            "month": "1900-01",
-            "pay_mode": str(getattr(driver, "pay_mode", "monthly") or "monthly"),
-            "salary": float(getattr(driver, "salary", 0.0) or 0.0),
-            "stamp_cost": float(getattr(driver, "stamp_cost", 0.0) or 0.0),
-            "pay_per_trip": float(getattr(driver, "pay_per_trip", 0.0) or 0.0),
-        }
-    norm.sort(key=lambda x: x["month"])
-    chosen = norm[0]
-    for r in norm:
-        if r["month"] <= ym:
-            chosen = r
-        else:
-            break
-    return chosen
+        return _legacy_pay_snapshot(driver)
+    i = bisect.bisect_right(months, ym) - 1
+    return norm[i] if i >= 0 else norm[0]
+
+def driver_pay_totals(driver: 'Driver', yms: List[str]) -> Tuple[float, float]:
+    """(ένσημα, μηνιαίοι μισθοί) του οδηγού για τους μήνες yms (αύξουσα σειρά, YYYY-MM).
+
+    Ίδιο αποτέλεσμα με driver_pay_for_month ανά μήνα: κάθε εγγραφή του ιστορικού ισχύει για ένα
+    συνεχές κομμάτι των yms (όρια με bisect), άρα μήνες × τιμή ανά εγγραφή αντί για loop ανά μήνα.
+    """
+    hist = getattr(driver, "pay_history", None)
+    norm = None
+    if hist:
+        months, norm = _normalized_pay_history(driver, hist)
+    if norm:
+        # η εγγραφή j ισχύει για months[j] <= ym < months[j+1]· η πρώτη και για ό,τι είναι πριν
+        snaps = norm
+        bounds = [bisect.bisect_left(yms, m) for m in months[1:]]
+        bounds.append(len(yms))
+    else:
+        snaps = [_legacy_pay_snapshot(driver)]
+        bounds = [len(yms)]
+    stamps = salary = 0.0
+    start = 0
+    for snap, end in zip(snaps, bounds):
+        n = end - start
+        start = end
+        if n <= 0:
+            continue
+        stamps += n * snap["stamp_cost"]
+        if snap["pay_mode"] == "monthly":
+            salary += n * snap["salary"]
+    return stamps, salary
 
 def _sync_driver_legacy_from_history(driver: 'Driver'):
     snap = driver_pay_for_month(driver, _ym_today())
@@ -1992,27 +2474,76 @@ def set_driver_pay_for_month(driver: 'Driver', ym: str, pay_mode: str, salary: f
     })
     hist.sort(key=lambda x: str(x.get("month","")))
     driver.pay_history = hist
+    driver._pay_cache = None
     _sync_driver_legacy_from_history(driver)
 
 
 
-def trucks_data_file() -> str:
-    # Προσπαθεί να βρει το σωστό trucks_data.json με προτεραιότητα:
-    # 1) δίπλα στο .py που τρέχεις
-    # 2) στον τρέχοντα φάκελο (cwd)
-    # 3) σε υποφακέλους βάθους 2 (π.χ. Downloads/ΤΟΚΟΙ)
-    # 4) fallback στο AppDataLocation
-    try:
-        script_dir = os.path.dirname(os.path.abspath(sys.argv[0] or __file__))
-    except Exception:
-        script_dir = None
+def _trucks_app_data_dir() -> str:
+    base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    if not base:
+        base = os.path.expanduser(f"~/Library/Application Support/{APP_NAME}")
+    os.makedirs(base, exist_ok=True)
+    return base
 
-    roots = []
-    if script_dir:
-        roots.append(script_dir)
-    try:
-        roots.append(os.getcwd())
-    except Exception:
+
+def _trucks_pointer_file() -> str:
+    # θυμάται ποιο JSON βρέθηκε με το ψάξιμο, ώστε το επόμενο άνοιγμα να μη ξανασαρώνει φακέλους
+    return os.path.join(_trucks_app_data_dir(), "trucks_data.pointer")
+
+
+_TRUCKS_JSON_KEYS = ("trucks", "trips", "fuels", "next_ids")
+
+
+@functools.lru_cache(maxsize=128)
+def _peek_trucks_json(path: str, mtime_ns: int, size: int) -> bool:
+    # (mtime, size) στο key: ίδιο αρχείο χωρίς αλλαγές δεν ξαναδιαβάζεται στην ίδια συνεδρία
+    if size > 100 * 1024 * 1024:
+        return False
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return False
+    # φτηνοί έλεγχοι πριν το πλήρες parse: JSON object + τα keys υπάρχουν ως bytes
+    if not raw[:4096].lstrip().startswith(b"{"):
+        return False
+    if not all(b'"%s"' % k.encode() in raw for k in _TRUCKS_JSON_KEYS):
+        return False
+    # parse των ίδιων bytes (όχι δεύτερο άνοιγμα/διάβασμα του αρχείου)
+    try:
+        obj = _json_loads(raw)
+    except Exception:
+        return False
+    return isinstance(obj, dict) and all(k in obj for k in _TRUCKS_JSON_KEYS)
+
+
+def _looks_like_trucks_json(path: str) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return _peek_trucks_json(path, st.st_mtime_ns, st.st_size)
+
+
+def trucks_data_file() -> str:
+    # Προσπαθεί να βρει το σωστό trucks_data.json με προτεραιότητα:
+    # 1) δίπλα στο .py που τρέχεις
+    # 2) στον τρέχοντα φάκελο (cwd)
+    # 3) το αρχείο που βρέθηκε την προηγούμενη φορά στο 4 (trucks_data.pointer)
+    # 4) σε υποφακέλους βάθους 2 (π.χ. Downloads/ΤΟΚΟΙ)
+    # 5) fallback στο AppDataLocation
+    try:
+        script_dir = os.path.dirname(os.path.abspath(sys.argv[0] or __file__))
+    except Exception:
+        script_dir = None
+
+    roots = []
+    if script_dir:
+        roots.append(script_dir)
+    try:
+        roots.append(os.getcwd())
+    except Exception:
         pass
 
     # 1) trucks_data.json με σωστό όνομα
@@ -2024,7 +2555,18 @@ def trucks_data_file() -> str:
         except Exception:
             pass
 
-    # 2) ψάξε για JSON που μοιάζει με trucks data (έχει trucks/trips/fuels/next_ids)
+    # 3) cached αποτέλεσμα προηγούμενου ψαξίματος
+    pointer = _trucks_pointer_file()
+    try:
+        with open(pointer, "r", encoding="utf-8") as f:
+            cand = f.read().strip()
+        # ξανά έλεγχος: το αρχείο μπορεί να σβήστηκε/μετακινήθηκε ή να άλλαξε περιεχόμενο -> ψάξιμο
+        if cand and _looks_like_trucks_json(cand):
+            return cand
+    except OSError:
+        pass
+
+    # 4) ψάξε για JSON που μοιάζει με trucks data (έχει trucks/trips/fuels/next_ids)
     try:
         patterns = []
         for root in roots:
@@ -2038,21 +2580,20 @@ def trucks_data_file() -> str:
         for pat in patterns:
             for cand in sorted(glob.glob(pat)):
                 try:
-                    obj = safe_read_json(cand)
-                    if not obj:
-                        continue
-                    if all(k in obj for k in ("trucks", "trips", "fuels", "next_ids")):
+                    if _looks_like_trucks_json(cand):
+                        cand = os.path.abspath(cand)
+                        try:
+                            with open(pointer, "w", encoding="utf-8") as f:
+                                f.write(cand)
+                        except OSError:
+                            pass
                         return cand
                 except Exception:
                     continue
     except Exception:
         pass
 
-    base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-    if not base:
-        base = os.path.expanduser(f"~/Library/Application Support/{APP_NAME}")
-    os.makedirs(base, exist_ok=True)
-    return os.path.join(base, "trucks_data.json")
+    return os.path.join(_trucks_app_data_dir(), "trucks_data.json")
 
 class TrucksModel:
     """Ανεξάρτητη αποθήκευση Φορτηγών σε ξεχωριστό JSON (trucks_data.json)."""
@@ -2068,6 +2609,34 @@ class TrucksModel:
 
         self.drivers: List[Driver] = []
         self.next_driver_id: int = 1
+        # cache του active_drivers(), None = ξαναχτίζεται (βλ. drivers_changed)
+        self._active_drivers_cache: Optional[List[Driver]] = None
+        self._per_trip_pay_cache: Optional[Dict[int, float]] = None
+        # tid/did -> αντικείμενο (O(1) truck_by_id / driver_by_id), συγχρονισμένα από load + mutators
+        self._trucks_by_id: Dict[int, Truck] = {}
+        self._drivers_by_id: Dict[int, Driver] = {}
+        self._trips_by_id: Dict[int, Trip] = {}
+        self._fuels_by_id: Dict[int, FuelExpense] = {}
+        # αυξάνεται σε κάθε αλλαγή φορτηγών (λίστα ή πινακίδα/ενεργό): τα combos ξαναχτίζονται μόνο τότε
+        self.trucks_version: int = 0
+        # αυξάνεται σε κάθε *_changed (φορτηγά/οδηγοί/trips/fuels): οι σελίδες ξέρουν αν είναι stale
+        self.data_version: int = 0
+        # plate.lower() -> [tid, ...] για τον έλεγχο διπλής πινακίδας (lazy, άκυρο στο trucks_changed)
+        self._plate_index: Optional[Dict[str, List[int]]] = None
+        self._trucks_by_plate: Optional[List[Truck]] = None
+        self._fixed_sum_cache: Optional[float] = None
+        # did -> (ordinals αύξοντα, trips με την ίδια σειρά), None = ξαναχτίζεται (βλ. trips_changed)
+        self._trips_by_driver: Optional[Dict[Optional[int], tuple]] = None
+        # (ordinals αύξοντα, όλα τα trips με την ίδια σειρά) για φίλτρο περιόδου με bisect
+        self._trips_by_date: Optional[tuple] = None
+        self._fuels_by_date: Optional[tuple] = None  # ([ordinal], fuels) κατά ημερομηνία
+        # tid που χρησιμοποιούνται σε trips/fuels (έλεγχος διαγραφής), None = ξαναχτίζεται
+        self._used_truck_ids: Optional[set] = None
+        # (truck_id, fuel_date) -> άθροισμα cost, None = ξαναχτίζεται (βλ. fuels_changed)
+        self._fuel_cost_by_truck_day: Optional[Dict[tuple, float]] = None
+        # id(entity) -> (entity, dict) για το save: αμετάβλητες εγγραφές δεν ξαναγίνονται dict.
+        # Όποιος αλλάζει πεδία in-place καλεί mark_entity_dirty (βλ. update_* των σελίδων)
+        self._dict_cache: Dict[int, tuple] = {}
 
         # Ρύθμιση: προεπιλεγμένη φθορά €/χλμ (override ανά φορτηγό)
         self.wear_rate_per_km: float = 0.10
@@ -2080,61 +2649,101 @@ class TrucksModel:
         t.timeout.connect(save_now_cb)
         self._save_timer = t
 
-    def schedule_save(self, ms: int = 300):
+    def schedule_save(self, ms: int = 500):
         if self._save_timer is not None:
             self._save_timer.start(ms)
 
+    @staticmethod
+    def truck_to_dict(t: Truck) -> Dict[str, Any]:
+        return {
+            "tid": t.tid,
+            "plate": t.plate,
+            "odometer_km": t.odometer_km,
+            "active": t.active,
+            "fixed_monthly_expenses": t.fixed_monthly_expenses,
+            "wear_rate_per_km": t.wear_rate_per_km,
+            "main_driver_id": t.main_driver_id,
+            "notes": t.notes,
+        }
+
+    @staticmethod
+    def trip_to_dict(tr: Trip) -> Dict[str, Any]:
+        return {
+            "trip_id": tr.trip_id,
+            "truck_id": tr.truck_id,
+            "trip_date": tr.trip_date.isoformat(),
+            "origin": tr.origin,
+            "destination": tr.destination,
+            "trip_km": tr.trip_km,
+            "revenue": tr.revenue,
+            "commission_percent": tr.commission_percent,
+            "toll_amount": tr.toll_amount,
+            "driver_id": tr.driver_id,
+            "driver_pay": tr.driver_pay,
+            "notes": tr.notes,
+        }
+
+    @staticmethod
+    def fuel_to_dict(fu: FuelExpense) -> Dict[str, Any]:
+        return {
+            "fuel_id": fu.fuel_id,
+            "truck_id": fu.truck_id,
+            "fuel_date": fu.fuel_date.isoformat(),
+            "liters": fu.liters,
+            "driver_id": fu.driver_id,
+            # cost = κόστος/λίτρο (€/L)
+            "cost": fu.cost,
+            "cost_per_liter": fu.cost,
+            "total_cost": fu.liters * fu.cost,
+            "odometer_km": fu.odometer_km,
+            "station": fu.station,
+            "receipt": fu.receipt,
+            "notes": fu.notes,
+        }
+
+    @staticmethod
+    def driver_to_dict(d: Driver) -> Dict[str, Any]:
+        return {"did": d.did, "name": d.name, "phone": d.phone, "salary": d.salary, "stamp_cost": d.stamp_cost, "pay_mode": d.pay_mode, "pay_per_trip": d.pay_per_trip, "pay_history": d.pay_history or [], "active": d.active, "notes": d.notes}
+
+    @classmethod
+    def _json_default(cls, o: Any) -> Any:
+        if isinstance(o, Trip):
+            return cls.trip_to_dict(o)
+        if isinstance(o, FuelExpense):
+            return cls.fuel_to_dict(o)
+        if isinstance(o, Truck):
+            return cls.truck_to_dict(o)
+        if isinstance(o, Driver):
+            return cls.driver_to_dict(o)
+        raise TypeError(f"Not JSON serializable: {type(o).__name__}")
+
+    def mark_entity_dirty(self, *objs):
+        for o in objs:
+            self._dict_cache.pop(id(o), None)
+
+    def _cached_json_default(self, o: Any) -> Any:
+        hit = self._dict_cache.get(id(o))
+        if hit is not None and hit[0] is o:
+            return hit[1]
+        d = self._json_default(o)
+        self._dict_cache[id(o)] = (o, d)
+        return d
+
+    def _prune_dict_cache(self):
+        # διαγραμμένες εγγραφές (π.χ. fuels που φιλτράρονται απευθείας) να μη μένουν ζωντανές στο cache
+        live = len(self.trucks) + len(self.trips) + len(self.fuels) + len(self.drivers)
+        if len(self._dict_cache) > live:
+            keep = {id(o) for lst in (self.trucks, self.trips, self.fuels, self.drivers) for o in lst}
+            self._dict_cache = {k: v for k, v in self._dict_cache.items() if k in keep}
+
     def to_dict(self) -> Dict[str, Any]:
+        # οι λίστες περνάνε ως έχουν (ούτε καν αντίγραφο: το encode γίνεται σύγχρονα στο
+        # safe_write_json): τα dataclasses γίνονται dict ένα-ένα μέσα στον encoder (βλ. _json_default)
         return {
-            "trucks": [
-                {
-                    "tid": t.tid,
-                    "plate": t.plate,
-                    "odometer_km": t.odometer_km,
-                    "active": t.active,
-                "fixed_monthly_expenses": t.fixed_monthly_expenses,
-                "wear_rate_per_km": float(getattr(t, "wear_rate_per_km", 0.0) or 0.0),
-                "main_driver_id": getattr(t, "main_driver_id", None),
-                "notes": t.notes,
-                } for t in self.trucks
-            ],
-            "trips": [
-                {
-                    "trip_id": tr.trip_id,
-                    "truck_id": tr.truck_id,
-                    "trip_date": tr.trip_date.strftime("%Y-%m-%d"),
-                    "origin": tr.origin,
-                    "destination": tr.destination,
-                    "trip_km": tr.trip_km,
-                    "revenue": tr.revenue,
-                    "commission_percent": tr.commission_percent,
-                    "toll_amount": getattr(tr, "toll_amount", 0.0) or 0.0,
-                    "driver_id": getattr(tr, "driver_id", None),
-                    "driver_pay": float(getattr(tr, "driver_pay", 0.0) or 0.0),
-                    "notes": tr.notes,
-                } for tr in self.trips
-            ],
-            "fuels": [
-                {
-                    "fuel_id": fu.fuel_id,
-                    "truck_id": fu.truck_id,
-                    "fuel_date": fu.fuel_date.strftime("%Y-%m-%d"),
-                    "liters": fu.liters,
-                    "driver_id": getattr(fu, "driver_id", None),
-                    # cost = κόστος/λίτρο (€/L)
-                    "cost": fu.cost,
-                    "cost_per_liter": fu.cost,
-                    "total_cost": float(fu.liters or 0.0) * float(fu.cost or 0.0),
-                    "odometer_km": fu.odometer_km,
-                    "station": fu.station,
-                    "receipt": fu.receipt,
-                    "notes": fu.notes,
-                } for fu in self.fuels
-            ],
-            "drivers": [
-                {"did": d.did, "name": d.name, "phone": d.phone, "salary": d.salary, "stamp_cost": d.stamp_cost, "pay_mode": getattr(d,"pay_mode","monthly"), "pay_per_trip": float(getattr(d,"pay_per_trip",0.0) or 0.0), "pay_history": getattr(d,"pay_history", []) or [], "active": d.active, "notes": d.notes}
-                for d in self.drivers
-            ],
+            "trucks": self.trucks,
+            "trips": self.trips,
+            "fuels": self.fuels,
+            "drivers": self.drivers,
             "settings": {
                 "wear_rate_per_km": float(getattr(self, "wear_rate_per_km", 0.10) or 0.10),
             },
@@ -2206,42 +2815,47 @@ class TrucksModel:
                 continue
 
 
-        self.trips = []
-        for tr in data.get("trips", []):
+        # ένα today για όλες τις εγγραφές χωρίς ημερομηνία, τοπικά bindings στο hot loop
+        today_iso = date.today().strftime("%Y-%m-%d")
+        trips = []
+        add = trips.append
+        for tr in data.get("trips", []) or []:
             try:
-                self.trips.append(Trip(
-                    trip_id=int(tr.get("trip_id")),
-                    truck_id=int(tr.get("truck_id")),
-                    trip_date=parse_date(str(tr.get("trip_date", "")).strip() or date.today().strftime("%Y-%m-%d")),
-                    origin=str(tr.get("origin", "") or ""),
-                    destination=str(tr.get("destination", "") or ""),
-                    trip_km=int(tr.get("trip_km", 0) or 0),
-                    revenue=float(tr.get("revenue", 0.0) or 0.0),
-                    commission_percent=float(tr.get("commission_percent", 0.0) or 0.0),
-                    toll_amount=float(tr.get("toll_amount", 0.0) or 0.0),
-                    driver_id=(int(tr.get("driver_id")) if tr.get("driver_id") is not None else None),
-                    driver_pay=float(tr.get("driver_pay", tr.get("driver_fee", 0.0)) or 0.0),
-                    notes=str(tr.get("notes", "") or ""),
+                g = tr.get
+                drv_id = g("driver_id")
+                add(Trip(
+                    trip_id=int(g("trip_id")),
+                    truck_id=int(g("truck_id")),
+                    trip_date=parse_date(str(g("trip_date", "")).strip() or today_iso),
+                    origin=str(g("origin", "") or ""),
+                    destination=str(g("destination", "") or ""),
+                    trip_km=int(g("trip_km", 0) or 0),
+                    revenue=float(g("revenue", 0.0) or 0.0),
+                    commission_percent=float(g("commission_percent", 0.0) or 0.0),
+                    toll_amount=float(g("toll_amount", 0.0) or 0.0),
+                    driver_id=(int(drv_id) if drv_id is not None else None),
+                    driver_pay=float(g("driver_pay", g("driver_fee", 0.0)) or 0.0),
+                    notes=str(g("notes", "") or ""),
                 ))
             except Exception as e:
-                try:
-                    if DEBUG: print('[Trucks][load] failed to load truck item:', t)
-                except Exception:
-                    if DEBUG: print('[Trucks][load] failed to load truck item: <unprintable>')
+                if DEBUG: print('[Trucks][load] failed to load trip item:', repr(tr)[:200])
                 print('   reason:', repr(e))
                 continue
+        self.trips = trips
 
-        self.fuels = []
-        for fu in data.get("fuels", []):
+        fuels = []
+        add = fuels.append
+        for fu in data.get("fuels", []) or []:
             try:
-                liters = float(fu.get("liters", 0.0) or 0.0)
+                g = fu.get
+                liters = float(g("liters", 0.0) or 0.0)
                 # Νέο νόημα: cost = κόστος/λίτρο (€/L). Για παλιά δεδομένα που είχαν συνολικό ποσό,
                 # κάνουμε αυτόματη μετατροπή με βάση τα λίτρα.
-                raw_cost = fu.get("cost_per_liter", None)
+                raw_cost = g("cost_per_liter", None)
                 if raw_cost is None:
-                    raw_cost = fu.get("unit_cost", None)
+                    raw_cost = g("unit_cost", None)
                 if raw_cost is None:
-                    raw_cost = fu.get("cost", 0.0)
+                    raw_cost = g("cost", 0.0)
                 unit_cost = float(raw_cost or 0.0)
 
                 # Heuristic migration: αν φαίνεται σαν "συνολικό κόστος" (πολύ μεγαλύτερο από €/L),
@@ -2249,25 +2863,24 @@ class TrucksModel:
                 if liters > 0 and unit_cost > 10.0:
                     unit_cost = unit_cost / liters
 
-                self.fuels.append(FuelExpense(
-                    fuel_id=int(fu.get("fuel_id")),
-                    truck_id=int(fu.get("truck_id")),
-                    fuel_date=parse_date(str(fu.get("fuel_date", "")).strip() or date.today().strftime("%Y-%m-%d")),
+                drv_id = g("driver_id")
+                add(FuelExpense(
+                    fuel_id=int(g("fuel_id")),
+                    truck_id=int(g("truck_id")),
+                    fuel_date=parse_date(str(g("fuel_date", "")).strip() or today_iso),
                     liters=liters,
                     cost=unit_cost,
-                    driver_id=(int(fu.get("driver_id")) if fu.get("driver_id") is not None else None),
-                    odometer_km=int(fu.get("odometer_km", 0) or 0),
-                    station=str(fu.get("station", "") or ""),
-                    receipt=str(fu.get("receipt", "") or ""),
-                    notes=str(fu.get("notes", "") or ""),
+                    driver_id=(int(drv_id) if drv_id is not None else None),
+                    odometer_km=int(g("odometer_km", 0) or 0),
+                    station=str(g("station", "") or ""),
+                    receipt=str(g("receipt", "") or ""),
+                    notes=str(g("notes", "") or ""),
                 ))
             except Exception as e:
-                try:
-                    if DEBUG: print('[Trucks][load] failed to load truck item:', t)
-                except Exception:
-                    if DEBUG: print('[Trucks][load] failed to load truck item: <unprintable>')
+                if DEBUG: print('[Trucks][load] failed to load fuel item:', repr(fu)[:200])
                 print('   reason:', repr(e))
                 continue
+        self.fuels = fuels
 
         # drivers
         self.drivers = []
@@ -2282,15 +2895,12 @@ class TrucksModel:
                 drv = Driver(did=int(d.get("did")), name=str(d.get("name", "")).strip(), phone=str(d.get("phone", "")).strip(), salary=float(d.get("salary", 0.0) or 0.0), stamp_cost=float(d.get("stamp_cost", d.get("ensimo", 0.0)) or 0.0), pay_mode=str(d.get("pay_mode", d.get("payment_mode", "monthly")) or "monthly"), pay_per_trip=float(d.get("pay_per_trip", d.get("per_trip", 0.0)) or 0.0), active=bool(d.get("active", True)), notes=str(d.get("notes", "")).strip())
                 ph = d.get("pay_history") or []
                 if not ph:
-                    ph = [{"month":"1900-01", "pay_mode": getattr(drv,'pay_mode','monthly'), "salary": getattr(drv,'salary',0.0), "stamp_cost": getattr(drv,'stamp_cost',0.0), "pay_per_trip": getattr(drv,'pay_per_trip',0.0)}]
+                    ph = [{"month":"1900-01", "pay_mode": drv.pay_mode, "salary": drv.salary, "stamp_cost": drv.stamp_cost, "pay_per_trip": drv.pay_per_trip}]
                 drv.pay_history = ph
                 _sync_driver_legacy_from_history(drv)
                 self.drivers.append(drv)
             except Exception as e:
-                try:
-                    if DEBUG: print('[Trucks][load] failed to load truck item:', t)
-                except Exception:
-                    if DEBUG: print('[Trucks][load] failed to load truck item: <unprintable>')
+                if DEBUG: print('[Trucks][load] failed to load driver item:', repr(d)[:200])
                 print('   reason:', repr(e))
                 continue
 
@@ -2300,21 +2910,100 @@ class TrucksModel:
         self.next_fuel_id = int(ids.get("fuel", max([f.fuel_id for f in self.fuels], default=0) + 1))
         self.next_driver_id = int(ids.get("driver", max([d.did for d in self.drivers], default=0) + 1))
 
+        # invariant: drivers ταξινομημένοι κατά did (τα νέα did είναι αύξοντα -> append)
+        self.drivers.sort(key=attrgetter("did"))
+        self._dict_cache = {}
+        self._rebuild_id_indexes()
+        self.trucks_changed()
+        self.drivers_changed()
+        self.trips_changed()
+        self.fuels_changed()
+
         print(f"[Trucks] loaded: {len(self.trucks)} trucks, {len(self.trips)} trips, {len(self.fuels)} fuels")
 
-    def save(self) -> bool:
-        return safe_write_json(self.path, self.to_dict())
+    def save(self, background: bool = False) -> bool:
+        ok = safe_write_json(self.path, self.to_dict(), default=self._cached_json_default, background=background)
+        self._prune_dict_cache()
+        return ok
 
     # --- lookup helpers
 
-    def truck_by_id(self, tid: int) -> Optional[Truck]:
+    def _rebuild_id_indexes(self):
+        # setdefault: σε διπλό id κερδίζει το πρώτο, όπως στο παλιό γραμμικό ψάξιμο
+        self._trucks_by_id = {}
         for t in self.trucks:
-            if t.tid == tid:
-                return t
-        return None
+            self._trucks_by_id.setdefault(t.tid, t)
+        self._drivers_by_id = {}
+        for d in self.drivers:
+            self._drivers_by_id.setdefault(d.did, d)
+        self._trips_by_id = {}
+        for tr in self.trips:
+            self._trips_by_id.setdefault(tr.trip_id, tr)
+        self._fuels_by_id = {}
+        for fu in self.fuels:
+            self._fuels_by_id.setdefault(fu.fuel_id, fu)
+
+    def truck_by_id(self, tid: int) -> Optional[Truck]:
+        return self._trucks_by_id.get(tid)
+
+    def trip_by_id(self, trip_id: Optional[int]) -> Optional[Trip]:
+        return self._trips_by_id.get(trip_id)
+
+    def fuel_by_id(self, fuel_id: Optional[int]) -> Optional[FuelExpense]:
+        return self._fuels_by_id.get(fuel_id)
+
+    def trucks_changed(self):
+        """Κάλεσέ το μετά από αλλαγή σε truck (πινακίδα/ενεργό) ή στη λίστα trucks."""
+        self.trucks_version += 1
+        self.data_version += 1
+        self._plate_index = None
+        self._trucks_by_plate = None
+        self._fixed_sum_cache = None
+
+    def active_fixed_monthly_sum(self) -> float:
+        """Άθροισμα πάγιων €/μήνα των ενεργών φορτηγών (θετικά μόνο)· ένα πέρασμα ανά αλλαγή φορτηγών."""
+        if self._fixed_sum_cache is None:
+            total = 0.0
+            for t in self.trucks:
+                if not t.active:
+                    continue
+                fixed = float(getattr(t, "fixed_monthly_expenses", 0.0) or 0.0)
+                if fixed > 0:
+                    total += fixed
+            self._fixed_sum_cache = total
+        return self._fixed_sum_cache
+
+    def trucks_sorted_by_plate(self) -> List[Truck]:
+        """Τα φορτηγά κατά πινακίδα (case-insensitive) για τα combos· ένα sort ανά αλλαγή φορτηγών."""
+        if self._trucks_by_plate is None:
+            keyed = [(t.plate.lower(), i, t) for i, t in enumerate(self.trucks)]
+            keyed.sort(key=itemgetter(0, 1))
+            self._trucks_by_plate = [t for _, _, t in keyed]
+        return self._trucks_by_plate
+
+    def plate_exists(self, plate: str, exclude_tid: Optional[int] = None) -> bool:
+        if self._plate_index is None:
+            idx: Dict[str, List[int]] = {}
+            for t in self.trucks:
+                idx.setdefault(t.plate.lower(), []).append(t.tid)
+            self._plate_index = idx
+        tids = self._plate_index.get(plate.lower())
+        if not tids:
+            return False
+        return any(i != exclude_tid for i in tids)
+
+    def add_truck(self, t: Truck):
+        self.trucks.append(t)
+        self._trucks_by_id.setdefault(t.tid, t)
+        self.trucks_changed()
+
+    def remove_truck(self, tid: int):
+        self.trucks = [t for t in self.trucks if t.tid != tid]
+        self._trucks_by_id.pop(tid, None)
+        self.trucks_changed()
 
     def truck_label(self, tid: int) -> str:
-        t = self.truck_by_id(tid)
+        t = self._trucks_by_id.get(tid)
         return t.plate if t and t.plate else f"Φορτηγό #{tid}"
 
     def wear_rate_for_truck(self, truck_id: Optional[int]) -> float:
@@ -2324,7 +3013,7 @@ class TrucksModel:
         except Exception:
             tid = None
         if tid is not None:
-            t = self.truck_by_id(tid)
+            t = self._trucks_by_id.get(tid)
             try:
                 ov = float(getattr(t, "wear_rate_per_km", 0.0) or 0.0) if t else 0.0
             except Exception:
@@ -2336,27 +3025,165 @@ class TrucksModel:
         except Exception:
             return 0.10
 
+    def wear_rates_by_truck(self) -> Tuple[Dict[int, float], float]:
+        """({tid: φθορά €/χλμ}, default) μία φορά ανά refresh· ίδια λογική με wear_rate_for_truck."""
+        default = self.wear_rate_for_truck(None)
+        rates: Dict[int, float] = {}
+        for t in self.trucks:
+            try:
+                ov = float(t.wear_rate_per_km or 0.0)
+            except Exception:
+                ov = 0.0
+            rates.setdefault(t.tid, ov if ov > 0 else default)
+        return rates, default
 
     
     def driver_by_id(self, did: int) -> Optional[Driver]:
-        for d in self.drivers:
-            if d.did == did:
-                return d
-        return None
+        return self._drivers_by_id.get(did)
 
     def driver_label(self, did: Optional[int]) -> str:
         if did is None:
             return "-"
-        d = self.driver_by_id(did)
+        d = self._drivers_by_id.get(did)
         return d.name if d else f"#{did}"
 
     def active_drivers(self) -> list[Driver]:
-        return [d for d in self.drivers if d.active]
+        if self._active_drivers_cache is None:
+            self._active_drivers_cache = [d for d in self.drivers if d.active]
+        return self._active_drivers_cache
+
+    def per_trip_pay(self, did: int) -> float:
+        """Αμοιβή ανά δρομολόγιο: pay_per_trip για οδηγούς per_trip, αλλιώς (monthly/άγνωστος) 0.
+        Ο πίνακας {did: αμοιβή} χτίζεται μία φορά και ακυρώνεται στο drivers_changed()."""
+        cache = self._per_trip_pay_cache
+        if cache is None:
+            cache = {}
+            for d in self.drivers:
+                if str(getattr(d, 'pay_mode', 'monthly') or 'monthly') == 'per_trip':
+                    cache.setdefault(d.did, float(getattr(d, 'pay_per_trip', 0.0) or 0.0))
+                else:
+                    cache.setdefault(d.did, 0.0)
+            self._per_trip_pay_cache = cache
+        return cache.get(did, 0.0)
+
+    def drivers_changed(self):
+        """Κάλεσέ το μετά από αλλαγή σε οδηγό (π.χ. active) που έγινε απευθείας στο αντικείμενο."""
+        self._active_drivers_cache = None
+        self._per_trip_pay_cache = None
+        # και το cache του ιστορικού μισθοδοσίας (μπορεί να άλλαξε in-place, ίδια λίστα/ίδιο μήκος)
+        for d in self.drivers:
+            d._pay_cache = None
+        self.data_version += 1
 
-    def active_trucks(self) -> List[Truck]:
-        return [t for t in self.trucks if t.active]
+    def add_driver(self, d: Driver):
+        if self.drivers and d.did < self.drivers[-1].did:
+            bisect.insort(self.drivers, d, key=attrgetter("did"))
+        else:
+            self.drivers.append(d)
+        self._drivers_by_id.setdefault(d.did, d)
+        self.drivers_changed()
+
+    def remove_driver(self, did: int):
+        self.drivers = [x for x in self.drivers if x.did != did]
+        self._drivers_by_id.pop(did, None)
+        self.drivers_changed()
+
+    def trips_changed(self):
+        """Κάλεσέ το μετά από αλλαγή σε trip (ημερομηνία/οδηγός/φορτηγό) ή στη λίστα trips."""
+        self._trips_by_driver = None
+        self._trips_by_date = None
+        self._used_truck_ids = None
+        self.data_version += 1
+
+    def fuels_changed(self):
+        """Κάλεσέ το μετά από αλλαγή σε fuel (φορτηγό/ημερομηνία/κόστος) ή στη λίστα fuels."""
+        self._used_truck_ids = None
+        self._fuel_cost_by_truck_day = None
+        self._fuels_by_date = None
+        self.data_version += 1
+
+    def fuel_cost_by_truck_day(self) -> Dict[tuple, float]:
+        if self._fuel_cost_by_truck_day is None:
+            agg: Dict[tuple, float] = {}
+            for f in self.fuels:
+                k = (f.truck_id, f.fuel_date)
+                agg[k] = agg.get(k, 0.0) + float(f.cost or 0.0)
+            self._fuel_cost_by_truck_day = agg
+        return self._fuel_cost_by_truck_day
+
+    def add_fuel(self, fu: FuelExpense):
+        self.fuels.append(fu)
+        self._fuels_by_id.setdefault(fu.fuel_id, fu)
+        self.fuels_changed()
+
+    def remove_fuel(self, fuel_id: int):
+        self.fuels = [x for x in self.fuels if x.fuel_id != fuel_id]
+        self._fuels_by_id.pop(fuel_id, None)
+        self.fuels_changed()
+
+    def truck_in_use(self, tid: int) -> bool:
+        if self._used_truck_ids is None:
+            used = {tr.truck_id for tr in self.trips}
+            used.update(fu.truck_id for fu in self.fuels)
+            self._used_truck_ids = used
+        return tid in self._used_truck_ids
+
+    def driver_has_trips(self, did: int) -> bool:
+        return did in self._driver_trip_index()
+
+    def add_trip(self, tr: Trip):
+        self.trips.append(tr)
+        self._trips_by_id.setdefault(tr.trip_id, tr)
+        self.trips_changed()
+
+    def remove_trip(self, trip_id: int):
+        self.trips = [x for x in self.trips if x.trip_id != trip_id]
+        self._trips_by_id.pop(trip_id, None)
+        self.trips_changed()
+
+    def driver_trips_in_range(self, did: Optional[int], lo: int, hi: int, newest_first: bool = False) -> List[Trip]:
+        """Trips του οδηγού με lo <= trip_date.toordinal() < hi (σειρά λίστας για ίδια ημερομηνία).
+
+        newest_first: φθίνουσα σειρά ημερομηνίας (αντίστροφο slice, χωρίς sort)."""
+        entry = self._driver_trip_index().get(did)
+        if entry is None:
+            return []
+        ords, lst = entry
+        a, b = bisect.bisect_left(ords, lo), bisect.bisect_left(ords, hi)
+        out = lst[a:b]
+        if newest_first:
+            out.reverse()
+        return out
+
+    def fuels_in_range(self, lo: int, hi: int) -> List[FuelExpense]:
+        """Fuels με lo <= fuel_date.toordinal() < hi, κατά ημερομηνία (σειρά λίστας για ίδια ημερομηνία)."""
+        if self._fuels_by_date is None:
+            lst = sorted(self.fuels, key=attrgetter("fuel_date"))
+            self._fuels_by_date = ([f.fuel_date.toordinal() for f in lst], lst)
+        ords, lst = self._fuels_by_date
+        return lst[bisect.bisect_left(ords, lo):bisect.bisect_left(ords, hi)]
+
+    def trips_in_range(self, lo: int, hi: int) -> List[Trip]:
+        """Trips με lo <= trip_date.toordinal() < hi, κατά ημερομηνία (σειρά λίστας για ίδια ημερομηνία)."""
+        if self._trips_by_date is None:
+            lst = sorted(self.trips, key=attrgetter("trip_date"))
+            self._trips_by_date = ([tr.trip_date.toordinal() for tr in lst], lst)
+        ords, lst = self._trips_by_date
+        return lst[bisect.bisect_left(ords, lo):bisect.bisect_left(ords, hi)]
+
+    def _driver_trip_index(self) -> Dict[Optional[int], tuple]:
+        if self._trips_by_driver is None:
+            groups: Dict[Optional[int], List[Trip]] = {}
+            for tr in self.trips:
+                groups.setdefault(tr.driver_id, []).append(tr)
+            index = {}
+            for k, lst in groups.items():
+                lst.sort(key=attrgetter("trip_date"))
+                index[k] = ([tr.trip_date.toordinal() for tr in lst], lst)
+            self._trips_by_driver = index
+        return self._trips_by_driver
 
-def active_trucks(self) -> List[Truck]:
+    def active_trucks(self) -> List[Truck]:
         return [t for t in self.trucks if t.active]
 
 
@@ -2365,6 +3192,28 @@ def active_trucks(self) -> List[Truck]:
 # Περίοδος εργασίας (Μήνας/Έτος)
 # -----------------------------
 
+@functools.lru_cache(maxsize=256)
+def period_ord_range(year: Optional[int], month: Optional[int]) -> tuple:
+    """[lo, hi) σε date ordinals για έτος/μήνα (month 0/None = όλο το έτος, year None = όλα)."""
+    if year is None:
+        return 0, sys.maxsize
+    y, m = int(year), int(month or 0)
+    if m == 0:
+        return date(y, 1, 1).toordinal(), date(y + 1, 1, 1).toordinal()
+    lo = date(y, m, 1).toordinal()
+    hi = date(y + (m == 12), m % 12 + 1, 1).toordinal()
+    return lo, hi
+
+
+@functools.lru_cache(maxsize=256)
+def period_date_range(year: Optional[int], month: Optional[int]) -> tuple:
+    """Όπως period_ord_range αλλά σε date: στα loops το d_lo <= d < d_hi αποφεύγει το toordinal() ανά εγγραφή."""
+    if year is None:
+        return date.min, date.max
+    lo, hi = period_ord_range(year, month)
+    return date.fromordinal(lo), date.fromordinal(hi)
+
+
 MONTH_LABELS_GR = [
     "Ιανουάριος", "Φεβρουάριος", "Μάρτιος", "Απρίλιος", "Μάιος", "Ιούνιος",
     "Ιούλιος", "Αύγουστος", "Σεπτέμβριος", "Οκτώβριος", "Νοέμβριος", "Δεκέμβριος"
@@ -2416,43 +3265,54 @@ class PeriodBar(QWidget):
         self.set_current_month()
 
     def populate_years(self, years: Optional[List[int]] = None):
-        self._building = True
-        self.cb_year.clear()
-
         if not years:
             y = date.today().year
             years = list(range(y - 2, y + 3))
 
-        for y in years:
-            self.cb_year.addItem(str(y), y)
-        self._building = False
+        # ίδια έτη με αυτά που υπάρχουν ήδη -> τίποτα (χωρίς clear/ξαναγέμισμα)
+        if [self.cb_year.itemData(i) for i in range(self.cb_year.count())] != list(years):
+            self._building = True
+            with QSignalBlocker(self.cb_year):
+                self.cb_year.clear()
+                for y in years:
+                    self.cb_year.addItem(str(y), y)
+            self._building = False
 
         self._build_months()
 
     def _build_months(self):
+        # η λίστα μηνών είναι σταθερή: χτίζεται μία φορά
+        if self.cb_month.count() == len(MONTH_LABELS_GR) + 1:
+            return
         self._building = True
-        self.cb_month.clear()
-        self.cb_month.addItem("Όλοι οι μήνες", 0)
-        for i, name in enumerate(MONTH_LABELS_GR, start=1):
-            self.cb_month.addItem(name, i)
+        with QSignalBlocker(self.cb_month):
+            self.cb_month.clear()
+            self.cb_month.addItem("Όλοι οι μήνες", 0)
+            for i, name in enumerate(MONTH_LABELS_GR, start=1):
+                self.cb_month.addItem(name, i)
         self._building = False
 
     def set_period(self, year: int, month: int):
-        # year
-        idx = self.cb_year.findData(year)
-        if idx >= 0:
-            self.cb_year.setCurrentIndex(idx)
-        else:
-            # add year if missing
-            self.cb_year.addItem(str(year), year)
-            self.cb_year.setCurrentIndex(self.cb_year.count() - 1)
-
-        # month
-        idxm = self.cb_month.findData(month)
-        if idxm >= 0:
-            self.cb_month.setCurrentIndex(idxm)
-        else:
-            self.cb_month.setCurrentIndex(0)
+        # έτος + μήνας αλλάζουν μαζί -> ένα μόνο on_changed στο τέλος (όχι ένα ανά combo)
+        self._building = True
+        try:
+            # year
+            idx = self.cb_year.findData(year)
+            if idx >= 0:
+                self.cb_year.setCurrentIndex(idx)
+            else:
+                # add year if missing
+                self.cb_year.addItem(str(year), year)
+                self.cb_year.setCurrentIndex(self.cb_year.count() - 1)
+
+            # month
+            idxm = self.cb_month.findData(month)
+            if idxm >= 0:
+                self.cb_month.setCurrentIndex(idxm)
+            else:
+                self.cb_month.setCurrentIndex(0)
+        finally:
+            self._building = False
 
         self._emit()
 
@@ -2518,6 +3378,8 @@ def make_trucks_nav(on_go_registry: Callable[[], None],
     layout.addWidget(btn_summary)
     layout.addStretch(1)
 
+    bar.nav_buttons = {"registry": btn_registry, "trips": btn_trips, "fuel": btn_fuel,
+                       "summary": btn_summary, "drivers": btn_drivers}
     return bar
 
 
@@ -2581,7 +3443,7 @@ class TruckRegistryPage(QWidget):
         grid.addWidget(QLabel("Σημειώσεις:"), 1, 2)
         grid.addWidget(self.ed_notes, 1, 3)
 
-        self.cb_main_driver = QComboBox()
+        self.cb_main_driver = DriverComboBox('— κανένας —', self.model.active_drivers)
         grid.addWidget(QLabel("Κύριος οδηγός:"), 2, 2)
         grid.addWidget(self.cb_main_driver, 2, 3)
 
@@ -2610,37 +3472,21 @@ class TruckRegistryPage(QWidget):
         self.refresh()
 
     def refresh(self):
-        # fill drivers combo
-        current = self.cb_main_driver.currentData() if hasattr(self, 'cb_main_driver') else None
-        if hasattr(self, 'cb_main_driver'):
-            self.cb_main_driver.blockSignals(True)
-            self.cb_main_driver.clear()
-            self.cb_main_driver.addItem('— κανένας —', None)
-            for d in self.model.active_drivers():
-                self.cb_main_driver.addItem(d.name, d.did)
-            if current is not None:
-                idx = self.cb_main_driver.findData(current)
-                if idx >= 0:
-                    self.cb_main_driver.setCurrentIndex(idx)
-            self.cb_main_driver.blockSignals(False)
-        self.table.setRowCount(0)
-        for t in sorted(self.model.trucks, key=lambda x: x.tid):
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.table.setItem(r, 0, QTableWidgetItem(str(t.tid)))
-            self.table.setItem(r, 1, QTableWidgetItem(t.plate))
-            self.table.setItem(r, 2, QTableWidgetItem(str(t.odometer_km)))
-            self.table.setItem(r, 3, QTableWidgetItem("Ναι" if t.active else "Όχι"))
-            self.table.setItem(r, 4, QTableWidgetItem(f"{getattr(t, 'fixed_monthly_expenses', 0.0):.2f}"))
-            wr = float(getattr(t, "wear_rate_per_km", 0.0) or 0.0)
-            self.table.setItem(r, 5, QTableWidgetItem("—" if wr <= 0 else f"{wr:.3f}"))
-            self.table.setItem(r, 6, QTableWidgetItem(self.model.driver_label(getattr(t, "main_driver_id", None))))
-
-        self.table.resizeColumnsToContents()
-        try:
-            self._hide_odometer_column_if_exists()
-        except Exception:
-            pass
+        # drivers combo: ξαναγεμίζει μόνο αν άλλαξαν οι οδηγοί
+        self.cb_main_driver.sync()
+        trucks = sorted(self.model.trucks, key=attrgetter("tid"))
+        with table_bulk_fill(self.table, len(trucks)) as tbl:
+            for r, t in enumerate(trucks):
+                set_cell_text(tbl, r, 0, str(t.tid))
+                set_cell_text(tbl, r, 1, t.plate)
+                set_cell_text(tbl, r, 2, str(t.odometer_km))
+                set_cell_text(tbl, r, 3, "Ναι" if t.active else "Όχι")
+                set_cell_text(tbl, r, 4, f"{getattr(t, 'fixed_monthly_expenses', 0.0):.2f}")
+                wr = float(getattr(t, "wear_rate_per_km", 0.0) or 0.0)
+                set_cell_text(tbl, r, 5, "—" if wr <= 0 else f"{wr:.3f}")
+                set_cell_text(tbl, r, 6, self.model.driver_label(getattr(t, "main_driver_id", None)))
+
+        resize_columns_once(self.table)
 
     def on_row_clicked(self, row: int, col: int):
         tid = int(self.table.item(row, 0).text())
@@ -2653,10 +3499,7 @@ class TruckRegistryPage(QWidget):
         self.cb_active.setCurrentIndex(0 if t.active else 1)
         self.ed_notes.setText(t.notes)
         try:
-            idx = self.cb_main_driver.findData(getattr(t, "main_driver_id", None))
-            if idx >= 0:
-                self.cb_main_driver.setCurrentIndex(idx)
-            else:
+            if not self.cb_main_driver.select_did(getattr(t, "main_driver_id", None)):
                 self.cb_main_driver.setCurrentIndex(0)
         except Exception:
             pass
@@ -2690,7 +3533,7 @@ class TruckRegistryPage(QWidget):
         if not plate:
             QMessageBox.warning(self, "Σφάλμα", "Η πινακίδα είναι υποχρεωτική.")
             return
-        if any(t.plate.lower() == plate.lower() for t in self.model.trucks):
+        if self.model.plate_exists(plate):
             QMessageBox.warning(self, "Σφάλμα", "Υπάρχει ήδη φορτηγό με αυτή την πινακίδα.")
             return
         t = Truck(
@@ -2704,7 +3547,7 @@ class TruckRegistryPage(QWidget):
             main_driver_id=self.cb_main_driver.currentData() if hasattr(self, "cb_main_driver") else None,
         )
         self.model.next_truck_id += 1
-        self.model.trucks.append(t)
+        self.model.add_truck(t)
         self.model.schedule_save()
         self.on_changed()
         self.refresh()
@@ -2721,7 +3564,7 @@ class TruckRegistryPage(QWidget):
         if not plate:
             QMessageBox.warning(self, "Σφάλμα", "Η πινακίδα είναι υποχρεωτική.")
             return
-        if any(o.tid != t.tid and o.plate.lower() == plate.lower() for o in self.model.trucks):
+        if self.model.plate_exists(plate, exclude_tid=t.tid):
             QMessageBox.warning(self, "Σφάλμα", "Υπάρχει ήδη άλλο φορτηγό με αυτή την πινακίδα.")
             return
         t.plate = plate
@@ -2740,6 +3583,8 @@ class TruckRegistryPage(QWidget):
             t.wear_rate_per_km = float(self.sp_wear.value())
         except Exception:
             t.wear_rate_per_km = 0.0
+        self.model.mark_entity_dirty(t)
+        self.model.trucks_changed()
         self.model.schedule_save()
         self.on_changed()
         self.refresh()
@@ -2749,10 +3594,10 @@ class TruckRegistryPage(QWidget):
             QMessageBox.information(self, "Επιλογή", "Διάλεξε γραμμή για διαγραφή.")
             return
         tid = self.selected_tid
-        if any(tr.truck_id == tid for tr in self.model.trips) or any(fu.truck_id == tid for fu in self.model.fuels):
+        if self.model.truck_in_use(tid):
             QMessageBox.warning(self, "Απαγορεύεται", "Το φορτηγό χρησιμοποιείται σε δρομολόγια/καύσιμα και δεν μπορεί να διαγραφεί.")
             return
-        self.model.trucks = [t for t in self.model.trucks if t.tid != tid]
+        self.model.remove_truck(tid)
         self.selected_tid = None
         self.model.schedule_save()
         self.on_changed()
@@ -2760,6 +3605,229 @@ class TruckRegistryPage(QWidget):
         self.clear_form()
 
 
+class TripCalcIn(NamedTuple):
+    """Τα πεδία ενός Trip που διαβάζει το compute_trip_rows (αντίγραφο από το GUI thread)."""
+    trip: Trip  # μόνο για τη γραμμή του πίνακα· ο υπολογισμός δεν το διαβάζει
+    trip_id: int
+    truck_id: int
+    trip_date: date
+    driver_id: Optional[int]
+    trip_km: int
+    revenue: float
+    commission_percent: float
+    toll_amount: float
+    driver_pay: float
+
+
+class DriverCalcIn(NamedTuple):
+    did: int
+    active: bool
+    pay_mode: str
+    salary: float
+    stamp_cost: float
+
+
+class TruckCalcIn(NamedTuple):
+    tid: int
+    active: bool
+    fixed_monthly_expenses: float
+
+
+def trip_rows_snapshot(period_trips: List[Trip], drivers: List[Driver], trucks: List[Truck]) -> tuple:
+    """(trips, drivers, trucks) για το compute_trip_rows ως tuples: ο worker δεν διαβάζει ποτέ
+    τα ζωντανά Trip/Driver/Truck, οπότε μια in-place αλλαγή στο GUI thread δεν τον επηρεάζει."""
+    return (
+        [TripCalcIn(tr, tr.trip_id, tr.truck_id, tr.trip_date, tr.driver_id, tr.trip_km, tr.revenue,
+                    tr.commission_percent, tr.toll_amount, tr.driver_pay) for tr in period_trips],
+        [DriverCalcIn(d.did, d.active, d.pay_mode, d.salary, d.stamp_cost) for d in drivers],
+        [TruckCalcIn(t.tid, t.active, t.fixed_monthly_expenses) for t in trucks],
+    )
+
+
+def compute_trip_rows(period_trips: List[TripCalcIn], drivers: List[DriverCalcIn], trucks: List[TruckCalcIn],
+                      sel_tid: Optional[int], fuel_by_day: Dict[tuple, float],
+                      wear_by_tid: Dict[int, float], wear_default: float) -> Tuple[list, float]:
+    """Γραμμές πίνακα Δρομολογίων + σύνολο κέρδους φορτηγού. Καθαρή συνάρτηση (χωρίς Qt) πάνω
+    στο trip_rows_snapshot, τρέχει και σε worker thread.
+    Γραμμή: (trip, προμήθεια, φθορά, μικτό, καθαρό, καθαρό/φορτηγό)."""
+    # --- Υπολογισμός παγίων ανά χλμ (για "καθαρό" κέρδος ανά δρομολόγιο) ---
+    # Scope: τα trips που προβάλλονται (με τα τρέχοντα φίλτρα περιόδου & φορτηγού)
+    # Πάγια ανά μήνα: fixed_monthly_expenses φορτηγών + ένσημα (όλων) + μισθοί (μόνο monthly)
+    trucks_by_id: Dict[int, TruckCalcIn] = {}
+    for t in trucks:
+        trucks_by_id.setdefault(t.tid, t)
+
+    # μηνιαία κόστη οδηγών (για όλους/μόνο monthly) + κόστος ανά οδηγό για την κατανομή
+    # ανά φορτηγό πιο κάτω (ένα πέρασμα στους οδηγούς αντί για δύο)
+    stamps_per_month = 0.0
+    salary_per_month = 0.0
+    driver_costs = []  # [(did, ένσημα + μισθός monthly)], σειρά λίστας οδηγών
+    for d in drivers:
+        if not getattr(d, 'active', True):
+            continue
+        stamps = float(getattr(d, 'stamp_cost', 0.0) or 0.0)
+        stamps_per_month += stamps
+        mode = str(getattr(d, 'pay_mode', 'monthly') or 'monthly')
+        sal = float(getattr(d, 'salary', 0.0) or 0.0) if mode == 'monthly' else 0.0
+        if mode == 'monthly':
+            salary_per_month += sal
+        if stamps + sal != 0.0:
+            driver_costs.append((int(getattr(d, 'did', 0) or 0), stamps + sal))
+
+    # fixed φορτηγών (ανά μήνα) ανάλογα με το φίλτρο
+    if sel_tid is not None:
+        t = trucks_by_id.get(sel_tid)
+        fixed_trucks_per_month = float(getattr(t, 'fixed_monthly_expenses', 0.0) or 0.0) if t and getattr(t, 'active', True) else 0.0
+    else:
+        fixed_trucks_per_month = 0.0
+        for t in trucks:
+            if not getattr(t, 'active', True):
+                continue
+            fixed_trucks_per_month += float(getattr(t, 'fixed_monthly_expenses', 0.0) or 0.0)
+
+    fixed_per_month_total = fixed_trucks_per_month + stamps_per_month + salary_per_month
+
+    # Ένα πέρασμα στα trips: φίλτρο φορτηγού + km στα πιο "λεπτά" κλειδιά,
+    # (mk, truck_id) και (mk, driver_id, truck_id)· τα χοντρότερα αθροίσματα βγαίνουν από αυτά
+    # (ακέραια km -> ίδια αποτελέσματα, ίδια σειρά κλειδιών με το πρώτο εμφανιζόμενο trip)
+    km_truck_month = {}  # (mk, truck_id) -> km
+    km_driver_truck_month = {}  # (mk, driver_id, truck_id) -> km
+    visible = [tr for tr in period_trips if tr.truck_id == sel_tid] if sel_tid is not None else period_trips
+    ktm_get, kdtm_get = km_truck_month.get, km_driver_truck_month.get
+    for _tr in visible:
+        d = _tr.trip_date
+        mk = (d.year, d.month)
+        tid = _tr.truck_id
+        kmv = _tr.trip_km
+        k = (mk, tid)
+        km_truck_month[k] = ktm_get(k, 0) + kmv
+        did = _tr.driver_id
+        if did is not None:
+            k = (mk, did, tid)
+            km_driver_truck_month[k] = kdtm_get(k, 0) + kmv
+
+    # - km_by_month: km ανά μήνα (μόνο για τα trips που θα εμφανιστούν)
+    # - km_driver_month: για την κατανομή μισθών & ενσήμων ανά φορτηγό (βλ. παρακάτω)
+    km_by_month = {}
+    for (mk, _tid), kmv in km_truck_month.items():
+        km_by_month[mk] = km_by_month.get(mk, 0) + kmv
+    # ομαδοποίηση στο ίδιο πέρασμα: (mk, did) -> [(truck_id, km)]
+    km_driver_month = {}  # (mk, driver_id) -> km
+    trucks_by_driver_month = {}
+    for (mk, did, tid), kmv in km_driver_truck_month.items():
+        km_driver_month[(mk, did)] = km_driver_month.get((mk, did), 0) + kmv
+        trucks_by_driver_month.setdefault((mk, did), []).append((tid, kmv))
+
+    fixed_per_km_by_month = {}
+    for mk, km in km_by_month.items():
+        if km and km > 0:
+            fixed_per_km_by_month[mk] = fixed_per_month_total / float(km)
+        else:
+            fixed_per_km_by_month[mk] = 0.0
+
+    # --- Truck-specific πάγια/χλμ (κατανομή μισθών & ενσήμων ανά φορτηγό με βάση τα χλμ) ---
+    # Για κάθε μήνα και φορτηγό, μοιράζουμε:
+    # - fixed_monthly_expenses του ίδιου φορτηγού (100% στο φορτηγό)
+    # - stamp_cost όλων των οδηγών (pro-rata στα φορτηγά που δούλεψαν, με βάση χλμ)
+    # - salary μόνο των μηνιαίων οδηγών (pro-rata στα φορτηγά που δούλεψαν, με βάση χλμ)
+    # (τα km_truck_month / km_driver_month / km_driver_truck_month από το ίδιο πέρασμα πιο πάνω)
+
+    # did -> [(mk, km)] (αντί για σάρωση όλων των km_driver_month ανά οδηγό)
+    months_by_driver = {}
+    for (mk, did), km_total in km_driver_month.items():
+        months_by_driver.setdefault(did, []).append((mk, km_total))
+
+    # fixed ανά φορτηγό (μήνα) + κατανεμημένα ένσημα/μισθοί
+    # (μόνο οδηγοί με κόστος· κόστος οδηγού ανά μήνα = ένσημα πάντα, μισθός μόνο monthly)
+    payroll_truck_month = {}  # (mk, truck_id) -> cost
+    for did, driver_month_cost in driver_costs:
+        if did not in months_by_driver:
+            continue  # κανένα χλμ στην περίοδο -> τίποτα να κατανεμηθεί
+
+        # κατανομή ανά μήνα με βάση τα χλμ του οδηγού
+        # Για κάθε μήνα που εμφανίζεται σε km_driver_month:
+        for mk, km_total in months_by_driver.get(did, ()):
+            if not km_total:
+                continue
+            # όλα τα φορτηγά αυτού του οδηγού-μήνα
+            for tid2, km_part in trucks_by_driver_month[(mk, did)]:
+                if not km_part:
+                    continue
+                share = driver_month_cost * (float(km_part) / float(km_total))
+                payroll_truck_month[(mk, tid2)] = payroll_truck_month.get((mk, tid2), 0.0) + share
+
+    fixed_per_km_truck_month = {}  # (mk, truck_id) -> €/km
+    for (mk, tid), km in km_truck_month.items():
+        # fixed του φορτηγού
+        t = trucks_by_id.get(int(tid))
+        fixed_truck = float(getattr(t, 'fixed_monthly_expenses', 0.0) or 0.0) if t and getattr(t, 'active', True) else 0.0
+        fixed_total = fixed_truck + float(payroll_truck_month.get((mk, tid), 0.0) or 0.0)
+        if km and km > 0:
+            fixed_per_km_truck_month[(mk, tid)] = fixed_total / float(km)
+        else:
+            fixed_per_km_truck_month[(mk, tid)] = 0.0
+
+    total_net_profit_truck = 0.0
+
+    shown = sorted(visible, key=attrgetter("trip_date", "trip_id"), reverse=True)
+    rows = []
+    add = rows.append
+    wear_get, fuel_get = wear_by_tid.get, fuel_by_day.get
+    fpk_month_get, fpk_truck_get = fixed_per_km_by_month.get, fixed_per_km_truck_month.get
+    # τα πεδία του Trip είναι ήδη τυπωμένα (int/float από load/φόρμα): ένα load ανά πεδίο,
+    # χωρίς float(x or 0.0) σε κάθε πράξη
+    for tr in shown:
+        tid, d, km, revenue = tr.truck_id, tr.trip_date, tr.trip_km, tr.revenue
+        comm_amount = revenue * (tr.commission_percent / 100.0)
+        wear_cost = km * wear_get(tid, wear_default)
+
+        # --- Κέρδος δρομολογίου ---
+        # καύσιμα: άθροισμα εξόδων καυσίμων για ίδιο φορτηγό & ίδια ημερομηνία
+        gross_profit = (revenue - comm_amount - tr.toll_amount - wear_cost
+                        - fuel_get((tid, d), 0.0) - tr.driver_pay)
+
+        mk = (d.year, d.month)
+        net_profit = gross_profit - fpk_month_get(mk, 0.0) * km
+
+        # Καθαρό κέρδος με πάγια/χλμ ανά φορτηγό (κατανομή μισθών & ενσήμων)
+        net_profit_truck = gross_profit - fpk_truck_get((mk, tid), 0.0) * km
+        total_net_profit_truck += net_profit_truck
+
+        add((tr.trip, comm_amount, wear_cost, gross_profit, net_profit, net_profit_truck))
+    return rows, total_net_profit_truck
+
+
+class _TripRowsNotifier(QObject):
+    # (generation, rows, σύνολο κέρδους φορτηγού) -> queued στο GUI thread
+    done = Signal(int, object, float)
+    # generation του υπολογισμού που απέτυχε στον worker
+    failed = Signal(int)
+
+
+class _TripRowsRunnable(QRunnable):
+    def __init__(self, notifier: _TripRowsNotifier, gen: int, args: tuple):
+        super().__init__()
+        self.notifier = notifier
+        self.gen = gen
+        self.args = args
+
+    def run(self):
+        try:
+            try:
+                rows, total = compute_trip_rows(*self.args)
+            except Exception as e:
+                print('[Trucks][trips] compute_trip_rows failed in worker:', repr(e))
+                self.notifier.failed.emit(self.gen)
+                return
+            self.notifier.done.emit(self.gen, rows, total)
+        except RuntimeError:
+            pass  # η σελίδα έκλεισε πριν τελειώσει ο υπολογισμός
+
+
+# πάνω από τόσα δρομολόγια περιόδου ο υπολογισμός του πίνακα γίνεται σε worker thread
+TRIPS_ASYNC_MIN_ROWS = 2000
+
+
 class TripsPage(QWidget):
     def __init__(self, model: TrucksModel, on_changed: Callable[[], None]):
         super().__init__()
@@ -2778,16 +3846,28 @@ class TripsPage(QWidget):
         root.addWidget(title)
         # Περίοδος (μόνο για Δρομολόγια)
         self.period_bar = PeriodBar(None)
+        # γρήγορες αλλαγές φίλτρου/περιόδου -> ένα refresh (trailing, 80 ms)
+        self._refresh_debounce = make_debouncer(self, 80, self.refresh)
+        # model.trucks_version που αντιστοιχεί στο περιεχόμενο των combos φορτηγών (-1 = να χτιστούν)
+        self._truck_combo_version = -1
+        self._truck_filter_version = -1
+        # tid -> index γραμμής στα combos φορτηγών (ξαναχτίζονται μαζί με τα combos)
+        self._truck_combo_idx: Dict[int, int] = {}
+        self._truck_filter_idx: Dict[int, int] = {}
+        # αποτελέσματα υπολογισμού γραμμών (sync ή από worker)· κρατείται μόνο το νεότερο gen
+        self._rows_gen = 0
+        # args του υπολογισμού που τρέχει στον worker (για sync επανάληψη αν αποτύχει)
+        self._rows_args: Optional[tuple] = None
+        self._rows_notifier = _TripRowsNotifier()
+        self._rows_notifier.done.connect(self._apply_rows)
+        self._rows_notifier.failed.connect(self._rows_failed)
 
         # Φίλτρο ανά Φορτηγό (μόνο ενεργά)
         self.cb_truck_filter = QComboBox()
         self.cb_truck_filter.addItem('Όλα τα φορτηγά', None)
         for t in [x for x in self.model.trucks if getattr(x, 'active', True)]:
             self.cb_truck_filter.addItem(t.plate, t.tid)
-        try:
-            self.cb_truck_filter.currentIndexChanged.connect(lambda _=None: self.refresh())
-        except Exception:
-            pass
+        self.cb_truck_filter.currentIndexChanged.connect(lambda _=None: self._refresh_debounce.start())
         root.addWidget(self.period_bar)
         # Γραμμή φίλτρου φορτηγού + σύνολο κέρδους (καθαρό/φορτηγό)
         truck_row = QHBoxLayout()
@@ -2795,19 +3875,37 @@ class TripsPage(QWidget):
         truck_row.addStretch(1)
         self.lbl_total_net_profit_truck = QLabel("Σύνολο Κέρδος φορτηγού: 0,00 €")
         set_label_role(self.lbl_total_net_profit_truck, "metric")
-        self.lbl_total_net_profit_truck.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self.lbl_total_net_profit_truck.setAlignment(ALIGN_RIGHT)
         truck_row.addWidget(self.lbl_total_net_profit_truck)
         root.addLayout(truck_row)
         # Default: τρέχον έτος, όλοι οι μήνες (για να φαίνονται όλα τα δρομολόγια του έτους)
         # self.period_bar.set_all_year()  # moved after widgets init
 
-        self.table = QTableWidget(0, 15)
-        self.table.setHorizontalHeaderLabels(["ID", "Ημερομηνία", "Φορτηγό", "Οδηγός", "Από", "Προς", "Χλμ δρομολογίου", "Έσοδο", "Προμήθεια %", "Προμήθεια €", "Διόδια €", "Φθορά €", "Κέρδος δρομολογίου", "Κέρδος/σύγκριση", "Κέρδος φορτηγού"])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # γραμμές: (trip, προμήθεια €, φθορά €, κέρδος δρομολογίου, κέρδος/σύγκριση, κέρδος φορτηγού)
+        # — τα ποσά υπολογίζονται στο refresh, τα κείμενα μόνο για τις γραμμές που ζωγραφίζονται
+        truck_label = self.model.truck_label
+        driver_label = self.model.driver_label
+        self.table, self.table_model = make_rows_table([
+            ("ID", lambda x, r: str(x[0].trip_id), None),
+            ("Ημερομηνία", lambda x, r: fmt_date(x[0].trip_date), None),
+            ("Φορτηγό", lambda x, r: truck_label(x[0].truck_id), None),
+            ("Οδηγός", lambda x, r: driver_label(x[0].driver_id), None),
+            ("Από", lambda x, r: x[0].origin, None),
+            ("Προς", lambda x, r: x[0].destination, None),
+            ("Χλμ δρομολογίου", lambda x, r: str(x[0].trip_km), None),
+            ("Έσοδο", lambda x, r: fmt_eur(x[0].revenue), None),
+            ("Προμήθεια %", lambda x, r: f"{x[0].commission_percent:.2f}%", None),
+            ("Προμήθεια €", lambda x, r: fmt_eur(x[1]), None),
+            ("Διόδια €", lambda x, r: fmt_eur(x[0].toll_amount), None),
+            ("Φθορά €", lambda x, r: fmt_eur(x[2]), None),
+            ("Κέρδος δρομολογίου", lambda x, r: fmt_eur(x[3]), None),
+            ("Κέρδος/σύγκριση", lambda x, r: fmt_eur(x[4]), None),
+            ("Κέρδος φορτηγού", lambda x, r: fmt_eur(x[5]), None),
+        ])
+        self.table.setAlternatingRowColors(False)
         self.table.verticalHeader().setVisible(False)
         self.table.setColumnHidden(0, True)
-        self.table.cellClicked.connect(self.on_row_clicked)
+        self.table.clicked.connect(lambda idx: self.on_row_clicked(idx.row(), idx.column()))
         root.addWidget(self.table, 1)
 
         form = QGroupBox("Καταχώρηση")
@@ -2815,10 +3913,6 @@ class TripsPage(QWidget):
 
         self.ed_date = QLineEdit(date.today().strftime("%d/%m/%Y"))
         self.cb_truck = QComboBox()
-        # Συνδέουμε την Περίοδο αφού έχουν φτιαχτεί τα widgets (ώστε να μην σκάει στο init)
-        self.period_bar.on_changed = self.set_period
-        # Default: τρέχον έτος, όλοι οι μήνες (να φαίνονται τα δρομολόγια)
-        self.period_bar.set_all_year()
         self.ed_from = QLineEdit()
         self.ed_to = QLineEdit()
         self.sp_trip_km = QSpinBox()
@@ -2840,7 +3934,7 @@ class TripsPage(QWidget):
         grid.addWidget(self.ed_date, 0, 1)
         grid.addWidget(QLabel("Φορτηγό:"), 0, 2)
         grid.addWidget(self.cb_truck, 0, 3)
-        self.cb_driver = QComboBox()
+        self.cb_driver = DriverComboBox('— Χωρίς οδηγό —', self.model.active_drivers)
         grid.addWidget(QLabel("Οδηγός:"), 0, 4)
         grid.addWidget(self.cb_driver, 0, 5)
 
@@ -2897,17 +3991,13 @@ class TripsPage(QWidget):
 
         self.refresh_truck_combo()
         self.refresh_driver_combo()
+        # Συνδέουμε την Περίοδο αφού έχουν φτιαχτεί όλα τα widgets: το refresh τρέχει μόνο με πλήρη σελίδα
+        self.period_bar.on_changed = self.set_period
+        # Default: τρέχον έτος, όλοι οι μήνες (να φαίνονται τα δρομολόγια) + αρχικό refresh αμέσως
+        self.period_bar.set_all_year()
         self.refresh()
 
     def refresh_driver_combo(self, prefer_truck_id: Optional[int] = None, prefer_driver_id: Optional[int] = None):
-        if not hasattr(self, 'cb_driver'):
-            return
-        current = self.cb_driver.currentData()
-        self.cb_driver.blockSignals(True)
-        self.cb_driver.clear()
-        self.cb_driver.addItem('— Χωρίς οδηγό —', None)
-        for d in self.model.active_drivers():
-            self.cb_driver.addItem(d.name, d.did)
         # decide preferred selection
         did = None
         if prefer_driver_id is not None:
@@ -2916,308 +4006,127 @@ class TripsPage(QWidget):
             t = self.model.truck_by_id(prefer_truck_id)
             if t:
                 did = getattr(t, 'main_driver_id', None)
-        if did is not None:
-            idx = self.cb_driver.findData(did)
-            if idx >= 0:
-                self.cb_driver.setCurrentIndex(idx)
-        self.cb_driver.blockSignals(False)
+        with QSignalBlocker(self.cb_driver):
+            if not self.cb_driver.select_did(did):
+                self.cb_driver.setCurrentIndex(0)
 
     def set_period(self, year: int, month: int):
         self.period_year = year
         self.period_month = int(month or 0)
-        self.refresh()
-
-    def _in_period(self, d: date) -> bool:
-        if self.period_year is None:
-            return True
-        if d.year != self.period_year:
-            return False
-        if self.period_month in (0, None):
-            return True
-        return d.month == self.period_month
+        self._refresh_debounce.start()
 
     def suggest_date_for_period(self, year: int, month: int):
         # Μην αλλάζεις αν ο χρήστης έχει ήδη βάλει κάτι μη-κενό
         if month and self.ed_date.text().strip() == "":
             self.ed_date.setText(date(year, month, 1).strftime("%d/%m/%Y"))
 
-    def set_period(self, year: int, month: int):
-        self.period_year = year
-        self.period_month = int(month or 0)
-        self.refresh()
-
-    def _in_period(self, d: date) -> bool:
-        if self.period_year is None:
-            return True
-        if d.year != self.period_year:
-            return False
-        if self.period_month in (0, None):
-            return True
-        return d.month == self.period_month
-
-    def suggest_date_for_period(self, year: int, month: int):
-        if month and self.ed_date.text().strip() == "":
-            self.ed_date.setText(date(year, month, 1).strftime("%d/%m/%Y"))
-
     def refresh_truck_combo(self):
+        if self._truck_combo_version == self.model.trucks_version:
+            return  # ίδια φορτηγά -> ίδιο combo (και η επιλογή μένει ως έχει)
+        self._truck_combo_version = self.model.trucks_version
         current = self.cb_truck.currentData()
         self.cb_truck.blockSignals(True)
         self.cb_truck.clear()
-        for t in sorted(self.model.trucks, key=lambda x: x.plate.lower()):
+        self._truck_combo_idx = {}
+        for t in self.model.trucks_sorted_by_plate():
+            self._truck_combo_idx.setdefault(t.tid, self.cb_truck.count())
             self.cb_truck.addItem(f"{t.plate} {'(ανενεργό)' if not t.active else ''}".strip(), t.tid)
         self.cb_truck.blockSignals(False)
 
         if current is not None:
-            idx = self.cb_truck.findData(current)
+            idx = self._truck_combo_idx.get(current, -1)
             if idx >= 0:
                 self.cb_truck.setCurrentIndex(idx)
     def refresh_truck_filter_combo(self):
         """Combo φίλτρου: μόνο ενεργά φορτηγά + 'Όλα' (data=None)."""
         if not hasattr(self, 'cb_truck_filter'):
             return
+        if self._truck_filter_version == self.model.trucks_version:
+            return
+        self._truck_filter_version = self.model.trucks_version
         current = self.cb_truck_filter.currentData()
         self.cb_truck_filter.blockSignals(True)
         self.cb_truck_filter.clear()
         self.cb_truck_filter.addItem('Όλα τα φορτηγά', None)
-        for t in sorted(self.model.trucks, key=lambda x: x.plate.lower()):
+        self._truck_filter_idx = {}
+        for t in self.model.trucks_sorted_by_plate():
             if getattr(t, 'active', True):
+                self._truck_filter_idx.setdefault(t.tid, self.cb_truck_filter.count())
                 self.cb_truck_filter.addItem(t.plate, t.tid)
-        self.cb_truck_filter.blockSignals(False)
+        # η επαναφορά της επιλογής γίνεται με μπλοκαρισμένα signals: αλλιώς το currentIndexChanged
+        # ξαναζητάει refresh -> ξαναχτίσιμο -> ... για κάθε επιλεγμένο φορτηγό
         try:
             if current is None:
                 self.cb_truck_filter.setCurrentIndex(0)
             else:
-                idx = self.cb_truck_filter.findData(current)
-                self.cb_truck_filter.setCurrentIndex(idx if idx >= 0 else 0)
+                self.cb_truck_filter.setCurrentIndex(self._truck_filter_idx.get(current, 0))
         except Exception:
             pass
+        self.cb_truck_filter.blockSignals(False)
 
 
     def refresh(self):
+        self._refresh_debounce.stop()  # άμεσο refresh καλύπτει και όποιο εκκρεμεί
+        p_lo, p_hi = period_ord_range(self.period_year, self.period_month)
         self.refresh_truck_combo()
-        try:
-            self.refresh_truck_filter_combo()
-        except Exception:
-            pass
-        sel_tid = None
-        try:
-            if hasattr(self, 'cb_truck_filter'):
-                data = self.cb_truck_filter.currentData()
-                sel_tid = int(data) if data is not None else None
-        except Exception:
-            sel_tid = None
+        self.cb_driver.sync()  # O(1) αν δεν άλλαξαν οι οδηγοί
+        self.refresh_truck_filter_combo()
+        data = self.cb_truck_filter.currentData()
+        sel_tid = int(data) if data is not None else None
 
         # Αν υπάρχει επιλεγμένο φορτηγό στο φίλτρο, "κλείδωσε" τη φόρμα καταχώρησης εκεί
         # ώστε να μην εμφανίζονται μηνύματα τύπου "δεν υπάρχει επιλεγμένο φορτηγό"
-        try:
-            if sel_tid is not None and hasattr(self, 'cb_truck'):
-                idx = self.cb_truck.findData(sel_tid)
-                if idx >= 0:
-                    self.cb_truck.setCurrentIndex(idx)
-                self.cb_truck.setEnabled(False)
-            elif hasattr(self, 'cb_truck'):
-                self.cb_truck.setEnabled(True)
-        except Exception:
-            pass
-
-        self.table.setRowCount(0)
-
-        # --- Υπολογισμός παγίων ανά χλμ (για "καθαρό" κέρδος ανά δρομολόγιο) ---
-        # Scope: τα trips που προβάλλονται (με τα τρέχοντα φίλτρα περιόδου & φορτηγού)
-        # Πάγια ανά μήνα: fixed_monthly_expenses φορτηγών + ένσημα (όλων) + μισθοί (μόνο monthly)
-        def _month_key(d: date):
-            return (d.year, d.month)
-
-        # μηνιαία κόστη οδηγών (για όλους/μόνο monthly)
-        stamps_per_month = 0.0
-        salary_per_month = 0.0
-        for d in getattr(self.model, 'drivers', []):
-            if not getattr(d, 'active', True):
-                continue
-            stamps_per_month += float(getattr(d, 'stamp_cost', 0.0) or 0.0)
-            mode = str(getattr(d, 'pay_mode', 'monthly') or 'monthly')
-            if mode == 'monthly':
-                salary_per_month += float(getattr(d, 'salary', 0.0) or 0.0)
-
-        # fixed φορτηγών (ανά μήνα) ανάλογα με το φίλτρο
         if sel_tid is not None:
-            t = self.model.truck_by_id(sel_tid)
-            fixed_trucks_per_month = float(getattr(t, 'fixed_monthly_expenses', 0.0) or 0.0) if t and getattr(t, 'active', True) else 0.0
+            idx = self._truck_combo_idx.get(sel_tid, -1)
+            if idx >= 0:
+                self.cb_truck.setCurrentIndex(idx)
+            self.cb_truck.setEnabled(False)
         else:
-            fixed_trucks_per_month = 0.0
-            for t in getattr(self.model, 'trucks', []):
-                if not getattr(t, 'active', True):
-                    continue
-                fixed_trucks_per_month += float(getattr(t, 'fixed_monthly_expenses', 0.0) or 0.0)
-
-        fixed_per_month_total = fixed_trucks_per_month + stamps_per_month + salary_per_month
-
-        # km ανά μήνα (μόνο για τα trips που θα εμφανιστούν)
-        km_by_month = {}
-        for _tr in self.model.trips:
-            if not self._in_period(_tr.trip_date):
-                continue
-            if sel_tid is not None and int(_tr.truck_id) != int(sel_tid):
-                continue
-            mk = _month_key(_tr.trip_date)
-            km_by_month[mk] = km_by_month.get(mk, 0) + int(getattr(_tr, 'trip_km', 0) or 0)
-
-        fixed_per_km_by_month = {}
-        for mk, km in km_by_month.items():
-            if km and km > 0:
-                fixed_per_km_by_month[mk] = fixed_per_month_total / float(km)
-            else:
-                fixed_per_km_by_month[mk] = 0.0
-
-        # --- Truck-specific πάγια/χλμ (κατανομή μισθών & ενσήμων ανά φορτηγό με βάση τα χλμ) ---
-        # Για κάθε μήνα και φορτηγό, μοιράζουμε:
-        # - fixed_monthly_expenses του ίδιου φορτηγού (100% στο φορτηγό)
-        # - stamp_cost όλων των οδηγών (pro-rata στα φορτηγά που δούλεψαν, με βάση χλμ)
-        # - salary μόνο των μηνιαίων οδηγών (pro-rata στα φορτηγά που δούλεψαν, με βάση χλμ)
-        km_truck_month = {}  # (mk, truck_id) -> km
-        km_driver_month = {}  # (mk, driver_id) -> km
-        km_driver_truck_month = {}  # (mk, driver_id, truck_id) -> km
-
-        for _tr in self.model.trips:
-            if not self._in_period(_tr.trip_date):
-                continue
-            if sel_tid is not None and int(_tr.truck_id) != int(sel_tid):
-                continue
-            mk = _month_key(_tr.trip_date)
-            tid = int(getattr(_tr, 'truck_id', 0) or 0)
-            kmv = int(getattr(_tr, 'trip_km', 0) or 0)
-            km_truck_month[(mk, tid)] = km_truck_month.get((mk, tid), 0) + kmv
-            did = getattr(_tr, 'driver_id', None)
-            if did is not None:
-                did = int(did)
-                km_driver_month[(mk, did)] = km_driver_month.get((mk, did), 0) + kmv
-                km_driver_truck_month[(mk, did, tid)] = km_driver_truck_month.get((mk, did, tid), 0) + kmv
-
-        # fixed ανά φορτηγό (μήνα) + κατανεμημένα ένσημα/μισθοί
-        payroll_truck_month = {}  # (mk, truck_id) -> cost
-        for d in getattr(self.model, 'drivers', []):
-            if not getattr(d, 'active', True):
-                continue
-            did = int(getattr(d, 'did', 0) or 0)
-            # κόστος οδηγού ανά μήνα (ένσημα πάντα, μισθός μόνο monthly)
-            stamps = float(getattr(d, 'stamp_cost', 0.0) or 0.0)
-            mode = str(getattr(d, 'pay_mode', 'monthly') or 'monthly')
-            sal = float(getattr(d, 'salary', 0.0) or 0.0) if mode == 'monthly' else 0.0
-            driver_month_cost = stamps + sal
-            if driver_month_cost == 0.0:
-                continue
-
-            # κατανομή ανά μήνα με βάση τα χλμ του οδηγού
-            # Για κάθε μήνα που εμφανίζεται σε km_driver_month:
-            for (mk, _did), km_total in list(km_driver_month.items()):
-                if _did != did:
-                    continue
-                if not km_total:
-                    continue
-                # find all trucks for this driver-month
-                for (mk2, did2, tid2), km_part in km_driver_truck_month.items():
-                    if mk2 != mk or did2 != did:
-                        continue
-                    if not km_part:
-                        continue
-                    share = driver_month_cost * (float(km_part) / float(km_total))
-                    payroll_truck_month[(mk, tid2)] = payroll_truck_month.get((mk, tid2), 0.0) + share
-
-        fixed_per_km_truck_month = {}  # (mk, truck_id) -> €/km
-        for (mk, tid), km in km_truck_month.items():
-            # fixed του φορτηγού
-            t = self.model.truck_by_id(int(tid))
-            fixed_truck = float(getattr(t, 'fixed_monthly_expenses', 0.0) or 0.0) if t and getattr(t, 'active', True) else 0.0
-            fixed_total = fixed_truck + float(payroll_truck_month.get((mk, tid), 0.0) or 0.0)
-            if km and km > 0:
-                fixed_per_km_truck_month[(mk, tid)] = fixed_total / float(km)
-            else:
-                fixed_per_km_truck_month[(mk, tid)] = 0.0
-
-        total_net_profit_truck = 0.0
-        trips_count = 0
-
-        for tr in sorted(self.model.trips, key=lambda x: (x.trip_date, x.trip_id), reverse=True):
-            if not self._in_period(tr.trip_date):
-                continue
-            if sel_tid is not None and int(tr.truck_id) != int(sel_tid):
-                continue
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.table.setItem(r, 0, QTableWidgetItem(str(tr.trip_id)))
-            self.table.setItem(r, 1, QTableWidgetItem(fmt_date(tr.trip_date)))
-            self.table.setItem(r, 2, QTableWidgetItem(self.model.truck_label(tr.truck_id)))
-            self.table.setItem(r, 3, QTableWidgetItem(self.model.driver_label(getattr(tr, "driver_id", None))))
-            self.table.setItem(r, 4, QTableWidgetItem(tr.origin))
-            self.table.setItem(r, 5, QTableWidgetItem(tr.destination))
-            self.table.setItem(r, 6, QTableWidgetItem(str(tr.trip_km)))
-            self.table.setItem(r, 7, QTableWidgetItem(fmt_eur(tr.revenue)))
-            self.table.setItem(r, 8, QTableWidgetItem(f"{tr.commission_percent:.2f}%"))
-            comm_amount = tr.revenue * (tr.commission_percent / 100.0)
-            self.table.setItem(r, 9, QTableWidgetItem(fmt_eur(comm_amount)))
-            self.table.setItem(r, 10, QTableWidgetItem(fmt_eur(getattr(tr, "toll_amount", 0.0) or 0.0)))
-
-            wear_rate = float(self.model.wear_rate_for_truck(getattr(tr, "truck_id", None)) or 0.0)
-            wear_cost = float(getattr(tr, "trip_km", 0) or 0) * wear_rate
-            self.table.setItem(r, 11, QTableWidgetItem(fmt_eur(wear_cost)))
-
-            # --- Κέρδος δρομολογίου ---
-            tolls = float(getattr(tr, "toll_amount", 0.0) or 0.0)
-            commission = float(comm_amount or 0.0)
-            driver_pay = float(getattr(tr, "driver_pay", 0.0) or 0.0)
-
-            # καύσιμα: άθροισμα εξόδων καυσίμων για ίδιο φορτηγό & ίδια ημερομηνία
-            fuel_cost_trip = 0.0
-            for f in getattr(self.model, 'fuels', []):
-                try:
-                    if int(getattr(f, 'truck_id', -1)) == int(tr.truck_id) and getattr(f, 'fuel_date', None) == tr.trip_date:
-                        fuel_cost_trip += float(getattr(f, 'cost', 0.0) or 0.0)
-                except Exception:
-                    pass
-
-            gross_profit = float(tr.revenue or 0.0) - commission - tolls - wear_cost - fuel_cost_trip - driver_pay
-
-            mk = (tr.trip_date.year, tr.trip_date.month)
-            fixed_per_km = float(fixed_per_km_by_month.get(mk, 0.0) or 0.0)
-            fixed_share = fixed_per_km * float(getattr(tr, 'trip_km', 0) or 0.0)
-
-            net_profit = gross_profit - fixed_share
-
-            self.table.setItem(r, 12, QTableWidgetItem(fmt_eur(gross_profit)))
-            self.table.setItem(r, 13, QTableWidgetItem(fmt_eur(net_profit)))
-
-            # Καθαρό κέρδος με πάγια/χλμ ανά φορτηγό (κατανομή μισθών & ενσήμων)
-            tid = int(getattr(tr, 'truck_id', 0) or 0)
-            fixed_per_km_truck = float(fixed_per_km_truck_month.get((mk, tid), 0.0) or 0.0)
-            fixed_share_truck = fixed_per_km_truck * float(getattr(tr, 'trip_km', 0) or 0.0)
-            net_profit_truck = gross_profit - fixed_share_truck
-            self.table.setItem(r, 14, QTableWidgetItem(fmt_eur(net_profit_truck)))
-            total_net_profit_truck += float(net_profit_truck or 0.0)
-            trips_count += 1
+            self.cb_truck.setEnabled(True)
+
+        # snapshot των δεδομένων στο GUI thread· ο υπολογισμός δεν αγγίζει Qt ούτε τα ζωντανά αντικείμενα
+        # (μόνο τα trips της περιόδου: bisect στο index ημερομηνιών του model, όχι σάρωση όλων).
+        # Το fuel_cost_by_truck_day ξαναχτίζεται ως νέο dict σε αλλαγή, δεν πειράζεται in-place.
+        period_trips = self.model.trips_in_range(p_lo, p_hi)
+        args = trip_rows_snapshot(period_trips, self.model.drivers, self.model.trucks) + (
+            sel_tid, self.model.fuel_cost_by_truck_day()) + self.model.wear_rates_by_truck()
+        self._rows_gen += 1
+        if len(period_trips) >= TRIPS_ASYNC_MIN_ROWS:
+            self._rows_args = args
+            QThreadPool.globalInstance().start(_TripRowsRunnable(self._rows_notifier, self._rows_gen, args))
+            return
+        self._rows_args = None
+        rows, total = compute_trip_rows(*args)
+        self._apply_rows(self._rows_gen, rows, total)
+
+    def _rows_failed(self, gen: int):
+        # ο worker απέτυχε: ίδιος υπολογισμός στο GUI thread, ώστε να μη μείνουν οι παλιές γραμμές/KPI
+        # (αν αποτύχει κι εδώ, το σφάλμα φαίνεται όπως σε κάθε sync refresh)
+        if gen != self._rows_gen or self._rows_args is None:
+            return  # νεότερο refresh έχει ήδη ξεκινήσει
+        args, self._rows_args = self._rows_args, None
+        rows, total = compute_trip_rows(*args)
+        self._apply_rows(gen, rows, total)
+
+    def _apply_rows(self, gen: int, rows: list, total_net_profit_truck: float):
+        if gen != self._rows_gen:
+            return  # αποτέλεσμα παλαιότερου refresh
+        self._rows_args = None
+        self.table_model.set_rows(rows)
 
         # Ενημέρωση KPI: σύνολο κέρδους (καθαρό/φορτηγό) για τα εμφανιζόμενα δρομολόγια
-        try:
-            if hasattr(self, "lbl_total_net_profit_truck"):
-                self.lbl_total_net_profit_truck.setText(
-                    f"Σύνολο Κέρδος φορτηγού: {fmt_eur(total_net_profit_truck)}  (Δρομολόγια: {trips_count})"
-                )
-        except Exception:
-            pass
+        self.lbl_total_net_profit_truck.setText(
+            f"Σύνολο Κέρδος φορτηγού: {fmt_eur(total_net_profit_truck)}  (Δρομολόγια: {len(rows)})"
+        )
 
-        self.table.resizeColumnsToContents()
-        try:
-            self._hide_odometer_column_if_exists()
-        except Exception:
-            pass
+        resize_columns_once(self.table)
 
     def on_row_clicked(self, row: int, col: int):
-        trip_id = int(self.table.item(row, 0).text())
-        tr = next((x for x in self.model.trips if x.trip_id == trip_id), None)
-        if not tr:
-            return
+        tr = self.table_model.row_obj(row)[0]
+        trip_id = tr.trip_id
         self.selected_trip_id = trip_id
         self.ed_date.setText(fmt_date(tr.trip_date))
-        idx = self.cb_truck.findData(tr.truck_id)
+        idx = self._truck_combo_idx.get(tr.truck_id, -1)
         if idx >= 0:
             self.cb_truck.setCurrentIndex(idx)
         self.ed_from.setText(tr.origin)
@@ -3284,19 +4193,10 @@ class TripsPage(QWidget):
         return None
 
     def _calc_driver_pay(self, driver_id: Optional[int]) -> float:
-        """Υπολογίζει αμοιβή οδηγού ανά δρομολόγιο.
-        - Αν ο οδηγός είναι per_trip => επιστρέφει pay_per_trip
-        - Αν είναι monthly ή δεν υπάρχει οδηγός => 0
-        """
+        """Αμοιβή οδηγού ανά δρομολόγιο (βλ. TrucksModel.per_trip_pay)."""
         if driver_id is None:
             return 0.0
-        d = self.model.driver_by_id(int(driver_id))
-        if not d:
-            return 0.0
-        mode = str(getattr(d, 'pay_mode', 'monthly') or 'monthly')
-        if mode != 'per_trip':
-            return 0.0
-        return float(getattr(d, 'pay_per_trip', 0.0) or 0.0)
+        return self.model.per_trip_pay(int(driver_id))
 
     def add_trip(self):
         tid = self._get_selected_truck_id()
@@ -3324,21 +4224,20 @@ class TripsPage(QWidget):
             driver_pay=self._calc_driver_pay(self.cb_driver.currentData()),
         )
         self.model.next_trip_id += 1
-        self.model.trips.append(tr)
+        self.model.add_trip(tr)
 
         # ΣΗΜΑΝΤΙΚΟ: Δεν ενημερώνουμε αυτόματα το χιλιομετρητή του μητρώου.
         # Το odometer_km παραμένει ανεξάρτητο, όπως ζήτησες.
 
         self.model.schedule_save()
-        self.on_changed()
-        self.refresh()
+        self.on_changed()  # refresh της σελίδας από το TruckWindow (ένα, coalesced)
         self.clear_form()
 
     def update_trip(self):
         if self.selected_trip_id is None:
             QMessageBox.information(self, "Επιλογή", "Διάλεξε γραμμή για ενημέρωση.")
             return
-        tr = next((x for x in self.model.trips if x.trip_id == self.selected_trip_id), None)
+        tr = self.model.trip_by_id(self.selected_trip_id)
         if not tr:
             return
         tid = self._get_selected_truck_id()
@@ -3362,23 +4261,36 @@ class TripsPage(QWidget):
         tr.commission_percent = float(self.sp_commission.value())
         tr.toll_amount = float(self.sp_tolls.value())
         tr.notes = self.ed_notes.text().strip()
+        self.model.mark_entity_dirty(tr)
+        self.model.trips_changed()
 
         self.model.schedule_save()
-        self.on_changed()
-        self.refresh()
+        self.on_changed()  # refresh της σελίδας από το TruckWindow (ένα, coalesced)
 
     def delete_trip(self):
         if self.selected_trip_id is None:
             QMessageBox.information(self, "Επιλογή", "Διάλεξε γραμμή για διαγραφή.")
             return
-        self.model.trips = [x for x in self.model.trips if x.trip_id != self.selected_trip_id]
+        self.model.remove_trip(self.selected_trip_id)
         self.selected_trip_id = None
         self.model.schedule_save()
-        self.on_changed()
-        self.refresh()
+        self.on_changed()  # refresh της σελίδας από το TruckWindow (ένα, coalesced)
         self.clear_form()
 
 
+class ExpenseRow(NamedTuple):
+    """Γραμμή του πίνακα Καύσιμα/Έξοδα (καύσιμο ή προμήθεια/διόδια/φθορά από δρομολόγιο)."""
+    kind: str  # fuel | commission | toll | wear
+    id: int  # fuel_id ή trip_id (για τα παραγόμενα από δρομολόγια)
+    date: date
+    truck_id: int
+    type_label: str
+    liters: Optional[float]
+    amount: float
+    source: str
+    receipt: str
+
+
 class FuelPage(QWidget):
     def refresh_driver_combo(self, prefer_truck_id=None, prefer_driver_id=None):
         """Safe no-op: FuelPage doesn't use drivers directly.
@@ -3389,12 +4301,7 @@ class FuelPage(QWidget):
             cb = getattr(self, 'cb_driver', None)
             if cb is None:
                 return
-            cb.blockSignals(True)
-            cb.clear()
-            cb.addItem('— Χωρίς οδηγό —', None)
-            for d in self.model.active_drivers():
-                cb.addItem(d.name, d.did)
-            cb.blockSignals(False)
+            cb.sync()
         except Exception:
             pass
 
@@ -3405,7 +4312,7 @@ class FuelPage(QWidget):
         self.period_month: int = 0
         self.on_changed = on_changed
         self.selected_fuel_id: Optional[int] = None
-        self.row_meta: List[Dict[str, Any]] = []  # [{"kind": "fuel|commission", "id": int}]
+        self.selected_row: int = -1  # γραμμή πίνακα του selected_fuel_id (για ενημέρωση μόνο αυτής)
         self.selected_kind: str = "fuel"
         self.period_year: Optional[int] = None
         self.period_month: int = 0
@@ -3422,24 +4329,22 @@ class FuelPage(QWidget):
         except Exception:
             pass
 
-        def _hide_odometer_column_if_exists():
-            try:
-                headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
-                for i, h in enumerate(headers):
-                    if "Χιλιομετρητ" in h or "odometer" in h.lower():
-                        self.table.setColumnHidden(i, True)
-            except Exception:
-                pass
-        self._hide_odometer_column_if_exists = _hide_odometer_column_if_exists
-
 
-        self.table = QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels(["ID", "Ημ/νία", "Φορτηγό", "Είδος", "Λίτρα", "Ποσό (€)", "Πηγή/Πρατήριο", "Παραστατικό"])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # γραμμές: τα ExpenseRow του refresh· τα κείμενα μόνο για ό,τι ζωγραφίζεται
+        self.table, self.table_model = make_rows_table([
+            ("ID", lambda it, r: str(it.id), None),
+            ("Ημ/νία", lambda it, r: fmt_date(it.date), None),
+            ("Φορτηγό", lambda it, r: self.model.truck_label(it.truck_id), None),
+            ("Είδος", lambda it, r: it.type_label, None),
+            ("Λίτρα", lambda it, r: "" if it.liters is None else f"{float(it.liters):.2f}", None),
+            ("Ποσό (€)", lambda it, r: fmt_eur(float(it.amount)), None),
+            ("Πηγή/Πρατήριο", lambda it, r: it.source, None),
+            ("Παραστατικό", lambda it, r: it.receipt, None),
+        ])
+        self.table.setAlternatingRowColors(False)
         self.table.verticalHeader().setVisible(False)
         self.table.setColumnHidden(0, True)
-        self.table.cellClicked.connect(self.on_row_clicked)
+        self.table.clicked.connect(lambda idx: self.on_row_clicked(idx.row(), idx.column()))
         root.addWidget(self.table, 1)
 
         form = QGroupBox("Καταχώρηση")
@@ -3447,6 +4352,9 @@ class FuelPage(QWidget):
 
         self.ed_date = QLineEdit(date.today().strftime("%d/%m/%Y"))
         self.cb_truck = QComboBox()
+        # model.trucks_version του περιεχομένου του combo (-1 = να χτιστεί) + tid -> index γραμμής
+        self._truck_combo_version = -1
+        self._truck_combo_idx: Dict[int, int] = {}
         self.sp_liters = QDoubleSpinBox()
         self.sp_liters.setRange(0, 100000)
         self.sp_liters.setDecimals(2)
@@ -3461,7 +4369,7 @@ class FuelPage(QWidget):
         grid.addWidget(self.ed_date, 0, 1)
         grid.addWidget(QLabel("Φορτηγό:"), 0, 2)
         grid.addWidget(self.cb_truck, 0, 3)
-        self.cb_driver = QComboBox()
+        self.cb_driver = DriverComboBox('— Χωρίς οδηγό —', self.model.active_drivers)
         grid.addWidget(QLabel("Οδηγός:"), 0, 4)
         grid.addWidget(self.cb_driver, 0, 5)
 
@@ -3509,151 +4417,132 @@ class FuelPage(QWidget):
         self.period_month = int(month or 0)
         self.refresh()
 
-    def _in_period(self, d: date) -> bool:
-        if self.period_year is None:
-            return True
-        if d.year != self.period_year:
-            return False
-        if self.period_month in (0, None):
-            return True
-        return d.month == self.period_month
-
     def suggest_date_for_period(self, year: int, month: int):
         # Μην αλλάζεις αν ο χρήστης έχει ήδη βάλει κάτι μη-κενό
         if month and self.ed_date.text().strip() == "":
             self.ed_date.setText(date(year, month, 1).strftime("%d/%m/%Y"))
 
     def refresh_truck_combo(self):
+        if self._truck_combo_version == self.model.trucks_version:
+            return  # ίδια φορτηγά -> ίδιο combo (και η επιλογή μένει ως έχει)
+        self._truck_combo_version = self.model.trucks_version
         current = self.cb_truck.currentData()
         self.cb_truck.blockSignals(True)
         self.cb_truck.clear()
-        for t in sorted(self.model.trucks, key=lambda x: x.plate.lower()):
+        self._truck_combo_idx = {}
+        for t in self.model.trucks_sorted_by_plate():
+            self._truck_combo_idx.setdefault(t.tid, self.cb_truck.count())
             self.cb_truck.addItem(f"{t.plate} {'(ανενεργό)' if not t.active else ''}".strip(), t.tid)
         self.cb_truck.blockSignals(False)
 
         if current is not None:
-            idx = self.cb_truck.findData(current)
+            idx = self._truck_combo_idx.get(current, -1)
             if idx >= 0:
                 self.cb_truck.setCurrentIndex(idx)
 
+    @staticmethod
+    def _fuel_row(fu: 'FuelExpense') -> ExpenseRow:
+        return ExpenseRow(
+            kind="fuel",
+            id=fu.fuel_id,
+            date=fu.fuel_date,
+            truck_id=fu.truck_id,
+            type_label="Καύσιμο",
+            liters=fu.liters,
+            amount=fu.liters * fu.cost,
+            source=fu.station,
+            receipt=fu.receipt,
+        )
+
+    @staticmethod
+    def _toll_row(tr: 'Trip', src: str) -> ExpenseRow:
+        return ExpenseRow(
+            kind="toll",
+            id=tr.trip_id,
+            date=tr.trip_date,
+            truck_id=tr.truck_id,
+            type_label="Διόδια",
+            liters=None,
+            amount=tr.toll_amount,
+            source=src.strip(),
+            receipt="",
+        )
+
     def refresh(self):
+        p_lo, p_hi = period_ord_range(self.period_year, self.period_month)
         self.refresh_truck_combo()
-        self.table.setRowCount(0)
-        self.row_meta = []
+        self.cb_driver.sync()  # O(1) αν δεν άλλαξαν οι οδηγοί
+
+        items: List[ExpenseRow] = []
+        add = items.append
+
+        # Καύσιμα/έξοδα (καταχωρήσεις χρήστη): slice περιόδου με bisect σε ordinals
+        for fu in self.model.fuels_in_range(p_lo, p_hi):
+            add(self._fuel_row(fu))
+
+        # Προμήθειες / διόδια / φθορές δρομολογίων (παράγονται από τα Δρομολόγια): 0-3 γραμμές ανά trip
+        # της περιόδου (slice με bisect). Τα διόδια μπαίνουν για όλα τα trips (όπως πριν, χωρίς φίλτρο
+        # περιόδου) -> δεύτερο πέρασμα μόνο για τα διόδια εκτός περιόδου.
+        wear_by_tid, wear_default = self.model.wear_rates_by_truck()  # μία φορά, όχι ανά trip
+        # τα πεδία του Trip είναι τυπωμένα από load/φόρμα (int/float): απευθείας attributes, ένα load ανά πεδίο
+        for tr in self.model.trips_in_range(p_lo, p_hi):
+            trip_id, d, tid = tr.trip_id, tr.trip_date, tr.truck_id
+            pct, revenue, toll = tr.commission_percent, tr.revenue, tr.toll_amount
+            src = f"Δρομολόγιο #{trip_id}: {tr.origin} → {tr.destination}"
+            if pct > 0 and revenue > 0:
+                add(ExpenseRow(
+                    kind="commission",
+                    id=trip_id,  # αναφορά στο δρομολόγιο
+                    date=d,
+                    truck_id=tid,
+                    type_label=f"Προμήθεια ({pct:.2f}%)",
+                    liters=None,
+                    amount=revenue * (pct / 100.0),
+                    source=src.strip(),
+                    receipt="",
+                ))
 
-        items: List[Dict[str, Any]] = []
+            if toll > 0:
+                add(self._toll_row(tr, src))
 
-        # Καύσιμα/έξοδα (καταχωρήσεις χρήστη)
-        for fu in self.model.fuels:
-            if not self._in_period(fu.fuel_date):
-                continue
-            items.append({
-                "kind": "fuel",
-                "id": fu.fuel_id,
-                "date": fu.fuel_date,
-                "truck_id": fu.truck_id,
-                "type_label": "Καύσιμο",
-                "liters": fu.liters,
-                "amount": float(fu.liters or 0.0) * float(fu.cost or 0.0),
-                "source": fu.station,
-                "receipt": fu.receipt,
-            })
-
-        # Προμήθειες δρομολογίων (παράγονται από τα Δρομολόγια)
-        for tr in self.model.trips:
-            if not self._in_period(tr.trip_date):
-                continue
-            pct = float(getattr(tr, "commission_percent", 0.0) or 0.0)
-            if pct <= 0 or tr.revenue <= 0:
-                continue
-            amount = float(tr.revenue) * (pct / 100.0)
-            items.append({
-                "kind": "commission",
-                "id": tr.trip_id,  # αναφορά στο δρομολόγιο
-                "date": tr.trip_date,
-                "truck_id": tr.truck_id,
-                "type_label": f"Προμήθεια ({pct:.2f}%)",
-                "liters": None,
-                "amount": amount,
-                "source": f"Δρομολόγιο #{tr.trip_id}: {tr.origin} → {tr.destination}".strip(),
-                "receipt": "",
-            })
-
-
-        # Διόδια δρομολογίων (παράγονται από τα Δρομολόγια)
-        for tr in self.model.trips:
-            toll = float(getattr(tr, "toll_amount", 0.0) or 0.0)
-            if toll <= 0:
-                continue
-            items.append({
-                "kind": "toll",
-                "id": tr.trip_id,  # αναφορά στο δρομολόγιο
-                "date": tr.trip_date,
-                "truck_id": tr.truck_id,
-                "type_label": "Διόδια",
-                "liters": None,
-                "amount": toll,
-                "source": f"Δρομολόγιο #{tr.trip_id}: {tr.origin} → {tr.destination}".strip(),
-                "receipt": "",
-            })
-
-        # Φθορές (€/χλμ) δρομολογίων (παράγονται από τα Δρομολόγια)
-        for tr in self.model.trips:
-            if not self._in_period(tr.trip_date):
-                continue
-            km = int(getattr(tr, "trip_km", 0) or 0)
+            # Φθορά (€/χλμ)
+            km = tr.trip_km
             if km <= 0:
                 continue
-            rate = float(self.model.wear_rate_for_truck(getattr(tr, "truck_id", None)) or 0.0)
+            rate = wear_by_tid.get(tid, wear_default)
             if rate <= 0:
                 continue
-            amount = float(km) * rate
-            items.append({
-                "kind": "wear",
-                "id": tr.trip_id,
-                "date": tr.trip_date,
-                "truck_id": tr.truck_id,
-                "type_label": f"Φθορά ({rate:.3f} €/χλμ)",
-                "liters": None,
-                "amount": amount,
-                "source": f"Δρομολόγιο #{tr.trip_id}: {tr.origin} → {tr.destination} ({km} χλμ)".strip(),
-                "receipt": "",
-            })
-
-        items.sort(key=lambda x: (x["date"], x["kind"], x["id"]), reverse=True)
-
-        for it in items:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.row_meta.append({"kind": it["kind"], "id": it["id"]})
-
-            # ID (κρυφό)
-            shown_id = str(it["id"])
-            self.table.setItem(r, 0, QTableWidgetItem(shown_id))
-
-            self.table.setItem(r, 1, QTableWidgetItem(fmt_date(it["date"])))
-            self.table.setItem(r, 2, QTableWidgetItem(self.model.truck_label(it["truck_id"])))
-            self.table.setItem(r, 3, QTableWidgetItem(it["type_label"]))
-            self.table.setItem(r, 4, QTableWidgetItem("" if it["liters"] is None else f"{float(it['liters']):.2f}"))
-            self.table.setItem(r, 5, QTableWidgetItem(fmt_eur(float(it["amount"]))))
-            self.table.setItem(r, 6, QTableWidgetItem(it["source"]))
-            self.table.setItem(r, 7, QTableWidgetItem(it["receipt"]))
-
-        self.table.resizeColumnsToContents()
-        try:
-            self._hide_odometer_column_if_exists()
-        except Exception:
-            pass
+            add(ExpenseRow(
+                kind="wear",
+                id=trip_id,
+                date=d,
+                truck_id=tid,
+                type_label=f"Φθορά ({rate:.3f} €/χλμ)",
+                liters=None,
+                amount=km * rate,
+                source=f"{src} ({km} χλμ)".strip(),
+                receipt="",
+            ))
+
+        d_lo, d_hi = period_date_range(self.period_year, self.period_month)
+        for tr in self.model.trips:
+            if tr.toll_amount > 0 and not (d_lo <= tr.trip_date < d_hi):
+                add(self._toll_row(tr, f"Δρομολόγιο #{tr.trip_id}: {tr.origin} → {tr.destination}"))
+
+        items.sort(key=itemgetter(2, 0, 1), reverse=True)  # (date, kind, id)
+        self.table_model.set_rows(items)
+
+        resize_columns_once(self.table)
 
     def on_row_clicked(self, row: int, col: int):
-        if row < 0 or row >= len(self.row_meta):
+        if row < 0 or row >= self.table_model.rowCount():
             return
-        meta = self.row_meta[row]
-        kind = meta.get("kind")
+        meta = self.table_model.row_obj(row)
+        kind = meta.kind
         self.selected_kind = str(kind)
 
         if kind == "commission":
-            trip_id = int(meta.get("id"))
+            trip_id = int(meta.id)
             self.selected_fuel_id = None
             self.clear_form()
             QMessageBox.information(
@@ -3665,7 +4554,7 @@ class FuelPage(QWidget):
             return
 
         if kind == "toll":
-            trip_id = int(meta.get("id"))
+            trip_id = int(meta.id)
             self.selected_fuel_id = None
             self.clear_form()
             QMessageBox.information(
@@ -3677,7 +4566,7 @@ class FuelPage(QWidget):
             return
 
         if kind == "wear":
-            trip_id = int(meta.get("id"))
+            trip_id = int(meta.id)
             self.selected_fuel_id = None
             self.clear_form()
             QMessageBox.information(
@@ -3688,13 +4577,14 @@ class FuelPage(QWidget):
             )
             return
 
-        fuel_id = int(meta.get("id"))
-        fu = next((x for x in self.model.fuels if x.fuel_id == fuel_id), None)
+        fuel_id = int(meta.id)
+        fu = self.model.fuel_by_id(fuel_id)
         if not fu:
             return
         self.selected_fuel_id = fuel_id
+        self.selected_row = row
         self.ed_date.setText(fmt_date(fu.fuel_date))
-        idx = self.cb_truck.findData(fu.truck_id)
+        idx = self._truck_combo_idx.get(fu.truck_id, -1)
         if idx >= 0:
             self.cb_truck.setCurrentIndex(idx)
         self.sp_liters.setValue(fu.liters)
@@ -3723,21 +4613,6 @@ class FuelPage(QWidget):
             return None
         return int(self.cb_truck.currentData())
 
-    def _calc_driver_pay(self, driver_id: Optional[int]) -> float:
-        """Υπολογίζει αμοιβή οδηγού ανά δρομολόγιο.
-        - Αν ο οδηγός είναι per_trip => επιστρέφει pay_per_trip
-        - Αν είναι monthly ή δεν υπάρχει οδηγός => 0
-        """
-        if driver_id is None:
-            return 0.0
-        d = self.model.driver_by_id(int(driver_id))
-        if not d:
-            return 0.0
-        mode = str(getattr(d, 'pay_mode', 'monthly') or 'monthly')
-        if mode != 'per_trip':
-            return 0.0
-        return float(getattr(d, 'pay_per_trip', 0.0) or 0.0)
-
     def add_fuel(self):
         tid = self._get_selected_truck_id()
         if tid is None:
@@ -3761,17 +4636,16 @@ class FuelPage(QWidget):
             driver_id=(self.cb_driver.currentData() if hasattr(self, 'cb_driver') else None),
         )
         self.model.next_fuel_id += 1
-        self.model.fuels.append(fu)
+        self.model.add_fuel(fu)
         self.model.schedule_save()
-        self.on_changed()
-        self.refresh()
+        self.on_changed()  # refresh της σελίδας από το TruckWindow (ένα, coalesced)
         self.clear_form()
 
     def update_fuel(self):
         if self.selected_fuel_id is None:
             QMessageBox.information(self, "Επιλογή", "Διάλεξε γραμμή για ενημέρωση.")
             return
-        fu = next((x for x in self.model.fuels if x.fuel_id == self.selected_fuel_id), None)
+        fu = self.model.fuel_by_id(self.selected_fuel_id)
         if not fu:
             return
         tid = self._get_selected_truck_id()
@@ -3784,6 +4658,7 @@ class FuelPage(QWidget):
             QMessageBox.warning(self, "Σφάλμα", str(e))
             return
 
+        old_date = fu.fuel_date
         fu.truck_id = tid
         fu.fuel_date = d
         fu.driver_id = (self.cb_driver.currentData() if hasattr(self, 'cb_driver') else None)
@@ -3792,60 +4667,106 @@ class FuelPage(QWidget):
         fu.station = self.ed_station.text().strip()
         fu.receipt = self.ed_receipt.text().strip()
         fu.notes = self.ed_notes.text().strip()
+        self.model.mark_entity_dirty(fu)
+        self.model.fuels_changed()
 
         self.model.schedule_save()
-        self.on_changed()
-        self.refresh()
+        # ίδια ημερομηνία -> ίδια θέση (sort) και ίδια περίοδος: αλλάζει μόνο η γραμμή του (dataChanged),
+        # όχι ολόκληρος ο πίνακας. Αλλιώς full refresh.
+        row = self.selected_row
+        if (d == old_date and 0 <= row < self.table_model.rowCount()
+                and self.table_model.row_obj(row)[:2] == ("fuel", fu.fuel_id)):
+            self.table_model.update_row(row, self._fuel_row(fu))
+        else:
+            self.on_changed()  # refresh της σελίδας από το TruckWindow (ένα, coalesced)
 
     def delete_fuel(self):
         if self.selected_fuel_id is None:
             QMessageBox.information(self, "Επιλογή", "Διάλεξε γραμμή για διαγραφή.")
             return
-        self.model.fuels = [x for x in self.model.fuels if x.fuel_id != self.selected_fuel_id]
+        self.model.remove_fuel(self.selected_fuel_id)
         self.selected_fuel_id = None
         self.model.schedule_save()
-        self.on_changed()
-        self.refresh()
+        self.on_changed()  # refresh της σελίδας από το TruckWindow (ένα, coalesced)
         self.clear_form()
 
 
-class TrucksSummaryPage(QWidget):
-    def _clear_totals(self):
-        try:
-            while self._totals_grid.count():
-                item = self._totals_grid.takeAt(0)
-                w = item.widget()
-                if w is not None:
-                    w.deleteLater()
-        except Exception:
-            pass
+def summary_totals(trips: List[Trip], fuels: List[FuelExpense],
+                   wear_by_tid: Dict[int, float], wear_default: float) -> tuple:
+    """Αθροίσματα της Σύνοψης σε ένα πέρασμα ανά λίστα (χωρίς Qt):
+    (km, έσοδα, προμήθειες, διόδια, φθορές, αμοιβές ανά δρομολόγιο, λίτρα, κόστος καυσίμων)."""
+    km = 0
+    rev = commission = tolls = wear = per_trip_pay = 0
+    wear_get = wear_by_tid.get
+    # τα πεδία είναι τυπωμένα από load/φόρμα (int/float με default 0): απευθείας attributes, χωρίς or/float()
+    for t in trips:
+        t_km, t_rev = t.trip_km, t.revenue
+        km += t_km
+        rev += t_rev
+        commission += t_rev * t.commission_percent / 100.0
+        tolls += t.toll_amount
+        wear += t_km * wear_get(t.truck_id, wear_default)
+        per_trip_pay += t.driver_pay
+    liters = cost_fuel = 0
+    for f in fuels:
+        liters += f.liters
+        cost_fuel += f.liters * f.cost
+    return km, rev, commission, tolls, wear, per_trip_pay, liters, cost_fuel
+
 
+class TrucksSummaryPage(QWidget):
     def _add_section(self, row: int, title: str) -> int:
         lbl = QLabel(title)
         lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        lbl.setStyleSheet("font-weight: 700; margin-top: 8px;")
+        set_label_role(lbl, "kv-section")
         self._totals_grid.addWidget(lbl, row, 0, 1, 2)
         return row + 1
 
-    def _add_kv(self, row: int, k: str, v: str, *, bold_value: bool = False) -> int:
+    def _add_kv(self, row: int, key: str, k: str, *, bold_value: bool = False) -> int:
+        """Γραμμή KPI· η τιμή (self._kpi[key]) ενημερώνεται με setText στο refresh."""
         lk = QLabel(k)
-        lv = QLabel(v)
+        lv = QLabel("")
         lk.setTextInteractionFlags(Qt.TextSelectableByMouse)
         lv.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        lv.setAlignment(Qt.AlignVCenter | Qt.AlignRight)
+        lv.setAlignment(ALIGN_RIGHT)
         if bold_value:
-            lv.setStyleSheet("font-weight: 700;")
+            set_label_role(lv, "kv-bold")
         self._totals_grid.addWidget(lk, row, 0)
         self._totals_grid.addWidget(lv, row, 1)
+        self._kpi[key] = lv
         return row + 1
 
+    def _build_totals(self):
+        # μία φορά στο __init__: τα labels μένουν, το refresh αλλάζει μόνο κείμενο (όχι delete/recreate)
+        self._kpi: Dict[str, QLabel] = {}
+        r = 0
+        r = self._add_section(r, "Κίνηση")
+        r = self._add_kv(r, "trips", "Δρομολόγια")
+        r = self._add_kv(r, "km", "Σύνολο χλμ")
+        r = self._add_kv(r, "liters", "Σύνολο λίτρων")
+
+        r = self._add_section(r, "Έσοδα")
+        r = self._add_kv(r, "revenue", "Σύνολο εσόδων", bold_value=True)
+
+        r = self._add_section(r, "Κόστη")
+        r = self._add_kv(r, "fuel", "Καύσιμα/Έξοδα")
+        r = self._add_kv(r, "other", "Λοιπά έξοδα (5%)")
+        r = self._add_kv(r, "commission", "Προμήθειες")
+        r = self._add_kv(r, "tolls", "Διόδια")
+        r = self._add_kv(r, "wear", "Φθορές (€/χλμ)")
+        r = self._add_kv(r, "fixed", "Πάγια μηνιαία")
+        r = self._add_kv(r, "stamps", "Ένσημα οδηγών")
+        r = self._add_kv(r, "salary", "Μισθοί οδηγών (μηνιαίοι)")
+        r = self._add_kv(r, "per_trip_pay", "Αμοιβές οδηγών (ανά δρομολόγιο)")
+        r = self._add_kv(r, "cost", "Σύνολο κόστους", bold_value=True)
+
+        r = self._add_section(r, "Αποτέλεσμα")
+        r = self._add_kv(r, "net", "Καθαρό (έσοδα - κόστος)", bold_value=True)
+
     def _on_period_changed(self, year: int, month: int):
         self.period_year = year
         self.period_month = month
-        try:
-            self.refresh()
-        except Exception:
-            pass
+        self._refresh_debounce.start()
 
     def refresh_driver_combo(self, prefer_truck_id=None, prefer_driver_id=None):
         """Safe no-op for compatibility with pages calling this at init.
@@ -3866,6 +4787,11 @@ class TrucksSummaryPage(QWidget):
         set_label_role(title, "section-title")
         root.addWidget(title)
 
+        # γρήγορες αλλαγές περιόδου/φορτηγού -> ένα refresh (trailing, 80 ms)
+        self._refresh_debounce = make_debouncer(self, 80, self.refresh)
+        # _view_key() του τελευταίου refresh (None = δεν έχει γίνει ακόμα)
+        self._shown_key: Optional[tuple] = None
+
         # Μπάρα Περιόδου για τη Σύνοψη
         self.period_bar = PeriodBar(on_changed=self._on_period_changed)
         root.addWidget(self.period_bar)
@@ -3917,6 +4843,7 @@ class TrucksSummaryPage(QWidget):
         self._totals_grid.setColumnStretch(1, 0)
         self._totals_grid.setHorizontalSpacing(14)
         self._totals_grid.setVerticalSpacing(6)
+        self._build_totals()
 
         self._scroll_totals = QScrollArea()
         self._scroll_totals.setWidgetResizable(True)
@@ -3927,13 +4854,12 @@ class TrucksSummaryPage(QWidget):
 
         self.btn_apply.clicked.connect(self.refresh)
         try:
-            self.cb_truck.currentIndexChanged.connect(self.refresh)
-        except Exception:
-            pass
-        try:
-            self.sp_wear_default.valueChanged.connect(self._on_wear_changed)
+            self.cb_truck.currentIndexChanged.connect(lambda _=None: self._refresh_debounce.start())
         except Exception:
             pass
+        # refresh μία φορά όταν σταματήσουν τα βελάκια του spinbox
+        self._wear_debounce = make_debouncer(self, 250, self.refresh)
+        self.sp_wear_default.valueChanged.connect(self._on_wear_changed)
         self.refresh_truck_combo()
         self.refresh_driver_combo()
         self.refresh()
@@ -3941,16 +4867,12 @@ class TrucksSummaryPage(QWidget):
     def set_period(self, year: int, month: int):
         self.period_year = year
         self.period_month = int(month or 0)
-        self.refresh()
+        self._refresh_debounce.start()
 
-    def _in_period(self, d: date) -> bool:
-        if self.period_year is None:
-            return True
-        if d.year != self.period_year:
-            return False
-        if self.period_month in (0, None):
-            return True
-        return d.month == self.period_month
+    def _on_wear_changed(self, _val: float):
+        self.model.wear_rate_per_km = float(self.sp_wear_default.value())
+        self.model.schedule_save()
+        self._wear_debounce.start()
 
     def suggest_date_for_period(self, year: int, month: int):
         # Μην αλλάζεις αν ο χρήστης έχει ήδη βάλει κάτι μη-κενό
@@ -3962,7 +4884,7 @@ class TrucksSummaryPage(QWidget):
         self.cb_truck.blockSignals(True)
         self.cb_truck.clear()
         self.cb_truck.addItem("Όλα", None)
-        for t in sorted(self.model.trucks, key=lambda x: x.plate.lower()):
+        for t in self.model.trucks_sorted_by_plate():
             self.cb_truck.addItem(t.plate, t.tid)
         # Επαναφορά επιλογής χωρίς να πυροδοτείται currentIndexChanged
         if current is not None:
@@ -3971,7 +4893,22 @@ class TrucksSummaryPage(QWidget):
                 self.cb_truck.setCurrentIndex(idx)
         self.cb_truck.blockSignals(False)
 
+    def _view_key(self) -> tuple:
+        # ό,τι καθορίζει το αποτέλεσμα του refresh: δεδομένα model + περίοδος + φίλτρα της σελίδας
+        m = self.model
+        return (m.data_version, m.wear_rate_per_km, self.period_year, self.period_month,
+                self.ed_from.text(), self.ed_to.text(), self.cb_truck.currentData())
+
+    def refresh_if_stale(self):
+        """Για το άνοιγμα της σελίδας: refresh μόνο αν άλλαξε κάτι από το τελευταίο."""
+        if self._view_key() != self._shown_key:
+            self.refresh()
+        else:
+            self._refresh_debounce.stop()
+
     def refresh(self):
+        self._refresh_debounce.stop()  # άμεσο refresh καλύπτει και όποιο εκκρεμεί
+        self._shown_key = self._view_key()
         d_from = None
         d_to = None
         # Αν έχουν συμπληρωθεί ρητά τα πεδία Από/Έως, αυτά υπερισχύουν.
@@ -3985,8 +4922,7 @@ class TrucksSummaryPage(QWidget):
                 d_to = date(y, 12, 31)
             else:
                 # Συγκεκριμένος μήνας
-                import calendar as _cal
-                last_day = _cal.monthrange(y, m)[1]
+                last_day = calendar.monthrange(y, m)[1]
                 d_from = date(y, m, 1)
                 d_to = date(y, m, last_day)
         self.refresh_truck_combo()
@@ -4013,38 +4949,26 @@ class TrucksSummaryPage(QWidget):
                 d_from = date(y, 1, 1)
                 d_to = date(y, 12, 31)
             else:
-                import calendar as _cal
-                last_day = _cal.monthrange(y, m)[1]
+                last_day = calendar.monthrange(y, m)[1]
                 d_from = date(y, m, 1)
                 d_to = date(y, m, last_day)
 
         tid = self.cb_truck.currentData()
         if tid is not None:
             tid = int(tid)
-        trips = self.model.trips
-        fuels = self.model.fuels
+        # εύρος [d_from, d_to] -> bisect στα index ημερομηνιών του model (όχι έλεγχος ανά εγγραφή).
+        # Και χωρίς εύρος παίρνουμε τα ταξινομημένα κατά ημερομηνία index: min/max = πρώτο/τελευταίο
+        lo = d_from.toordinal() if d_from else 0
+        hi = d_to.toordinal() + 1 if d_to else sys.maxsize
+        trips = self.model.trips_in_range(lo, hi)
+        fuels = self.model.fuels_in_range(lo, hi)
         if tid is not None:
             trips = [t for t in trips if t.truck_id == tid]
             fuels = [f for f in fuels if f.truck_id == tid]
 
-        def in_range(d: date) -> bool:
-            if d_from and d < d_from:
-                return False
-            if d_to and d > d_to:
-                return False
-            return True
-
-        trips = [t for t in trips if in_range(t.trip_date)]
-        fuels = [f for f in fuels if in_range(f.fuel_date)]
-
-        total_km = sum(t.trip_km for t in trips)
-        total_rev = sum(t.revenue for t in trips)
+        (total_km, total_rev, total_commission, total_tolls, total_wear, total_per_trip_pay,
+         total_liters, total_cost_fuel) = summary_totals(trips, fuels, *self.model.wear_rates_by_truck())
         total_other_expenses = total_rev * 0.05
-        total_commission = sum((t.revenue * (getattr(t, "commission_percent", 0.0) or 0.0) / 100.0) for t in trips)
-        total_tolls = sum((getattr(t, "toll_amount", 0.0) or 0.0) for t in trips)
-        total_wear = sum((float(getattr(t, "trip_km", 0) or 0) * float(self.model.wear_rate_for_truck(getattr(t, "truck_id", None)) or 0.0)) for t in trips)
-        total_liters = sum(f.liters for f in fuels)
-        total_cost_fuel = sum((float(f.liters or 0.0) * float(f.cost or 0.0)) for f in fuels)
 
 
         # --- Πάγια μηνιαία έξοδα ---
@@ -4058,9 +4982,11 @@ class TrucksSummaryPage(QWidget):
             range_start, range_end = d_from, d_to
         else:
             # Αν δεν δόθηκε εύρος, παράγουμε από τα δεδομένα που φαίνονται στο φίλτρο
-            dates = [t.trip_date for t in trips] + [f.fuel_date for f in fuels]
-            if dates:
-                range_start, range_end = min(dates), max(dates)
+            # (trips/fuels είναι σε σειρά ημερομηνίας -> άκρα των λιστών, χωρίς λίστα dates/min/max)
+            ends = ([trips[0].trip_date, trips[-1].trip_date] if trips else []) + \
+                   ([fuels[0].fuel_date, fuels[-1].fuel_date] if fuels else [])
+            if ends:
+                range_start, range_end = min(ends), max(ends)
             else:
                 # Χωρίς δεδομένα/φίλτρο, θεωρούμε τον τρέχοντα μήνα μόνο
                 today = date.today()
@@ -4077,13 +5003,7 @@ class TrucksSummaryPage(QWidget):
                 fixed_per_month = 0.0
             total_fixed = fixed_per_month * months_in_range
         else:
-            total_fixed = 0.0
-            for t in self.model.trucks:
-                if not t.active:
-                    continue
-                fixed_per_month = float(getattr(t, "fixed_monthly_expenses", 0.0) or 0.0)
-                if fixed_per_month > 0:
-                    total_fixed += fixed_per_month * months_in_range
+            total_fixed = self.model.active_fixed_monthly_sum() * months_in_range
 
         # --- Κόστος οδηγών ---
         # ΣΗΜΑΝΤΙΚΟ: οι μισθοί/ένσημα έχουν ιστορικό ανά μήνα (pay_history).
@@ -4109,29 +5029,20 @@ class TrucksSummaryPage(QWidget):
             t_sel = self.model.truck_by_id(tid)
             did = getattr(t_sel, "main_driver_id", None) if t_sel else None
             if did is not None:
-                for _d in self.model.drivers:
-                    if _d.did == int(did):
-                        if getattr(_d, 'active', True):
-                            selected_driver = _d
-                        break
-
-        drivers_iter = [selected_driver] if selected_driver is not None else ([] if tid is not None else [d for d in self.model.drivers if getattr(d, 'active', True)])
-
-        for yy, mm in _iter_months(range_start, range_end):
-            ym = f"{yy:04d}-{mm:02d}"
-            stamps_month = 0.0
-            salary_month = 0.0
-            for d in drivers_iter:
-                snap = driver_pay_for_month(d, ym)
-                stamps_month += float(snap.get('stamp_cost', 0.0) or 0.0)
-                mode = str(snap.get('pay_mode', getattr(d, 'pay_mode', 'monthly')) or 'monthly')
-                if mode == 'monthly':
-                    salary_month += float(snap.get('salary', 0.0) or 0.0)
-            total_stamps += stamps_month
-            total_salary += salary_month
-
-        # Αμοιβές ανά δρομολόγιο: έρχονται από τα trips
-        total_per_trip_pay = sum(float(getattr(t, 'driver_pay', 0.0) or 0.0) for t in trips)
+                _d = self.model.driver_by_id(int(did))  # O(1) από το index του model
+                if _d is not None and getattr(_d, 'active', True):
+                    selected_driver = _d
+
+        drivers_iter = [selected_driver] if selected_driver is not None else ([] if tid is not None else self.model.active_drivers())
+
+        # ανά οδηγό: ένα άθροισμα ανά εγγραφή ιστορικού (όχι μήνες × οδηγοί κλήσεις)
+        yms = [f"{yy:04d}-{mm:02d}" for yy, mm in _iter_months(range_start, range_end)]
+        for d in drivers_iter:
+            stamps, salary = driver_pay_totals(d, yms)
+            total_stamps += stamps
+            total_salary += salary
+
+        # Αμοιβές ανά δρομολόγιο: έρχονται από τα trips (total_per_trip_pay, από το summary_totals)
 
         total_cost = total_cost_fuel + total_commission + total_tolls + total_wear + total_fixed + total_other_expenses + total_stamps + total_salary + total_per_trip_pay
         net = total_rev - total_cost
@@ -4146,31 +5057,30 @@ class TrucksSummaryPage(QWidget):
             period_txt = f" — Περίοδος: {p1} έως {p2}"
         self.lbl_head.setText(f"<b>Φορτηγό:</b> {name}{period_txt}")
 
-        # --- Όμορφη εμφάνιση κάτω: grouped KPI list ---
-        self._clear_totals()
-        r = 0
-        r = self._add_section(r, "Κίνηση")
-        r = self._add_kv(r, "Δρομολόγια", f"{len(trips)}")
-        r = self._add_kv(r, "Σύνολο χλμ", f"{total_km}")
-        r = self._add_kv(r, "Σύνολο λίτρων", f"{total_liters:.2f}")
-
-        r = self._add_section(r, "Έσοδα")
-        r = self._add_kv(r, "Σύνολο εσόδων", fmt_eur(total_rev), bold_value=True)
-
-        r = self._add_section(r, "Κόστη")
-        r = self._add_kv(r, "Καύσιμα/Έξοδα", fmt_eur(total_cost_fuel))
-        r = self._add_kv(r, "Λοιπά έξοδα (5%)", fmt_eur(total_other_expenses))
-        r = self._add_kv(r, "Προμήθειες", fmt_eur(total_commission))
-        r = self._add_kv(r, "Διόδια", fmt_eur(total_tolls))
-        r = self._add_kv(r, "Φθορές (€/χλμ)", fmt_eur(total_wear))
-        r = self._add_kv(r, "Πάγια μηνιαία", fmt_eur(total_fixed))
-        r = self._add_kv(r, "Ένσημα οδηγών", fmt_eur(total_stamps))
-        r = self._add_kv(r, "Μισθοί οδηγών (μηνιαίοι)", fmt_eur(total_salary))
-        r = self._add_kv(r, "Αμοιβές οδηγών (ανά δρομολόγιο)", fmt_eur(total_per_trip_pay))
-        r = self._add_kv(r, "Σύνολο κόστους", fmt_eur(total_cost), bold_value=True)
-
-        r = self._add_section(r, "Αποτέλεσμα")
-        r = self._add_kv(r, "Καθαρό (έσοδα - κόστος)", fmt_eur(net), bold_value=True)
+        # --- Όμορφη εμφάνιση κάτω: grouped KPI list (σταθερά labels, μόνο setText) ---
+        # ένα repaint για όλο το grid, όχι ένα ανά setText
+        self._totals_wrap.setUpdatesEnabled(False)
+        try:
+            for key, text in (
+                ("trips", f"{len(trips)}"),
+                ("km", f"{total_km}"),
+                ("liters", f"{total_liters:.2f}"),
+                ("revenue", fmt_eur(total_rev)),
+                ("fuel", fmt_eur(total_cost_fuel)),
+                ("other", fmt_eur(total_other_expenses)),
+                ("commission", fmt_eur(total_commission)),
+                ("tolls", fmt_eur(total_tolls)),
+                ("wear", fmt_eur(total_wear)),
+                ("fixed", fmt_eur(total_fixed)),
+                ("stamps", fmt_eur(total_stamps)),
+                ("salary", fmt_eur(total_salary)),
+                ("per_trip_pay", fmt_eur(total_per_trip_pay)),
+                ("cost", fmt_eur(total_cost)),
+                ("net", fmt_eur(net)),
+            ):
+                self._kpi[key].setText(text)
+        finally:
+            self._totals_wrap.setUpdatesEnabled(True)
 
 class TruckWindow(QMainWindow):
     def __init__(self, controller: AppController):
@@ -4208,17 +5118,10 @@ class TruckWindow(QMainWindow):
         self.stack = QStackedWidget()
         main.addWidget(self.stack, 1)
 
+        # το Μητρώο (αρχική σελίδα) αμέσως· οι υπόλοιπες φτιάχνονται στο πρώτο άνοιγμα (βλ. _page)
+        self._pages: Dict[str, QWidget] = {}
         self.page_registry = TruckRegistryPage(self.model, on_changed=self._on_data_changed)
-        self.page_trips = TripsPage(self.model, on_changed=self._on_data_changed)
-        self.page_fuel = FuelPage(self.model, on_changed=self._on_data_changed)
-        self.page_summary = TrucksSummaryPage(self.model)
-        self.page_drivers = DriversPage(self.model, on_changed=self._on_data_changed)
-
         self.stack.addWidget(self.page_registry)
-        self.stack.addWidget(self.page_trips)
-        self.stack.addWidget(self.page_fuel)
-        self.stack.addWidget(self.page_summary)
-        self.stack.addWidget(self.page_drivers)
 
         # top nav under section bar
         self.nav_container = QWidget()
@@ -4239,41 +5142,60 @@ class TruckWindow(QMainWindow):
 
 
         self.model.attach_autosave_timer(self, self.save_now)
+        write_notifier().failed.connect(self._on_write_failed)
+        self._data_changed_debounce = make_debouncer(self, 0, self._refresh_after_change)
         self.go_registry()
 
+    def _page(self, name: str) -> QWidget:
+        """Σελίδα trips/fuel/summary/drivers: δημιουργία + addWidget στο stack την πρώτη φορά."""
+        page = self._pages.get(name)
+        if page is None:
+            if name == "trips":
+                page = TripsPage(self.model, on_changed=self._on_data_changed)
+            elif name == "fuel":
+                page = FuelPage(self.model, on_changed=self._on_data_changed)
+            elif name == "summary":
+                page = TrucksSummaryPage(self.model)
+            else:
+                page = DriversPage(self.model, on_changed=self._on_data_changed)
+            self._pages[name] = page
+            self.stack.addWidget(page)
+        return page
+
+    page_trips = property(lambda self: self._page("trips"))
+    page_fuel = property(lambda self: self._page("fuel"))
+    page_summary = property(lambda self: self._page("summary"))
+    page_drivers = property(lambda self: self._page("drivers"))
+
     def _on_data_changed(self):
-        # Μετά από αλλαγές, ανανεώνουμε και τη σύνοψη.
-        self.page_summary.refresh()
+        # πολλές αλλαγές στο ίδιο event loop tick -> ένα refresh
+        self._data_changed_debounce.start()
 
-        # Και ανανεώνουμε τα φίλτρα περιόδου στις λίστες
-        self.page_trips.refresh()
-        self.page_fuel.refresh()
+    def _refresh_after_change(self):
+        # Μόνο η ορατή σελίδα· οι υπόλοιπες κάνουν refresh όταν ανοίξουν (go_*).
+        # Μητρώο/Οδηγοί ανανεώνονται ήδη μόνες τους μετά από δική τους αλλαγή.
+        # (μέσω _pages, όχι των properties: να μη φτιαχτούν σελίδες που δεν έχουν ανοίξει)
+        page = self.stack.currentWidget()
+        if page is not None and any(page is self._pages.get(n) for n in ("summary", "trips", "fuel")):
+            page.refresh()
 
     def on_period_changed(self, year: int, month: int):
         """Εφαρμόζει φίλτρο περιόδου σε Δρομολόγια/Έξοδα/Σύνοψη."""
         self._period_year, self._period_month = year, month
-        self.page_trips.set_period(year, month)
-        self.page_fuel.set_period(year, month)
-        self.page_summary.set_period(year, month)
-        # Προαιρετικά: προεπιλογή ημερομηνίας εισαγωγής μέσα στον μήνα
-        self.page_trips.suggest_date_for_period(year, month)
-        self.page_fuel.suggest_date_for_period(year, month)
+        for name in ("trips", "fuel", "summary"):
+            page = self._pages.get(name)  # μόνο όσες υπάρχουν ήδη· οι άλλες έχουν δική τους μπάρα περιόδου
+            if page is None:
+                continue
+            page.set_period(year, month)
+            # Προαιρετικά: προεπιλογή ημερομηνίας εισαγωγής μέσα στον μήνα
+            if name != "summary":
+                page.suggest_date_for_period(year, month)
 
 
     def _set_nav(self, current: str):
-        # αντικατάσταση nav για να ενημερωθούν enabled states
-        layout = self.nav_container.layout()
-        old = self.nav
-        self.nav = make_trucks_nav(
-            on_go_registry=self.go_registry,
-            on_go_trips=self.go_trips,
-            on_go_fuel=self.go_fuel,
-            on_go_summary=self.go_summary,
-            on_go_drivers=self.go_drivers,
-            current=current
-        )
-        layout.replaceWidget(old, self.nav)
-        old.setParent(None)
+        # ίδιο nav, μόνο enabled states (όπως το StationWindow) — όχι νέα widgets ανά αλλαγή σελίδας
+        for name, btn in self.nav.nav_buttons.items():
+            btn.setEnabled(name != current)
 
     def go_registry(self):
         self._set_nav("registry")
@@ -4299,7 +5221,7 @@ class TruckWindow(QMainWindow):
                     self.page_summary._on_period_changed(y, m)
         except Exception:
             pass
-        self.page_summary.refresh()
+        self.page_summary.refresh_if_stale()  # ίδια δεδομένα/περίοδος -> μένουν τα σύνολα που φαίνονται
         self.stack.setCurrentWidget(self.page_summary)
 
     def go_drivers(self):
@@ -4311,19 +5233,23 @@ class TruckWindow(QMainWindow):
         self.stack.setCurrentWidget(self.page_drivers)
 
     def save_now(self):
-        ok = self.model.save()
+        # το γράψιμο γίνεται εκτός GUI thread, αποτυχία έρχεται από _on_write_failed
+        ok = self.model.save(background=True)
         if not ok:
             QMessageBox.warning(self, "Σφάλμα", "Αποτυχία αποθήκευσης δεδομένων Φορτηγών.")
 
+    def _on_write_failed(self, path: str):
+        if path == self.model.path and self.isVisible():
+            QMessageBox.warning(self, "Σφάλμα", "Αποτυχία αποθήκευσης δεδομένων Φορτηγών.")
+
 
 
 # -----------------------------
 # Theme
 # -----------------------------
 
-def apply_white_theme(app: QApplication) -> None:
-    app.setStyle("Fusion")
-    app.setStyleSheet("""
+# module-level σταθερά: ένα string, όχι literal μέσα στη συνάρτηση
+WHITE_THEME_QSS = """
         QWidget {
             background: #eef2f7;
             color: #162033;
@@ -4505,6 +5431,16 @@ def apply_white_theme(app: QApplication) -> None:
             background: transparent;
         }
 
+        /* σύνολα σύνοψης: κοινός κανόνας αντί για setStyleSheet ανά label */
+        QLabel[role="kv-section"] {
+            font-weight: 700;
+            margin-top: 8px;
+        }
+
+        QLabel[role="kv-bold"] {
+            font-weight: 700;
+        }
+
         QLabel[role="summary-body"] {
             color: #1f3557;
             background: transparent;
@@ -4541,7 +5477,7 @@ def apply_white_theme(app: QApplication) -> None:
             border-color: #bed0ea;
         }
 
-        QTableWidget {
+        QTableView {
             background: #ffffff;
             border: 1px solid #d9e3f1;
             border-radius: 12px;
@@ -4551,11 +5487,11 @@ def apply_white_theme(app: QApplication) -> None:
             selection-color: #0f2746;
         }
 
-        QTableWidget::item {
+        QTableView::item {
             padding: 4px;
         }
 
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background: #cfe1ff;
             color: #0f2746;
         }
@@ -4633,7 +5569,12 @@ def apply_white_theme(app: QApplication) -> None:
             background: #f3f7fd;
             border-radius: 14px;
         }
-    """)
+"""
+
+
+def apply_white_theme(app: QApplication) -> None:
+    app.setStyle("Fusion")
+    app.setStyleSheet(WHITE_THEME_QSS)
 
 
 # -----------------------------
@@ -4650,7 +5591,9 @@ def main():
     controller = AppController()
     controller.start()
 
-    sys.exit(app.exec())
+    rc = app.exec()
+    flush_pending_writes()
+    sys.exit(rc)
 
 
 if __name__ == "__main__":